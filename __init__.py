@@ -38,6 +38,7 @@ if libfive_python_dir not in sys.path:
 # Path to the actual compiled libraries (assuming a specific structure)
 # Adjust this path if your bundled library structure is different
 libfive_base_dir = os.path.join(addon_dir, 'libfive', 'src')
+_LIB_EXT = {'win32': 'dll', 'darwin': 'dylib'}.get(sys.platform, 'so')
 
 # Set environment variable *before* ffi import (if needed by your ffi.py)
 # This tells ffi.py where to look for the compiled libs (.so, .dll, .dylib)
@@ -64,8 +65,8 @@ try:
 
 except ImportError as e:
     # Provide guidance based on expected structure
-    core_lib_path = os.path.join(libfive_base_dir, "src", f"libfive.{'dll' if sys.platform == 'win32' else 'dylib' if sys.platform == 'darwin' else 'so'}")
-    stdlib_lib_path = os.path.join(libfive_base_dir, "stdlib", f"libfive-stdlib.{'dll' if sys.platform == 'win32' else 'dylib' if sys.platform == 'darwin' else 'so'}")
+    core_lib_path = os.path.join(libfive_base_dir, "src", f"libfive.{_LIB_EXT}")
+    stdlib_lib_path = os.path.join(libfive_base_dir, "stdlib", f"libfive-stdlib.{_LIB_EXT}")
     current_env_var = os.environ.get('LIBFIVE_FRAMEWORK_DIR', '<Not Set>')
     print("FieldForge: Addon requires libfive. Dynamic functionality disabled.")
 except Exception as e:
@@ -170,7 +171,7 @@ def register():
         if handlers.ff_undo_post_handler not in bpy.app.handlers.undo_post:
             bpy.app.handlers.undo_post.append(handlers.ff_undo_post_handler)
 
-        # Draw Handler (store handle within drawing module)
+        # Draw Handler (store handle within drawing module); the shader and gpu modules load on first draw
         if drawing._draw_handle is None:
             drawing._draw_handle = bpy.types.SpaceView3D.draw_handler_add(
                 drawing.ff_draw_callback, (), 'WINDOW', 'POST_VIEW'
@@ -239,6 +240,7 @@ def unregister():
             except ValueError: pass # Already removed
             except Exception as e_draw: print(f"  WARN: Error removing draw handler: {e_draw}")
             drawing._draw_handle = None # Clear handle in module
+        drawing.release_line_shader()
 
         # Stop Modal Operator (Best effort: rely on its cancel/timer checks)
         # Setting the global flag helps it stop cleanly on next tick/timer
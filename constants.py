@@ -160,4 +160,20 @@ DEFAULT_SOURCE_SETTINGS = {
     "sdf_text_string": "Text",
     SDF_LINK_TARGET_NAME_PROP: "",
     SDF_PROCESS_LINKED_CHILDREN_PROP: False,
-}
\ No newline at end of file
+}
+# --- Default Settings Validation ---
+# Checked once at import so the Add operators can apply the dicts with a single bulk
+# ID-property update instead of guarding every key with try/except.
+_ID_PROPERTY_TYPES = (bool, int, float, str)
+
+def _validate_default_settings(*settings_dicts):
+    for settings in settings_dicts:
+        for key, value in settings.items():
+            if isinstance(value, (tuple, list)):
+                if value and all(isinstance(v, _ID_PROPERTY_TYPES) for v in value):
+                    continue
+            elif isinstance(value, _ID_PROPERTY_TYPES):
+                continue
+            raise TypeError(f"FieldForge: default setting '{key}' has unsupported ID property value {value!r}")
+
+_validate_default_settings(DEFAULT_SETTINGS, DEFAULT_CANVAS_SETTINGS, DEFAULT_GROUP_SETTINGS, DEFAULT_SOURCE_SETTINGS)
@@ -15,6 +15,7 @@ import bmesh
 from bpy.app.handlers import persistent
 from .. import utils
 from .. import constants
+from .. import drawing
 from ..ui import operators
 
 # Global dictionary to store mesh data before saving
@@ -63,6 +64,9 @@ def ff_load_post_handler(dummy):
     Forces reset of the running flag and attempts to start the handler.
     """
 
+    drawing.clear_batch_cache()
+    utils.invalidate_sdf_hierarchy_cache() # Object names now refer to the loaded file
+    utils.clear_parent_bounds_cache()
     operators._selection_handler_running = False
     try:
         operators.start_select_handler_via_timer()
@@ -79,4 +83,7 @@ def ff_undo_pre_handler(dummy):
 @persistent
 def ff_undo_post_handler(dummy):
     from ..core import update_manager
+    drawing.mark_outlines_dirty() # Undo restores objects without a draw-side notification
+    utils.invalidate_sdf_hierarchy_cache() # Same for the hierarchy/overlay name caches and polls
+    utils.clear_parent_bounds_cache()
     bpy.app.timers.register(update_manager.initial_update_check_all, first_interval=0.05)
\ No newline at end of file
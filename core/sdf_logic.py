@@ -54,6 +54,38 @@ from mathutils import Vector, Matrix
 from .. import constants
 from .. import utils
 
+# One shared empty shape. libfive returns a new object per emptiness() call, so `is` checks
+# only detect empty subtrees (and skip the no-op nodes they would add) against this instance.
+_EMPTY = lf.emptiness() if _lf_imported_ok else None
+
+
+# --- Shape Caches ---
+# libfive trees are immutable, so a shape built once can be reused by every update that asks
+# for the same inputs. Keys hold plain values only; both caches are dropped wholesale when full.
+
+# Custom properties that parameterize each unit shape (all other types are fixed)
+_UNIT_SHAPE_PARAMS = {
+    "torus": ("sdf_torus_major_radius", "sdf_torus_minor_radius"),
+    "rounded_box": ("sdf_round_radius",),
+    "ring": ("sdf_inner_radius",),
+    "polygon": ("sdf_sides",),
+    "text": ("sdf_text_string",),
+}
+_SHAPE_CACHE_LIMIT = 4096
+# (sdf_type, *params) -> unit lf.Shape
+_unit_shape_cache = {}
+# Source name -> ((unit key, extrusion depth, shell offset, world matrix rows), lf.Shape in world space);
+# one entry per source, replaced whenever its key changes (e.g. every step of a drag)
+_source_world_cache = {}
+
+def clear_shape_caches():
+    _unit_shape_cache.clear()
+    _source_world_cache.clear()
+
+def _unit_shape_key(obj: bpy.types.Object, props: dict | None = None) -> tuple:
+    if props is None: props = utils.get_sdf_params(obj)
+    sdf_type = props.get("sdf_type", "")
+    return (sdf_type, *(props.get(k, constants.DEFAULT_SOURCE_SETTINGS.get(k)) for k in _UNIT_SHAPE_PARAMS.get(sdf_type, ())))
 
 def reconstruct_shape(obj: bpy.types.Object) -> lf.Shape | None:
     """
@@ -61,140 +93,180 @@ def reconstruct_shape(obj: bpy.types.Object) -> lf.Shape | None:
     Scaling and transformation are handled separately via the object's matrix.
     Extrusion for 2D shapes is handled later in process_sdf_hierarchy.
 
-    Returns a libfive Shape or lf.emptiness() on error/unknown type.
+    Returns a libfive Shape or the shared empty shape on error/unknown type.
+    Shapes are cached by type and parameters, so repeated calls share one tree.
     """
     if not _lf_imported_ok or not obj:
-        return lf.emptiness() if _lf_imported_ok else None
+        return _EMPTY
+
+    key = _unit_shape_key(obj)
+    shape = _unit_shape_cache.get(key)
+    if shape is None:
+        shape = _build_unit_shape(obj)
+        if len(_unit_shape_cache) >= _SHAPE_CACHE_LIMIT: _unit_shape_cache.clear()
+        _unit_shape_cache[key] = shape
+    return shape
 
+# Unit shape dimensions; scaling and placement come from the object's matrix
+_UNIT_RADIUS = 0.5 # Standard radius for shapes like cylinder/cone base/sphere/circle
+_UNIT_HEIGHT = 1.0 # Standard height for shapes like cylinder/cone
+_HALF_SIZE = 0.5 # Half-dimension for unit cube/box related calculations
+
+def _make_cube(obj):
+    return lf.cube_centered((2 * _HALF_SIZE, 2 * _HALF_SIZE, 2 * _HALF_SIZE))
+
+def _make_sphere(obj):
+    return lf.sphere(_UNIT_RADIUS)
+
+def _make_cylinder(obj):
+    return lf.cylinder_z(_UNIT_RADIUS, _UNIT_HEIGHT, base=(0, 0, -_HALF_SIZE))
+
+def _make_cone(obj):
+    if _UNIT_HEIGHT <= 1e-6:
+        print(f"FieldForge WARN (reconstruct_shape): Cone height near zero for {obj.name}. Returning empty shape.")
+        return _EMPTY
+
+    # Denominator for scaling factor
+    sqrt_term = math.sqrt(_UNIT_RADIUS**2 + _UNIT_HEIGHT**2)
+    if sqrt_term <= 1e-6: # Avoid division by zero if unit_radius and unit_height are both zero
+        print(f"FieldForge WARN (reconstruct_shape): Cone radius and height near zero for {obj.name}. Returning empty shape.")
+        return _EMPTY
+
+    cone_param_radius = (_UNIT_RADIUS**2) / sqrt_term
+    cone_param_height = (_UNIT_HEIGHT * _UNIT_RADIUS) / sqrt_term
+    return lf.cone_z(cone_param_radius, cone_param_height, base=(0, 0, 0.0))
+
+def _make_pyramid(obj):
+    # Base spans -0.5..0.5 in X/Y at z=0, apex at z=1
+    return lf.pyramid_z((-0.5, -0.5), (0.5, 0.5), 0, 1.0)
+
+def _make_torus(obj):
+    default_major = constants.DEFAULT_SOURCE_SETTINGS["sdf_torus_major_radius"]
+    default_minor = constants.DEFAULT_SOURCE_SETTINGS["sdf_torus_minor_radius"]
+    major_r_prop = utils.get_sdf_param(obj, "sdf_torus_major_radius", default_major)
+    minor_r_prop = utils.get_sdf_param(obj, "sdf_torus_minor_radius", default_minor)
+    major_r = max(0.01, float(major_r_prop)); minor_r = max(0.005, float(minor_r_prop))
+    minor_r = min(minor_r, major_r - 1e-5)
+    return lf.torus_z(major_r, minor_r, center=(0,0,0))
+
+def _make_rounded_box(obj):
+    roundness_prop = utils.get_sdf_param(obj, "sdf_round_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_round_radius"])
+    effective_prop_value = min(max(roundness_prop, 0.0), 0.5)
+    internal_sdf_radius = effective_prop_value * (_HALF_SIZE / 0.5)
+    if internal_sdf_radius <= 1e-5:
+        return lf.cube_centered((2 * _HALF_SIZE, 2 * _HALF_SIZE, 2 * _HALF_SIZE))
+    corner_a = (-_HALF_SIZE, -_HALF_SIZE, -_HALF_SIZE)
+    corner_b = ( _HALF_SIZE,  _HALF_SIZE,  _HALF_SIZE)
+    safe_sdf_radius = min(internal_sdf_radius, _HALF_SIZE - 1e-5)
+    return lf.rounded_box(corner_a, corner_b, safe_sdf_radius)
+
+def _make_circle(obj):
+    return lf.circle(_UNIT_RADIUS, center=(0, 0))
+
+def _make_ring(obj):
+    inner_r_prop = utils.get_sdf_param(obj, "sdf_inner_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_inner_radius"])
+    # Ensure inner radius is relative to the unit_radius (0.5)
+    safe_inner_r = max(0.0, min(float(inner_r_prop), _UNIT_RADIUS - 1e-5))
+    return lf.ring(_UNIT_RADIUS, safe_inner_r, center=(0, 0))
+
+def _make_polygon(obj):
+    sides = utils.get_sdf_param(obj, "sdf_sides", constants.DEFAULT_SOURCE_SETTINGS["sdf_sides"])
+    return lf.polygon(_UNIT_RADIUS, max(3, int(sides)), center=(0, 0))
+
+def _make_text(obj):
+    text_string = utils.get_sdf_param(obj, "sdf_text_string", constants.DEFAULT_SOURCE_SETTINGS["sdf_text_string"])
+    if not text_string.strip(): # If string is empty or only whitespace
+        print(f"FieldForge WARN (reconstruct_shape): Empty text string for {obj.name}. Returning empty shape.")
+        return _EMPTY
+
+    num_chars = len(text_string)
+    # A very rough estimated width, assuming char height is 1 and aspect is ~0.7
+    estimated_width = num_chars * 0.7 
+    start_pos_x = -estimated_width / 2.0 
+    # Y position: libfive text seems to draw along baseline, so to center vertically around y=0:
+    start_pos_y = -0.5 # Assuming char height of 1, baseline starts slightly down
+    return lf.text(text_string, (start_pos_x, start_pos_y))
+
+def _make_half_space(obj):
+    return lf.half_space((0.0, 0.0, 1.0), (0.0, 0.0, 0.0))
+
+# sdf_type -> unit shape factory(obj)
+_SHAPE_FACTORIES = {
+    "cube": _make_cube,
+    "sphere": _make_sphere,
+    "cylinder": _make_cylinder,
+    "cone": _make_cone,
+    "pyramid": _make_pyramid,
+    "torus": _make_torus,
+    "rounded_box": _make_rounded_box,
+    "circle": _make_circle,
+    "ring": _make_ring,
+    "polygon": _make_polygon,
+    "text": _make_text,
+    "half_space": _make_half_space,
+}
+
+def _build_unit_shape(obj: bpy.types.Object) -> lf.Shape | None:
     sdf_type = utils.get_sdf_param(obj, "sdf_type", "")
-    shape = None
-    unit_radius = 0.5 # Standard radius for shapes like cylinder/cone base/sphere/circle
-    unit_height = 1.0 # Standard height for shapes like cylinder/cone
-    half_size = 0.5 # Half-dimension for unit cube/box related calculations
-
-    unit_pyramid_base_half_x = 0.5
-    unit_pyramid_base_half_y = 0.5
-    unit_pyramid_height = 1.0
-    unit_pyramid_zmin = 0
-
+    factory = _SHAPE_FACTORIES.get(sdf_type)
+    if factory is None:
+        print(f"FieldForge WARN (reconstruct_shape): Unknown sdf_type '{sdf_type}' for {obj.name}")
+        return _EMPTY
     try:
-        if sdf_type == "cube":
-            shape = lf.cube_centered((2 * half_size, 2 * half_size, 2 * half_size))
-        elif sdf_type == "sphere":
-            shape = lf.sphere(unit_radius)
-        elif sdf_type == "cylinder":
-            shape = lf.cylinder_z(unit_radius, unit_height, base=(0, 0, -half_size))
-        elif sdf_type == "cone":
-            if unit_height <= 1e-6:
-                print(f"FieldForge WARN (reconstruct_shape): Cone height near zero for {obj.name}. Returning empty shape.")
-                return lf.emptiness()
-
-            # Denominator for scaling factor
-            sqrt_term = math.sqrt(unit_radius**2 + unit_height**2)
-            if sqrt_term <= 1e-6: # Avoid division by zero if unit_radius and unit_height are both zero
-                print(f"FieldForge WARN (reconstruct_shape): Cone radius and height near zero for {obj.name}. Returning empty shape.")
-                return lf.emptiness()
-
-            cone_param_radius = (unit_radius**2) / sqrt_term
-            cone_param_height = (unit_height * unit_radius) / sqrt_term
-
-            shape = lf.cone_z(cone_param_radius, cone_param_height, base=(0, 0, 0.0))
-        elif sdf_type == "pyramid":
-            base_corner_a = (-unit_pyramid_base_half_x, -unit_pyramid_base_half_y)
-            base_corner_b = ( unit_pyramid_base_half_x,  unit_pyramid_base_half_y)
-            shape = lf.pyramid_z(
-                base_corner_a,
-                base_corner_b,
-                unit_pyramid_zmin,
-                unit_pyramid_height
-            )
-        elif sdf_type == "torus":
-            default_major = constants.DEFAULT_SOURCE_SETTINGS["sdf_torus_major_radius"]
-            default_minor = constants.DEFAULT_SOURCE_SETTINGS["sdf_torus_minor_radius"]
-            major_r_prop = utils.get_sdf_param(obj, "sdf_torus_major_radius", default_major)
-            minor_r_prop = utils.get_sdf_param(obj, "sdf_torus_minor_radius", default_minor)
-            major_r = max(0.01, float(major_r_prop)); minor_r = max(0.005, float(minor_r_prop))
-            minor_r = min(minor_r, major_r - 1e-5)
-            shape = lf.torus_z(major_r, minor_r, center=(0,0,0))
-
-        elif sdf_type == "rounded_box":
-            roundness_prop = utils.get_sdf_param(obj, "sdf_round_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_round_radius"])
-            internal_sdf_radius = min(roundness_prop, 0.5) * half_size / 0.5
-            internal_sdf_radius = min(max(roundness_prop, 0.0), 1.0) * half_size
-            effective_prop_value = min(max(roundness_prop, 0.0), 0.5)
-            internal_sdf_radius = effective_prop_value * (half_size / 0.5)
-            corner_a = (-half_size, -half_size, -half_size)
-            corner_b = ( half_size,  half_size,  half_size)
-            if internal_sdf_radius <= 1e-5:
-                shape = lf.cube_centered((2 * half_size, 2 * half_size, 2 * half_size))
-            else:
-                safe_sdf_radius = min(internal_sdf_radius, half_size - 1e-5)
-                shape = lf.rounded_box(corner_a, corner_b, safe_sdf_radius)
-        elif sdf_type == "circle":
-            shape = lf.circle(unit_radius, center=(0, 0))
-        elif sdf_type == "ring":
-            inner_r_prop = utils.get_sdf_param(obj, "sdf_inner_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_inner_radius"])
-            # Ensure inner radius is relative to the unit_radius (0.5)
-            safe_inner_r = max(0.0, min(float(inner_r_prop), unit_radius - 1e-5))
-            shape = lf.ring(unit_radius, safe_inner_r, center=(0, 0))
-        elif sdf_type == "polygon":
-            sides = utils.get_sdf_param(obj, "sdf_sides", constants.DEFAULT_SOURCE_SETTINGS["sdf_sides"])
-            safe_n = max(3, int(sides))
-            shape = lf.polygon(unit_radius, safe_n, center=(0, 0))
-        elif sdf_type == "text": # NEW SHAPE
-            text_string = utils.get_sdf_param(obj, "sdf_text_string", constants.DEFAULT_SOURCE_SETTINGS["sdf_text_string"])
-            if not text_string.strip(): # If string is empty or only whitespace
-                print(f"FieldForge WARN (reconstruct_shape): Empty text string for {obj.name}. Returning empty shape.")
-                return lf.emptiness()
-
-            num_chars = len(text_string)
-            # A very rough estimated width, assuming char height is 1 and aspect is ~0.7
-            estimated_width = num_chars * 0.7 
-            start_pos_x = -estimated_width / 2.0 
-            # Y position: libfive text seems to draw along baseline, so to center vertically around y=0:
-            start_pos_y = -0.5 # Assuming char height of 1, baseline starts slightly down
-            
-            shape = lf.text(text_string, (start_pos_x, start_pos_y))
-        elif sdf_type == "half_space":
-            shape = lf.half_space((0.0, 0.0, 1.0), (0.0, 0.0, 0.0))
-        else:
-            print(f"FieldForge WARN (reconstruct_shape): Unknown sdf_type '{sdf_type}' for {obj.name}")
-            return lf.emptiness()
-
+        return factory(obj)
     except Exception as e:
         print(f"FieldForge ERROR (reconstruct_shape): Error creating unit shape for {obj.name} ({sdf_type}): {e}")
-        return lf.emptiness()
+        return _EMPTY
 
-    return shape
 
+_IDENTITY_MATRIX = Matrix.Identity(4)
+_lf_xyz_handles = None
+
+def _lf_xyz() -> tuple:
+    """ The symbolic X, Y, Z coordinate shapes, created once and shared by every remap. """
+    global _lf_xyz_handles
+    if _lf_xyz_handles is None:
+        _lf_xyz_handles = (libfive_shape_module.Shape.X(), libfive_shape_module.Shape.Y(), libfive_shape_module.Shape.Z())
+    return _lf_xyz_handles
 
 def apply_blender_transform_to_sdf(shape: lf.Shape, obj_matrix_world_inv: Matrix) -> lf.Shape | None:
     """
     Applies Blender object's inverted world transform to a libfive shape using remap.
-    Returns lf.emptiness() on error.
+    Returns the shared empty shape on error.
     """
     if not _lf_imported_ok: return None
-    if shape is None or shape is lf.emptiness():
-        return lf.emptiness()
+    if shape is None or shape is _EMPTY:
+        return _EMPTY
     if obj_matrix_world_inv is None:
         print(f"FieldForge WARN (apply_transform): Received None matrix_world_inv.")
-        return lf.emptiness()
+        return _EMPTY
 
-    X, Y, Z = libfive_shape_module.Shape.X(), libfive_shape_module.Shape.Y(), libfive_shape_module.Shape.Z()
-    mat_inv = obj_matrix_world_inv
+    if obj_matrix_world_inv == _IDENTITY_MATRIX: # remap(X, Y, Z) would only add nodes
+        return shape
+
+    X, Y, Z = _lf_xyz()
     try:
-        x_p = mat_inv[0][0] * X + mat_inv[0][1] * Y + mat_inv[0][2] * Z + mat_inv[0][3]
-        y_p = mat_inv[1][0] * X + mat_inv[1][1] * Y + mat_inv[1][2] * Z + mat_inv[1][3]
-        z_p = mat_inv[2][0] * X + mat_inv[2][1] * Y + mat_inv[2][2] * Z + mat_inv[2][3]
+        # Rows as plain floats: one Matrix access per row instead of one per coefficient
+        (a0, a1, a2, a3), (b0, b1, b2, b3), (c0, c1, c2, c3) = (tuple(row) for row in obj_matrix_world_inv[:3])
+        x_p = a0 * X + a1 * Y + a2 * Z + a3
+        y_p = b0 * X + b1 * Y + b2 * Z + b3
+        z_p = c0 * X + c1 * Y + c2 * Z + c3
         return shape.remap(x_p, y_p, z_p)
-    except Exception: return lf.emptiness()
+    except Exception: return _EMPTY
+
+def _remap_into_canvas_xy(shape: lf.Shape, rel_matrix_inv: Matrix) -> lf.Shape:
+    """ Places a 2D child's unit shape in its canvas' local XY plane; Z is left untouched. """
+    if rel_matrix_inv == _IDENTITY_MATRIX: return shape
+    X, Y, Z = _lf_xyz()
+    (a0, a1, _, a3), (b0, b1, _, b3) = (tuple(row) for row in rel_matrix_inv[:2])
+    return shape.remap(a0*X + a1*Y + a3, b0*X + b1*Y + b3, Z)
 
 def combine_shapes(shape_a: lf.Shape, shape_b: lf.Shape, blend_factor: float) -> lf.Shape | None:
     if not _lf_imported_ok: return None
-    is_a_empty = shape_a is None or shape_a is lf.emptiness()
-    is_b_empty = shape_b is None or shape_b is lf.emptiness()
+    is_a_empty = shape_a is None or shape_a is _EMPTY
+    is_b_empty = shape_b is None or shape_b is _EMPTY
 
-    if is_a_empty and is_b_empty: return lf.emptiness()
+    if is_a_empty and is_b_empty: return _EMPTY
     if is_a_empty: return shape_b
     if is_b_empty: return shape_a
 
@@ -207,12 +279,12 @@ def combine_shapes(shape_a: lf.Shape, shape_b: lf.Shape, blend_factor: float) ->
             return lf.union(shape_a, shape_b)
     except Exception as e:
         print(f"FieldForge ERROR (combine_shapes): Error combining shapes: {e}")
-        return lf.emptiness()
+        return _EMPTY
 
 def custom_blended_intersection(shape_a: lf.Shape, shape_b: lf.Shape, blend_factor_m: float, lf_module) -> lf.Shape | None:
-    if (shape_a is None or shape_a is lf_module.emptiness()) or \
-       (shape_b is None or shape_b is lf_module.emptiness()):
-       return lf_module.emptiness()
+    if (shape_a is None or shape_a is _EMPTY) or \
+       (shape_b is None or shape_b is _EMPTY):
+       return _EMPTY
     try:
         inv_a = lf_module.inverse(shape_a)
         inv_b = lf_module.inverse(shape_b)
@@ -221,23 +293,23 @@ def custom_blended_intersection(shape_a: lf.Shape, shape_b: lf.Shape, blend_fact
     except Exception as e:
         print(f"FieldForge ERROR (custom_blended_intersection): {e}. Falling back.")
         try: return lf_module.intersection(shape_a, shape_b)
-        except: return lf_module.emptiness()
+        except: return _EMPTY
 
 def blended_symmetric_x(shape_in: lf.Shape, blend_factor: float) -> lf.Shape | None:
     """
     Makes a shape reflection and then blends it with original based on blend factor.
     """
-    if not _lf_imported_ok or shape_in is None or shape_in is lf.emptiness(): return shape_in
+    if not _lf_imported_ok or shape_in is None or shape_in is _EMPTY: return shape_in
     try: return lf.blend_expt_unit(shape_in, lf.reflect_x(shape_in), blend_factor)
     except Exception: return shape_in
 
 def blended_symmetric_y(shape_in: lf.Shape, blend_factor: float) -> lf.Shape | None:
-    if not _lf_imported_ok or shape_in is None or shape_in is lf.emptiness(): return shape_in
+    if not _lf_imported_ok or shape_in is None or shape_in is _EMPTY: return shape_in
     try: return lf.blend_expt_unit(shape_in, lf.reflect_y(shape_in), blend_factor)
     except Exception: return shape_in
 
 def blended_symmetric_z(shape_in: lf.Shape, blend_factor: float) -> lf.Shape | None:
-    if not _lf_imported_ok or shape_in is None or shape_in is lf.emptiness(): return shape_in
+    if not _lf_imported_ok or shape_in is None or shape_in is _EMPTY: return shape_in
     try: return lf.blend_expt_unit(shape_in, lf.reflect_z(shape_in), blend_factor)
     except Exception: return shape_in
 
@@ -248,13 +320,13 @@ def _apply_array_to_shape(
     child_obj_for_logging: bpy.types.Object,
     delta_override: tuple | None = None
     ) -> lf.Shape | None:
-    if not _lf_imported_ok or shape_to_array_world is None or shape_to_array_world is lf.emptiness():
+    if not _lf_imported_ok or shape_to_array_world is None or shape_to_array_world is _EMPTY:
         return shape_to_array_world
 
     array_mode = utils.get_sdf_param(array_controller_obj, "sdf_main_array_mode", 'NONE')
     if array_mode == 'NONE': return shape_to_array_world
 
-    shape_in_controller_local_space = lf.emptiness()
+    shape_in_controller_local_space = _EMPTY
     try:
         mat_l2w_controller = array_controller_obj.matrix_world
         X_r, Y_r, Z_r = libfive_shape_module.Shape.X(), libfive_shape_module.Shape.Y(), libfive_shape_module.Shape.Z()
@@ -264,7 +336,7 @@ def _apply_array_to_shape(
         shape_in_controller_local_space = shape_to_array_world.remap(xp_r, yp_r, zp_r)
     except Exception: return shape_to_array_world 
 
-    if shape_in_controller_local_space is None or shape_in_controller_local_space is lf.emptiness():
+    if shape_in_controller_local_space is None or shape_in_controller_local_space is _EMPTY:
         return shape_to_array_world
 
     arrayed_shape_local = shape_in_controller_local_space 
@@ -314,7 +386,7 @@ def _process_children_recursive(
     context: bpy.types.Context,
     is_processing_as_linked_child_instance: bool 
     ) -> lf.Shape | None:
-    if not _lf_imported_ok: return lf.emptiness() if _lf_imported_ok else None
+    if not _lf_imported_ok: return _EMPTY
 
     children_to_process_list = []
     is_children_owner_canvas = utils.is_sdf_canvas(children_owner_obj)
@@ -331,17 +403,20 @@ def _process_children_recursive(
     parent_array_mode = utils.get_sdf_param(current_logical_parent_obj, "sdf_main_array_mode", 'NONE')
     is_logical_parent_an_arraying_group = utils.is_sdf_group(current_logical_parent_obj) and parent_array_mode != 'NONE'
 
+    # Owner loft eligibility doesn't depend on the child; the cheap 2D type check runs before the link-resolving param read
+    can_owner_be_loft_base = utils.is_valid_2d_loft_source(children_owner_obj) and utils.get_sdf_param(children_owner_obj, "sdf_use_loft", False)
+
     for child_in_list in sorted_children_list:
         child_name = child_in_list.name 
+        child_props = utils.get_sdf_params(child_in_list) # One link resolve and ID-property read per child
 
-        can_owner_be_loft_base = utils.is_sdf_source(children_owner_obj) and utils.get_sdf_param(children_owner_obj, "sdf_use_loft", False) and utils.is_valid_2d_loft_source(children_owner_obj)
-        can_child_be_loft_target = utils.is_sdf_source(child_in_list) and utils.get_sdf_param(child_in_list, "sdf_use_loft", False) and utils.is_valid_2d_loft_source(child_in_list)
+        can_child_be_loft_target = can_owner_be_loft_base and utils.is_valid_2d_loft_source(child_in_list) and child_props.get("sdf_use_loft", False)
 
         if can_owner_be_loft_base and can_child_be_loft_target:
             base_profile_unit = reconstruct_shape(children_owner_obj)
             target_profile_unit = reconstruct_shape(child_in_list)
-            lofted_world = lf.emptiness() if _lf_imported_ok else None
-            if not (base_profile_unit is None or base_profile_unit is lf.emptiness() or target_profile_unit is None or target_profile_unit is lf.emptiness()):
+            lofted_world = _EMPTY
+            if not (base_profile_unit is None or base_profile_unit is _EMPTY or target_profile_unit is None or target_profile_unit is _EMPTY):
                 try:
                     mat_child_rel_to_owner = children_owner_obj.matrix_world.inverted() @ child_in_list.matrix_world
                     loft_height = mat_child_rel_to_owner.translation.z
@@ -352,13 +427,13 @@ def _process_children_recursive(
                         try: scaled_target_profile = lf.scale_xy(target_profile_unit, (profile_scale_factor, profile_scale_factor))
                         except AttributeError: scaled_target_profile = lf.scale(target_profile_unit, (profile_scale_factor, profile_scale_factor, 1.0))
                     lofted_local_to_owner = lf.loft(base_profile_unit, scaled_target_profile, 0, loft_height)
-                    if not (lofted_local_to_owner is None or lofted_local_to_owner is lf.emptiness()):
+                    if not (lofted_local_to_owner is None or lofted_local_to_owner is _EMPTY):
                         lofted_world = apply_blender_transform_to_sdf(lofted_local_to_owner, children_owner_obj.matrix_world.inverted())
                 except Exception: pass 
             
             final_child_contribution_world = lofted_world
-            if not (final_child_contribution_world is None or final_child_contribution_world is lf.emptiness()):
-                child_blend_factor = float(utils.get_sdf_param(child_in_list, "sdf_blend_factor", 0.0))
+            if not (final_child_contribution_world is None or final_child_contribution_world is _EMPTY):
+                child_blend_factor = float(child_props.get("sdf_blend_factor", 0.0))
                 shape_accumulator = combine_shapes(shape_accumulator, final_child_contribution_world, child_blend_factor)
             continue
 
@@ -367,7 +442,7 @@ def _process_children_recursive(
         if is_processing_as_linked_child_instance:
             child_original_full_world_shape = process_sdf_hierarchy(child_in_list, bounds_settings)
 
-            if not (child_original_full_world_shape is None or child_original_full_world_shape is lf.emptiness()):
+            if not (child_original_full_world_shape is None or child_original_full_world_shape is _EMPTY):
 
                 mat_A_world = current_logical_parent_obj.matrix_world
                 mat_B_world = children_owner_obj.matrix_world
@@ -379,11 +454,11 @@ def _process_children_recursive(
                     transform_for_reparenting_inv
                 )
             else:
-                child_subtree_contribution_world = lf.emptiness()
+                child_subtree_contribution_world = _EMPTY
         else: 
             child_subtree_contribution_world = process_sdf_hierarchy(child_in_list, bounds_settings)
 
-        if child_subtree_contribution_world is None or child_subtree_contribution_world is lf.emptiness():
+        if child_subtree_contribution_world is None or child_subtree_contribution_world is _EMPTY:
             continue
 
         final_child_contribution_world = child_subtree_contribution_world
@@ -414,28 +489,28 @@ def _process_children_recursive(
             final_child_contribution_world = _apply_array_to_shape(
                 final_child_contribution_world, current_logical_parent_obj, child_in_list, delta_override)       
 
-            if final_child_contribution_world is None or final_child_contribution_world is lf.emptiness(): continue
+            if final_child_contribution_world is None or final_child_contribution_world is _EMPTY: continue
 
-        use_morph = utils.get_sdf_param(child_in_list, "sdf_use_morph", False)
-        use_clearance = utils.get_sdf_param(child_in_list, "sdf_use_clearance", False) and not use_morph
-        child_csg_op_type = utils.get_sdf_param(child_in_list, "sdf_csg_operation", "UNION")
+        use_morph = child_props.get("sdf_use_morph", False)
+        use_clearance = child_props.get("sdf_use_clearance", False) and not use_morph
+        child_csg_op_type = child_props.get("sdf_csg_operation", "UNION")
         
         # Each child now provides its own blend factor.
-        child_blend_factor = float(utils.get_sdf_param(child_in_list, "sdf_blend_factor", 0.0))
+        child_blend_factor = float(child_props.get("sdf_blend_factor", 0.0))
         if utils.is_sdf_group(child_in_list): # Groups use their own blend for csg
-            child_csg_op_type = utils.get_sdf_param(child_in_list, "sdf_csg_operation", constants.DEFAULT_GROUP_SETTINGS["sdf_csg_operation"])
+            child_csg_op_type = child_props.get("sdf_csg_operation", constants.DEFAULT_GROUP_SETTINGS["sdf_csg_operation"])
         elif utils.is_sdf_canvas(child_in_list): # Canvases use their own blend for csg
-            child_csg_op_type = utils.get_sdf_param(child_in_list, "sdf_csg_operation", constants.DEFAULT_CANVAS_SETTINGS["sdf_csg_operation"])
-            child_blend_factor = float(utils.get_sdf_param(child_in_list, "sdf_blend_factor", constants.DEFAULT_CANVAS_SETTINGS["sdf_blend_factor"]))
+            child_csg_op_type = child_props.get("sdf_csg_operation", constants.DEFAULT_CANVAS_SETTINGS["sdf_csg_operation"])
+            child_blend_factor = float(child_props.get("sdf_blend_factor", constants.DEFAULT_CANVAS_SETTINGS["sdf_blend_factor"]))
             use_morph = False; use_clearance = False
 
         if use_morph:
-            morph_factor = float(utils.get_sdf_param(child_in_list, "sdf_morph_factor", 0.5))
+            morph_factor = float(child_props.get("sdf_morph_factor", 0.5))
             try: shape_accumulator = lf.morph(final_child_contribution_world, shape_accumulator, morph_factor)
             except Exception: pass
         elif use_clearance:
-            offset_val = float(utils.get_sdf_param(child_in_list, "sdf_clearance_offset", 0.05))
-            keep_original = utils.get_sdf_param(child_in_list, "sdf_clearance_keep_original", True)
+            offset_val = float(child_props.get("sdf_clearance_offset", 0.05))
+            keep_original = child_props.get("sdf_clearance_keep_original", True)
             try:
                 offset_sub = lf.offset(final_child_contribution_world, offset_val)
                 shape_accumulator = lf.difference(shape_accumulator, offset_sub)
@@ -449,7 +524,7 @@ def _process_children_recursive(
                 blend = min(max(0.0, child_blend_factor), 1.0) if child_blend_factor > constants.CACHE_PRECISION else 0.0
                 if blend > 0.0 : shape_accumulator = custom_blended_intersection(shape_accumulator, final_child_contribution_world, blend, lf)
                 else: shape_accumulator = lf.intersection(shape_accumulator, final_child_contribution_world)
-            except Exception: shape_accumulator = lf.emptiness() if _lf_imported_ok else None
+            except Exception: shape_accumulator = _EMPTY
         elif child_csg_op_type == "DIFFERENCE":
             try:
                 blend = min(max(0.0, child_blend_factor), 1.0) if child_blend_factor > constants.CACHE_PRECISION else 0.0
@@ -464,39 +539,50 @@ def _process_children_recursive(
 def process_sdf_hierarchy(obj: bpy.types.Object, bounds_settings: dict) -> lf.Shape | None:
     context = bpy.context
     if not obj.visible_get(view_layer=context.view_layer):
-        return lf.emptiness() if _lf_imported_ok else None
+        return _EMPTY
 
     obj_name = obj.name
+    obj_props = utils.get_sdf_params(obj) # One link resolve and ID-property read for all of obj's params
     obj_is_sdf_source = utils.is_sdf_source(obj)
     obj_is_group = utils.is_sdf_group(obj)
     obj_is_canvas = utils.is_sdf_canvas(obj)
     
-    obj_initial_shape_contribution_world = lf.emptiness() if _lf_imported_ok else None
+    obj_initial_shape_contribution_world = _EMPTY
 
     if obj_is_sdf_source and not obj_is_canvas:
-        unit_shape = reconstruct_shape(obj) 
-        if not (unit_shape is None or unit_shape is lf.emptiness()):
-            sdf_type_obj = utils.get_sdf_param(obj, "sdf_type", "")
-            is_2d_obj = sdf_type_obj in constants._2D_SHAPE_TYPES
-            parent_is_canvas_check_obj = obj.parent and utils.is_sdf_canvas(obj.parent)
-            if is_2d_obj and not parent_is_canvas_check_obj: 
-                depth_obj = utils.get_sdf_param(obj, "sdf_extrusion_depth", constants.DEFAULT_SOURCE_SETTINGS["sdf_extrusion_depth"])
-                if float(depth_obj) > 1e-5:
-                    try: unit_shape = lf.extrude_z(unit_shape, 0, abs(float(depth_obj)))
-                    except Exception: unit_shape = lf.emptiness()
-            if utils.get_sdf_param(obj, "sdf_use_shell", False) and not (unit_shape is None or unit_shape is lf.emptiness()):
-                offset_obj = float(utils.get_sdf_param(obj, "sdf_shell_offset", constants.DEFAULT_SOURCE_SETTINGS["sdf_shell_offset"]))
-                if abs(offset_obj) > 1e-5:
-                    try:
-                        outer_obj = lf.offset(unit_shape, offset_obj)
-                        if offset_obj > 0: unit_shape = lf.difference(outer_obj, unit_shape)
-                        else: unit_shape = lf.difference(unit_shape, outer_obj)
-                    except Exception: unit_shape = lf.emptiness()
-            if not (unit_shape is None or unit_shape is lf.emptiness()):
-                obj_initial_shape_contribution_world = apply_blender_transform_to_sdf(unit_shape, obj.matrix_world.inverted())
+        # Everything the world-space source shape depends on; unchanged sources reuse last update's tree
+        unit_key = _unit_shape_key(obj, obj_props)
+        depth_key = None
+        if unit_key[0] in constants._2D_SHAPE_TYPES and not (obj.parent and utils.is_sdf_canvas(obj.parent)):
+            depth_key = float(obj_props.get("sdf_extrusion_depth", constants.DEFAULT_SOURCE_SETTINGS["sdf_extrusion_depth"]))
+        shell_key = None
+        if obj_props.get("sdf_use_shell", False):
+            shell_key = float(obj_props.get("sdf_shell_offset", constants.DEFAULT_SOURCE_SETTINGS["sdf_shell_offset"]))
+        mat_world = obj.matrix_world
+        source_key = (unit_key, depth_key, shell_key, tuple(map(tuple, mat_world)))
+        cached_entry = _source_world_cache.get(obj_name)
+        if cached_entry is not None and cached_entry[0] == source_key:
+            obj_initial_shape_contribution_world = cached_entry[1]
+        else:
+            unit_shape = reconstruct_shape(obj) 
+            if not (unit_shape is None or unit_shape is _EMPTY):
+                if depth_key is not None and depth_key > 1e-5:
+                    try: unit_shape = lf.extrude_z(unit_shape, 0, abs(depth_key))
+                    except Exception: unit_shape = _EMPTY
+                if shell_key is not None and not (unit_shape is None or unit_shape is _EMPTY):
+                    if abs(shell_key) > 1e-5:
+                        try:
+                            outer_obj = lf.offset(unit_shape, shell_key)
+                            if shell_key > 0: unit_shape = lf.difference(outer_obj, unit_shape)
+                            else: unit_shape = lf.difference(unit_shape, outer_obj)
+                        except Exception: unit_shape = _EMPTY
+                if not (unit_shape is None or unit_shape is _EMPTY):
+                    obj_initial_shape_contribution_world = apply_blender_transform_to_sdf(unit_shape, mat_world.inverted())
+            if obj_initial_shape_contribution_world is not None:
+                _source_world_cache[obj_name] = (source_key, obj_initial_shape_contribution_world)
 
     elif obj_is_canvas:
-        canvas_2d_base_local = lf.emptiness() if _lf_imported_ok else None
+        canvas_2d_base_local = _EMPTY
 
         direct_2d_children_list = []
         for c_child_obj in obj.children:
@@ -505,20 +591,16 @@ def process_sdf_hierarchy(obj: bpy.types.Object, bounds_settings: dict) -> lf.Sh
                 direct_2d_children_list.append(c_child_obj)
         
         sorted_direct_2d_children = sorted(direct_2d_children_list, key=lambda c: (utils.get_sdf_param(c, "sdf_processing_order", float('inf')), c.name))
+        canvas_world_inv = obj.matrix_world.inverted() if sorted_direct_2d_children else None
 
         for c2d_item in sorted_direct_2d_children:
             unit_c2d_item_shape = reconstruct_shape(c2d_item)
-            if unit_c2d_item_shape is None or unit_c2d_item_shape is lf.emptiness(): continue
+            if unit_c2d_item_shape is None or unit_c2d_item_shape is _EMPTY: continue
 
-            mat_c2d_item_rel_to_canvas = obj.matrix_world.inverted() @ c2d_item.matrix_world
-            mat_c2d_item_rel_inv = mat_c2d_item_rel_to_canvas.inverted()
-            
-            X_cv, Y_cv, Z_cv_dummy = libfive_shape_module.Shape.X(), libfive_shape_module.Shape.Y(), libfive_shape_module.Shape.Z()
-            x_remap_cv = mat_c2d_item_rel_inv[0][0]*X_cv + mat_c2d_item_rel_inv[0][1]*Y_cv + mat_c2d_item_rel_inv[0][3]
-            y_remap_cv = mat_c2d_item_rel_inv[1][0]*X_cv + mat_c2d_item_rel_inv[1][1]*Y_cv + mat_c2d_item_rel_inv[1][3]
-            c2d_item_in_canvas_local_xy = unit_c2d_item_shape.remap(x_remap_cv, y_remap_cv, Z_cv_dummy)
+            mat_c2d_item_rel_to_canvas = canvas_world_inv @ c2d_item.matrix_world
+            c2d_item_in_canvas_local_xy = _remap_into_canvas_xy(unit_c2d_item_shape, mat_c2d_item_rel_to_canvas.inverted())
 
-            if c2d_item_in_canvas_local_xy is None or c2d_item_in_canvas_local_xy is lf.emptiness(): continue
+            if c2d_item_in_canvas_local_xy is None or c2d_item_in_canvas_local_xy is _EMPTY: continue
 
             c2d_item_csg_op = utils.get_sdf_param(c2d_item, "sdf_csg_operation", "UNION")
             # Get blend factor from the 2D child itself
@@ -539,21 +621,21 @@ def process_sdf_hierarchy(obj: bpy.types.Object, bounds_settings: dict) -> lf.Sh
                          linked_canvas_2d_children_list.append(linked_c_child_obj)
                 
                 sorted_linked_canvas_2d_children = sorted(linked_canvas_2d_children_list, key=lambda c: (utils.get_sdf_param(c, "sdf_processing_order", float('inf')), c.name))
+                linked_canvas_world_inv = None
 
                 for linked_c2d_item in sorted_linked_canvas_2d_children:
                     unit_linked_c2d_item_shape = reconstruct_shape(linked_c2d_item)
-                    if unit_linked_c2d_item_shape is None or unit_linked_c2d_item_shape is lf.emptiness(): continue
-
-                    transform_of_linked_c2d_rel_to_its_actual_parent = linked_c2d_item.matrix_local.copy() if linked_c2d_item.parent == linked_target_canvas else (linked_target_canvas.matrix_world.inverted() @ linked_c2d_item.matrix_world)
+                    if unit_linked_c2d_item_shape is None or unit_linked_c2d_item_shape is _EMPTY: continue
 
-                    mat_linked_c2d_item_final_local_inv = transform_of_linked_c2d_rel_to_its_actual_parent.inverted()
+                    if linked_c2d_item.parent == linked_target_canvas:
+                        transform_of_linked_c2d_rel_to_its_actual_parent = linked_c2d_item.matrix_local
+                    else:
+                        if linked_canvas_world_inv is None: linked_canvas_world_inv = linked_target_canvas.matrix_world.inverted()
+                        transform_of_linked_c2d_rel_to_its_actual_parent = linked_canvas_world_inv @ linked_c2d_item.matrix_world
 
-                    X_lcv, Y_lcv, Z_lcv_dummy = libfive_shape_module.Shape.X(), libfive_shape_module.Shape.Y(), libfive_shape_module.Shape.Z()
-                    x_remap_lcv = mat_linked_c2d_item_final_local_inv[0][0]*X_lcv + mat_linked_c2d_item_final_local_inv[0][1]*Y_lcv + mat_linked_c2d_item_final_local_inv[0][3]
-                    y_remap_lcv = mat_linked_c2d_item_final_local_inv[1][0]*X_lcv + mat_linked_c2d_item_final_local_inv[1][1]*Y_lcv + mat_linked_c2d_item_final_local_inv[1][3]
-                    linked_c2d_item_in_canvas_local_xy = unit_linked_c2d_item_shape.remap(x_remap_lcv, y_remap_lcv, Z_lcv_dummy)
+                    linked_c2d_item_in_canvas_local_xy = _remap_into_canvas_xy(unit_linked_c2d_item_shape, transform_of_linked_c2d_rel_to_its_actual_parent.inverted())
                     
-                    if linked_c2d_item_in_canvas_local_xy is None or linked_c2d_item_in_canvas_local_xy is lf.emptiness(): continue
+                    if linked_c2d_item_in_canvas_local_xy is None or linked_c2d_item_in_canvas_local_xy is _EMPTY: continue
 
                     linked_c2d_item_csg_op = utils.get_sdf_param(linked_c2d_item, "sdf_csg_operation", "UNION")
                     # Get blend factor from the linked 2D child itself
@@ -563,22 +645,22 @@ def process_sdf_hierarchy(obj: bpy.types.Object, bounds_settings: dict) -> lf.Sh
                     elif linked_c2d_item_csg_op == "DIFFERENCE": canvas_2d_base_local = lf.blend_difference(canvas_2d_base_local, linked_c2d_item_in_canvas_local_xy, linked_c2d_blend_factor)
                     elif linked_c2d_item_csg_op == "INTERSECT": canvas_2d_base_local = custom_blended_intersection(canvas_2d_base_local, linked_c2d_item_in_canvas_local_xy, linked_c2d_blend_factor, lf)
 
-        if not (canvas_2d_base_local is None or canvas_2d_base_local is lf.emptiness()):
-            canvas_3d_final_local = lf.emptiness()
-            use_revolve_canvas = utils.get_sdf_param(obj, "sdf_canvas_use_revolve", False)
+        if not (canvas_2d_base_local is None or canvas_2d_base_local is _EMPTY):
+            canvas_3d_final_local = _EMPTY
+            use_revolve_canvas = obj_props.get("sdf_canvas_use_revolve", False)
             if use_revolve_canvas:
                 try:
                     profile_for_revolve = lf.intersection(canvas_2d_base_local, libfive_shape_module.Shape.X()) 
-                    if not (profile_for_revolve is None or profile_for_revolve is lf.emptiness()):
+                    if not (profile_for_revolve is None or profile_for_revolve is _EMPTY):
                         if hasattr(lf, 'revolve_y'): canvas_3d_final_local = lf.revolve_y(profile_for_revolve)
                 except Exception: pass
             else:
-                canvas_extrusion_depth = float(utils.get_sdf_param(obj, "sdf_extrusion_depth", constants.DEFAULT_CANVAS_SETTINGS["sdf_extrusion_depth"]))
+                canvas_extrusion_depth = float(obj_props.get("sdf_extrusion_depth", constants.DEFAULT_CANVAS_SETTINGS["sdf_extrusion_depth"]))
                 if canvas_extrusion_depth > 1e-5:
                     try: canvas_3d_final_local = lf.extrude_z(canvas_2d_base_local, 0, canvas_extrusion_depth)
                     except Exception: pass
             
-            if not (canvas_3d_final_local is None or canvas_3d_final_local is lf.emptiness()):
+            if not (canvas_3d_final_local is None or canvas_3d_final_local is _EMPTY):
                 obj_initial_shape_contribution_world = apply_blender_transform_to_sdf(canvas_3d_final_local, obj.matrix_world.inverted())
 
     current_processing_shape = obj_initial_shape_contribution_world
@@ -603,11 +685,11 @@ def process_sdf_hierarchy(obj: bpy.types.Object, bounds_settings: dict) -> lf.Sh
             )
 
     if obj_is_group:
-        if not (current_processing_shape is None or current_processing_shape is lf.emptiness()):
+        if not (current_processing_shape is None or current_processing_shape is _EMPTY):
             shape_after_mods = current_processing_shape
             def _apply_local_modifier(current_shape, obj_for_local_space, modifier_func, *args):
-                if current_shape is None or current_shape is lf.emptiness(): return current_shape
-                shape_in_local = lf.emptiness()
+                if current_shape is None or current_shape is _EMPTY: return current_shape
+                shape_in_local = _EMPTY
                 mat_obj_l2w = obj_for_local_space.matrix_world
                 X_loc,Y_loc,Z_loc = libfive_shape_module.Shape.X(),libfive_shape_module.Shape.Y(),libfive_shape_module.Shape.Z()
                 try:
@@ -616,33 +698,33 @@ def process_sdf_hierarchy(obj: bpy.types.Object, bounds_settings: dict) -> lf.Sh
                     zp_loc=mat_obj_l2w[2][0]*X_loc+mat_obj_l2w[2][1]*Y_loc+mat_obj_l2w[2][2]*Z_loc+mat_obj_l2w[2][3]
                     shape_in_local = current_shape.remap(xp_loc, yp_loc, zp_loc)
                 except Exception: return current_shape
-                if shape_in_local is None or shape_in_local is lf.emptiness(): return current_shape
+                if shape_in_local is None or shape_in_local is _EMPTY: return current_shape
                 modified_local = modifier_func(shape_in_local, *args)
-                if modified_local is None or modified_local is lf.emptiness(): return lf.emptiness()
+                if modified_local is None or modified_local is _EMPTY: return _EMPTY
                 return apply_blender_transform_to_sdf(modified_local, obj_for_local_space.matrix_world.inverted())
 
-            group_self_blend_factor = float(utils.get_sdf_param(obj, "sdf_blend_factor", constants.DEFAULT_GROUP_SETTINGS["sdf_blend_factor"]))
-            if utils.get_sdf_param(obj, "sdf_group_symmetry_x", False): shape_after_mods = _apply_local_modifier(shape_after_mods, obj, blended_symmetric_x, group_self_blend_factor)
-            if utils.get_sdf_param(obj, "sdf_group_symmetry_y", False): shape_after_mods = _apply_local_modifier(shape_after_mods, obj, blended_symmetric_y, group_self_blend_factor)
-            if utils.get_sdf_param(obj, "sdf_group_symmetry_z", False): shape_after_mods = _apply_local_modifier(shape_after_mods, obj, blended_symmetric_z, group_self_blend_factor)
+            group_self_blend_factor = float(obj_props.get("sdf_blend_factor", constants.DEFAULT_GROUP_SETTINGS["sdf_blend_factor"]))
+            if obj_props.get("sdf_group_symmetry_x", False): shape_after_mods = _apply_local_modifier(shape_after_mods, obj, blended_symmetric_x, group_self_blend_factor)
+            if obj_props.get("sdf_group_symmetry_y", False): shape_after_mods = _apply_local_modifier(shape_after_mods, obj, blended_symmetric_y, group_self_blend_factor)
+            if obj_props.get("sdf_group_symmetry_z", False): shape_after_mods = _apply_local_modifier(shape_after_mods, obj, blended_symmetric_z, group_self_blend_factor)
 
-            if utils.get_sdf_param(obj, "sdf_group_taper_z_active", False):
-                h_tpr=max(1e-5,float(utils.get_sdf_param(obj,"sdf_group_taper_z_height",1.0))); f_tpr=max(0.0,float(utils.get_sdf_param(obj,"sdf_group_taper_z_factor",0.5))); bs_tpr=max(1e-5,float(utils.get_sdf_param(obj,"sdf_group_taper_z_base_scale",1.0)))
+            if obj_props.get("sdf_group_taper_z_active", False):
+                h_tpr=max(1e-5,float(obj_props.get("sdf_group_taper_z_height",1.0))); f_tpr=max(0.0,float(obj_props.get("sdf_group_taper_z_factor",0.5))); bs_tpr=max(1e-5,float(obj_props.get("sdf_group_taper_z_base_scale",1.0)))
                 def taper_fn(s_l,h,f,bs): return lf.taper_xy_z(s_l,(0,0,0),h,f,bs)
                 shape_after_mods = _apply_local_modifier(shape_after_mods, obj, taper_fn, h_tpr, f_tpr, bs_tpr)
 
-            if utils.get_sdf_param(obj, "sdf_group_shear_x_by_y_active", False):
-                h_shr=max(1e-5,float(utils.get_sdf_param(obj,"sdf_group_shear_x_by_y_height",1.0))); o_shr=float(utils.get_sdf_param(obj,"sdf_group_shear_x_by_y_offset",0.5)); bo_shr=float(utils.get_sdf_param(obj,"sdf_group_shear_x_by_y_base_offset",0.0))
+            if obj_props.get("sdf_group_shear_x_by_y_active", False):
+                h_shr=max(1e-5,float(obj_props.get("sdf_group_shear_x_by_y_height",1.0))); o_shr=float(obj_props.get("sdf_group_shear_x_by_y_offset",0.5)); bo_shr=float(obj_props.get("sdf_group_shear_x_by_y_base_offset",0.0))
                 def shear_fn(s_l,h,o,bo):
                     if hasattr(lf,'shear_x_y'): return lf.shear_x_y(s_l,(0,0),h,o,bo)
                     Xshr,Yshr,Zshr=libfive_shape_module.Shape.X(),libfive_shape_module.Shape.Y(),libfive_shape_module.Shape.Z(); ft_shr=Yshr/h; xf_shr=Xshr-(bo*(1.0-ft_shr))-(o*ft_shr)
                     return s_l.remap(xf_shr,Yshr,Zshr)
                 shape_after_mods = _apply_local_modifier(shape_after_mods, obj, shear_fn, h_shr, o_shr, bo_shr)
 
-            ar_mode_grp = utils.get_sdf_param(obj, "sdf_group_attract_repel_mode", 'NONE')
+            ar_mode_grp = obj_props.get("sdf_group_attract_repel_mode", 'NONE')
             if ar_mode_grp != 'NONE':
-                r_ar_grp=max(1e-5,float(utils.get_sdf_param(obj,"sdf_group_attract_repel_radius",0.5))); e_ar_grp=max(0.0,float(utils.get_sdf_param(obj,"sdf_group_attract_repel_exaggerate",1.0)))
-                ax_x_grp=utils.get_sdf_param(obj,"sdf_group_attract_repel_axis_x",True); ax_y_grp=utils.get_sdf_param(obj,"sdf_group_attract_repel_axis_y",True); ax_z_grp=utils.get_sdf_param(obj,"sdf_group_attract_repel_axis_z",True)
+                r_ar_grp=max(1e-5,float(obj_props.get("sdf_group_attract_repel_radius",0.5))); e_ar_grp=max(0.0,float(obj_props.get("sdf_group_attract_repel_exaggerate",1.0)))
+                ax_x_grp=obj_props.get("sdf_group_attract_repel_axis_x",True); ax_y_grp=obj_props.get("sdf_group_attract_repel_axis_y",True); ax_z_grp=obj_props.get("sdf_group_attract_repel_axis_z",True)
                 prefix_ar = "attract" if ar_mode_grp == 'ATTRACT' else "repel"; sel_ar_fn = None
                 if ax_x_grp and ax_y_grp and ax_z_grp: sel_ar_fn = getattr(lf, prefix_ar, None)
                 elif ax_x_grp and ax_y_grp: sel_ar_fn = getattr(lf, f"{prefix_ar}_xy", None)
@@ -655,16 +737,16 @@ def process_sdf_hierarchy(obj: bpy.types.Object, bounds_settings: dict) -> lf.Sh
                     def ar_fn_wrap(s_l,fn_ar,loc_ar,rad_ar,ex_ar): return fn_ar(s_l,loc_ar,rad_ar,ex_ar)
                     shape_after_mods = _apply_local_modifier(shape_after_mods, obj, ar_fn_wrap, sel_ar_fn, (0,0,0), r_ar_grp, e_ar_grp)
             
-            if utils.get_sdf_param(obj, "sdf_group_twirl_active", False):
-                tw_ax_grp=utils.get_sdf_param(obj,"sdf_group_twirl_axis",'Z'); tw_am_grp=float(utils.get_sdf_param(obj,"sdf_group_twirl_amount",1.5708)); tw_r_grp=max(1e-5,float(utils.get_sdf_param(obj,"sdf_group_twirl_radius",1.0)))
+            if obj_props.get("sdf_group_twirl_active", False):
+                tw_ax_grp=obj_props.get("sdf_group_twirl_axis",'Z'); tw_am_grp=float(obj_props.get("sdf_group_twirl_amount",1.5708)); tw_r_grp=max(1e-5,float(obj_props.get("sdf_group_twirl_radius",1.0)))
                 tw_fn_name_grp = f"twirl_axis_{tw_ax_grp.lower()}"
                 sel_tw_fn = getattr(lf, tw_fn_name_grp, None) if tw_fn_name_grp else None
                 if sel_tw_fn:
                     def tw_fn_wrap(s_l,fn_tw,amt_tw,rad_tw,cen_tw): return fn_tw(s_l,amt_tw,rad_tw,cen_tw)
                     shape_after_mods = _apply_local_modifier(shape_after_mods, obj, tw_fn_wrap, sel_tw_fn, tw_am_grp, tw_r_grp, (0,0,0))
             
-            if utils.get_sdf_param(obj, "sdf_use_shell", False):
-                offset_grp = float(utils.get_sdf_param(obj, "sdf_shell_offset", constants.DEFAULT_GROUP_SETTINGS["sdf_shell_offset"]))
+            if obj_props.get("sdf_use_shell", False):
+                offset_grp = float(obj_props.get("sdf_shell_offset", constants.DEFAULT_GROUP_SETTINGS["sdf_shell_offset"]))
                 if abs(offset_grp) > 1e-5:
                     def shell_fn(s_l, offset_val):
                         outer_s_l = lf.offset(s_l, offset_val)
@@ -674,5 +756,5 @@ def process_sdf_hierarchy(obj: bpy.types.Object, bounds_settings: dict) -> lf.Sh
 
             current_processing_shape = shape_after_mods
 
-    if current_processing_shape is None and _lf_imported_ok: return lf.emptiness()
+    if current_processing_shape is None and _lf_imported_ok: return _EMPTY
     return current_processing_shape
\ No newline at end of file
@@ -16,6 +16,7 @@ and comparing it to previously cached states for change detection.
 """
 
 import bpy
+from collections import deque
 from mathutils import Vector, Matrix
 
 from .. import constants
@@ -93,28 +94,32 @@ def get_current_sdf_state(context: bpy.types.Context, bounds_obj: bpy.types.Obje
 
     # Read settings from the bounds object itself into the state dictionary
     # Use utils.get_bounds_setting to handle defaults correctly
+    bounds_params = utils.get_sdf_params(bounds_obj) # One ID-property read instead of one per setting
     for key, default_val in constants.DEFAULT_SETTINGS.items():
         # Check if this key is the link target prop itself to avoid recursion if bounds links to itself for settings
         if key == constants.SDF_LINK_TARGET_NAME_PROP:
             current_state['scene_settings'][key] = bounds_obj.get(key, default_val)
         else:
             # For other settings, respect linking if bounds_obj were to link its settings
-            current_state['scene_settings'][key] = utils.get_sdf_param(bounds_obj, key, default_val)
+            current_state['scene_settings'][key] = bounds_params.get(key, default_val)
+
+    # Parent name -> children in this scene, built in one pass; Object.children scans all of
+    # bpy.data.objects per access, and grouping scene.objects also drops objects from other scenes
+    children_map = {}
+    for scene_obj in context.scene.objects:
+        parent = scene_obj.parent
+        if parent: children_map.setdefault(parent.name, []).append(scene_obj)
 
     # Traverse hierarchy below this specific bounds object
-    queue = [bounds_obj]
+    queue = deque((bounds_obj,)) # popleft() is O(1); list.pop(0) made deep hierarchies quadratic
     visited_in_hierarchy = {bounds_name}
 
     while queue:
-        parent_obj_iterator = queue.pop(0)
-        children = list(parent_obj_iterator.children)
-        for child_obj in children:
-            if not child_obj: continue
-            child_name = child_obj.name
+        parent_obj_iterator = queue.popleft()
+        for actual_child_obj in children_map.get(parent_obj_iterator.name, ()):
+            child_name = actual_child_obj.name
             if child_name in visited_in_hierarchy: continue
             visited_in_hierarchy.add(child_name)
-            actual_child_obj = context.scene.objects.get(child_obj.name)
-            if not actual_child_obj: continue
             
             # --- Link dependency tracking ---
             if utils.is_sdf_source(actual_child_obj) or utils.is_sdf_group(actual_child_obj) or utils.is_sdf_canvas(actual_child_obj):
@@ -122,12 +127,14 @@ def get_current_sdf_state(context: bpy.types.Context, bounds_obj: bpy.types.Obje
                 register_link_dependency(actual_child_obj, effective_target_for_child, bounds_obj)
 
             # --- State gathering (visibility check removed for SDF objects) ---
+            # SDF objects read all their tracked props from one snapshot of the (link-resolved) ID properties
             if utils.is_sdf_source(actual_child_obj):
                 props_to_track = {}
+                child_params = utils.get_sdf_params(actual_child_obj)
                 props_to_track[constants.SDF_LINK_TARGET_NAME_PROP] = actual_child_obj.get(constants.SDF_LINK_TARGET_NAME_PROP, "")
                 for key, default_val in constants.DEFAULT_SOURCE_SETTINGS.items():
                     if key != constants.SDF_LINK_TARGET_NAME_PROP:
-                        value = utils.get_sdf_param(actual_child_obj, key, default_val)
+                        value = child_params.get(key, default_val)
                         if isinstance(default_val, float): # Round if default is a float
                             value = round(float(value), 5)
                         props_to_track[key] = value
@@ -138,10 +145,11 @@ def get_current_sdf_state(context: bpy.types.Context, bounds_obj: bpy.types.Obje
 
             elif utils.is_sdf_group(actual_child_obj):
                 props_to_track_group = {}
+                child_params = utils.get_sdf_params(actual_child_obj)
                 props_to_track_group[constants.SDF_LINK_TARGET_NAME_PROP] = actual_child_obj.get(constants.SDF_LINK_TARGET_NAME_PROP, "")
                 for key, default_val in constants.DEFAULT_GROUP_SETTINGS.items():
                      if key != constants.SDF_LINK_TARGET_NAME_PROP:
-                        value = utils.get_sdf_param(actual_child_obj, key, default_val)
+                        value = child_params.get(key, default_val)
                         if isinstance(default_val, float):
                             value = round(float(value), 5)
                         props_to_track_group[key] = value
@@ -151,17 +159,18 @@ def get_current_sdf_state(context: bpy.types.Context, bounds_obj: bpy.types.Obje
 
             elif actual_child_obj.get(constants.SDF_CANVAS_MARKER, False):
                 props_to_track_canvas = {}
+                child_params = utils.get_sdf_params(actual_child_obj)
                 props_to_track_canvas[constants.SDF_LINK_TARGET_NAME_PROP] = actual_child_obj.get(constants.SDF_LINK_TARGET_NAME_PROP, "")
                 for key, default_val in constants.DEFAULT_CANVAS_SETTINGS.items():
                     if key != constants.SDF_LINK_TARGET_NAME_PROP:
-                        value = utils.get_sdf_param(actual_child_obj, key, default_val)
+                        value = child_params.get(key, default_val)
                         if isinstance(default_val, float):
                             value = round(float(value), 5)
                         props_to_track_canvas[key] = value
                 canvas_obj_state = {'matrix': actual_child_obj.matrix_world.copy(), 'props': props_to_track_canvas}
                 current_state['canvas_objects'][child_name] = canvas_obj_state
                 queue.append(actual_child_obj)
-            elif actual_child_obj.visible_get(view_layer=context.view_layer) and actual_child_obj.children:
+            elif child_name in children_map and actual_child_obj.visible_get(view_layer=context.view_layer): # Childless first: no visibility query
                  queue.append(actual_child_obj)
     return current_state
 
@@ -177,6 +186,8 @@ def has_state_changed(current_state: dict, cached_state: dict | None) -> bool:
         return False # Cannot compare if no current state
     if not cached_state:
         return True # No cache exists, so state has effectively changed
+    if current_state == cached_state:
+        return False # Nothing moved: one C-level compare instead of the per-key tolerant walk below
 
     # 1. Compare Settings stored on the bounds object
     # Use utils.compare_dicts for tolerance
@@ -25,7 +25,8 @@ import threading
 import ctypes
 import os
 import sys
-from mathutils import Matrix, Vector
+from collections import deque
+from mathutils import Matrix
 
 # Use relative imports assuming this file is in FieldForge/core/
 from .. import constants
@@ -47,14 +48,18 @@ except ImportError:
 # --- Global State Dictionaries (Managed by this module) ---
 # Keys are generally bounds_obj.name
 
-# State for throttled updates
-_last_update_times = {}
-# Active debounce timer functions
-_debounce_timers = {}
-# Flags indicating an update is scheduled or running for a specific bounds
-_updates_pending = {}
-# Caches the last known state dictionary used for a successful update
-_sdf_update_caches = {}
+class BoundsRuntime:
+    """ Per-bounds runtime record for the debounce/throttle hot path (one lookup instead of several). """
+    __slots__ = ("pending", "timer", "trigger_state", "last_finish")
+
+    def __init__(self):
+        self.pending = False        # An update is scheduled or running
+        self.timer = None           # Active debounce timer function
+        self.trigger_state = None   # Last known state dictionary used for a successful update
+        self.last_finish = 0.0      # perf_counter() time of the last throttled update
+
+# Runtime records for each bounds object
+_bounds_runtime = {}
 # Keeps track of active background meshing threads
 _active_meshing_threads = {}
 # Stores queued states that are waiting for the active thread to complete
@@ -67,39 +72,61 @@ _target_divs = {}
 MAX_DIV = 5 # Corresponds to lowest resolution (highest div)
 MIN_DIV = 0 # Corresponds to highest resolution (lowest div)
 THROTTLE_INTERVAL = 0.15 # Minimum seconds between viewport updates during active dragging
+INITIAL_CHECK_INTERVAL = 0.05 # Seconds between bounds checked by the initial check timer
+
+# Bounds names still waiting for their initial check, walked by one self-rescheduling timer
+_initial_check_queue = deque()
 
 
 def clear_link_caches(): # Call from clear_timers_and_state
     state.clear_link_caches()
 
+def _get_runtime(bounds_name: str) -> BoundsRuntime:
+    """ Returns the runtime record for a bounds object, creating it if needed. """
+    rt = _bounds_runtime.get(bounds_name)
+    if rt is None:
+        rt = _bounds_runtime[bounds_name] = BoundsRuntime()
+    return rt
+
+def is_update_pending(bounds_name: str) -> bool:
+    rt = _bounds_runtime.get(bounds_name)
+    return bool(rt and rt.pending)
+
+def set_update_pending(bounds_name: str, pending: bool):
+    _get_runtime(bounds_name).pending = pending
+
 # --- Cache Update ---
 
 def update_sdf_cache(new_state: dict, bounds_name: str):
     """ Updates the cache for a specific bounds object with the new state. """
-    global _sdf_update_caches
     if new_state and bounds_name:
-        _sdf_update_caches[bounds_name] = new_state
+        rt = _get_runtime(bounds_name)
+        rt.trigger_state = new_state
 
 
 # --- Debounce and Throttle Helpers ---
 
 def _register_debounce_timer(bounds_name: str, delay: float, callback):
     """Registers a debounced timer for a bounds object, cancelling any existing one."""
-    global _debounce_timers
     _cancel_debounce_timer(bounds_name)
+    rt = _get_runtime(bounds_name)
 
     def timer_wrapper():
-        _debounce_timers.pop(bounds_name, None)
+        if rt.timer is timer_wrapper:
+            rt.timer = None
         callback()
         return None # Do not repeat
 
-    _debounce_timers[bounds_name] = timer_wrapper
+    rt.timer = timer_wrapper
     bpy.app.timers.register(timer_wrapper, first_interval=delay)
 
 def _cancel_debounce_timer(bounds_name: str):
     """Cancels any pending delayed timer for the specified bounds."""
-    global _debounce_timers
-    timer_func = _debounce_timers.pop(bounds_name, None)
+    rt = _bounds_runtime.get(bounds_name)
+    if rt is None:
+        return
+    timer_func = rt.timer
+    rt.timer = None
     if timer_func:
         try:
             if bpy.app.timers.is_registered(timer_func):
@@ -314,7 +341,7 @@ def check_and_trigger_update(bounds_name: str, reason: str="unknown"):
     Checks if an update is needed for a specific bounds hierarchy.
     Applies viewport throttling to prevent excessive main-thread work.
     """
-    global _last_update_times, _current_divs, _target_divs, _updates_pending
+    global _current_divs, _target_divs
 
     context = bpy.context
     if not context or not context.scene: 
@@ -325,13 +352,11 @@ def check_and_trigger_update(bounds_name: str, reason: str="unknown"):
     if not bounds_obj or not bounds_obj.get(constants.SDF_BOUNDS_MARKER):
         # Clean up potentially orphaned state if object is gone
         _cancel_debounce_timer(bounds_name)
-        _updates_pending.pop(bounds_name, None)
-        _sdf_update_caches.pop(bounds_name, None)
+        _bounds_runtime.pop(bounds_name, None)
         _active_meshing_threads.pop(bounds_name, None)
         _queued_updates.pop(bounds_name, None)
         _current_divs.pop(bounds_name, None)
         _target_divs.pop(bounds_name, None)
-        _last_update_times.pop(bounds_name, None)
         return
 
     # Check the auto-update setting ON THE BOUNDS OBJECT
@@ -343,7 +368,8 @@ def check_and_trigger_update(bounds_name: str, reason: str="unknown"):
         return
 
     # Compare current state to the cached state
-    cached_state = _sdf_update_caches.get(bounds_name)
+    rt = _get_runtime(bounds_name)
+    cached_state = rt.trigger_state
     if state.has_state_changed(current_state, cached_state):
         # Check if the ONLY change is sdf_final_resolution for viewport updates
         if cached_state is not None and \
@@ -357,12 +383,11 @@ def check_and_trigger_update(bounds_name: str, reason: str="unknown"):
         _target_divs[bounds_name] = MIN_DIV
 
         now = time.perf_counter()
-        last_time = _last_update_times.get(bounds_name, 0.0)
-        elapsed = now - last_time
+        elapsed = now - rt.last_finish
 
         if elapsed >= THROTTLE_INTERVAL:
             # Perform synchronous update immediately (throttled)
-            _last_update_times[bounds_name] = now
+            rt.last_finish = now
             _cancel_debounce_timer(bounds_name)
             run_sdf_update(bounds_name, current_state, is_viewport_update=True)
         else:
@@ -375,8 +400,7 @@ def check_and_trigger_update(bounds_name: str, reason: str="unknown"):
             )
 
 def _execute_debounced_update(bounds_name: str, trigger_state: dict):
-    global _last_update_times
-    _last_update_times[bounds_name] = time.perf_counter()
+    _get_runtime(bounds_name).last_finish = time.perf_counter()
     run_sdf_update(bounds_name, trigger_state, is_viewport_update=True)
 
 
@@ -390,7 +414,7 @@ def run_sdf_update(bounds_name: str, trigger_state: dict, is_viewport_update: bo
     if not _lf_imported_ok:
         return
 
-    global _updates_pending, _sdf_update_caches, _active_meshing_threads, _queued_updates
+    global _active_meshing_threads, _queued_updates
 
     # If a meshing thread is already active, queue this update state and return
     if bounds_name in _active_meshing_threads:
@@ -540,12 +564,11 @@ def run_sdf_update(bounds_name: str, trigger_state: dict, is_viewport_update: bo
         all_sdf_bytes = b"".join(sdf_bytes_list)
 
         # Calculate bounding box bounds
+        # World AABB of the transformed unit cube: per axis, translation +- the sum of |row coefficients|
         bounds_matrix = trigger_state.get('bounds_matrix')
-        local_corners = [Vector(c) for c in ((-1,-1,-1), (1,-1,-1), (-1,1,-1), (1,1,-1), (-1,-1,1), (1,-1,1), (-1,1,1), (1,1,1))]
-        world_corners = [(bounds_matrix @ c.to_4d()).xyz for c in local_corners]
-
-        xyz_min = (min(c.x for c in world_corners), min(c.y for c in world_corners), min(c.z for c in world_corners))
-        xyz_max = (max(c.x for c in world_corners), max(c.y for c in world_corners), max(c.z for c in world_corners))
+        row_extents = [(row[3], abs(row[0]) + abs(row[1]) + abs(row[2])) for row in (tuple(r) for r in bounds_matrix[:3])]
+        xyz_min = tuple(center - half for center, half in row_extents)
+        xyz_max = tuple(center + half for center, half in row_extents)
         
         # Adjust progressive division levels
         if bounds_name not in _current_divs or bounds_name not in _target_divs:
@@ -656,7 +679,7 @@ def run_sdf_update(bounds_name: str, trigger_state: dict, is_viewport_update: bo
 
                 # Safely update Blender's mesh on the main thread
                 def main_thread_callback():
-                    global _active_meshing_threads, _queued_updates, _updates_pending
+                    global _active_meshing_threads, _queued_updates
                     try:
                         ctx = bpy.context
                         if not ctx or not ctx.scene:
@@ -672,7 +695,7 @@ def run_sdf_update(bounds_name: str, trigger_state: dict, is_viewport_update: bo
                         print(f"FieldForge ERROR: Failed to apply background mesh data: {e_apply}")
                     finally:
                         _active_meshing_threads.pop(bounds_name, None)
-                        _updates_pending[bounds_name] = False
+                        set_update_pending(bounds_name, False)
 
                         # Trigger the next queued update if states changed during worker thread runtime
                         next_state = _queued_updates.pop(bounds_name, None)
@@ -685,21 +708,21 @@ def run_sdf_update(bounds_name: str, trigger_state: dict, is_viewport_update: bo
             except Exception as e_mesh:
                 print(f"FieldForge ERROR: Background meshing failed: {e_mesh}")
                 def cleanup_callback():
-                    global _active_meshing_threads, _updates_pending
+                    global _active_meshing_threads
                     _active_meshing_threads.pop(bounds_name, None)
-                    _updates_pending[bounds_name] = False
+                    set_update_pending(bounds_name, False)
                     return None
                 bpy.app.timers.register(cleanup_callback)
 
         # Spawn background meshing thread
         thread = threading.Thread(target=_bg_meshing_worker, daemon=True)
         _active_meshing_threads[bounds_name] = thread
-        _updates_pending[bounds_name] = True
+        set_update_pending(bounds_name, True)
         thread.start()
 
     except Exception as e:
         print(f"FieldForge ERROR: Failed to launch background meshing thread: {e}")
-        _updates_pending[bounds_name] = False
+        set_update_pending(bounds_name, False)
 
 
 def _apply_mesh_data(bounds_obj, trigger_state: dict, mesh_data, meshing_time: float, actual_rendered_div: int, is_viewport_update: bool, colors_data=None):
@@ -733,31 +756,53 @@ def _apply_mesh_data(bounds_obj, trigger_state: dict, mesh_data, meshing_time: f
     mesh_update_successful = False
     if result_obj and result_obj.type == 'MESH':
         new_mesh_bdata = result_obj.data
-        new_mesh_bdata.clear_geometry()
 
-        if mesh_data and mesh_data[0] and mesh_data[1]:
-            num_verts = len(mesh_data[0])
-            num_tris = len(mesh_data[1])
+        has_new_geometry = bool(mesh_data and mesh_data[0] and mesh_data[1])
+        num_verts = len(mesh_data[0]) if has_new_geometry else 0
+        num_tris = len(mesh_data[1]) if has_new_geometry else 0
+
+        flat_loops = [idx for tri in mesh_data[1] for idx in tri] if has_new_geometry else []
+
+        # Same topology (common for small edits): only move the vertices instead of tearing down
+        # and re-allocating the mesh. Counts must match and so must the connectivity, otherwise the
+        # existing edges would no longer fit the triangles.
+        reuse_topology = has_new_geometry and \
+            len(new_mesh_bdata.vertices) == num_verts and \
+            len(new_mesh_bdata.polygons) == num_tris and \
+            len(new_mesh_bdata.loops) == num_tris * 3
+        if reuse_topology:
+            try:
+                current_loops = [0] * len(flat_loops)
+                new_mesh_bdata.loops.foreach_get("vertex_index", current_loops)
+                reuse_topology = current_loops == flat_loops
+            except Exception:
+                reuse_topology = False
+
+        if not reuse_topology:
+            new_mesh_bdata.clear_geometry()
+
+        if has_new_geometry:
             try:
-                # Pre-allocate exact structures directly to bypass safe/slow validations
-                new_mesh_bdata.vertices.add(num_verts)
-                new_mesh_bdata.loops.add(num_tris * 3)
-                new_mesh_bdata.polygons.add(num_tris)
+                if not reuse_topology:
+                    # Pre-allocate exact structures directly to bypass safe/slow validations
+                    new_mesh_bdata.vertices.add(num_verts)
+                    new_mesh_bdata.loops.add(num_tris * 3)
+                    new_mesh_bdata.polygons.add(num_tris)
 
                 # Direct write of vertices
                 flat_verts = [val for vert in mesh_data[0] for val in vert]
                 new_mesh_bdata.vertices.foreach_set("co", flat_verts)
 
-                # Direct write of loop indices
-                flat_loops = [idx for tri in mesh_data[1] for idx in tri]
-                new_mesh_bdata.loops.foreach_set("vertex_index", flat_loops)
+                if not reuse_topology:
+                    # Direct write of loop indices
+                    new_mesh_bdata.loops.foreach_set("vertex_index", flat_loops)
 
-                # Direct write of polygons (each is a triangle)
-                new_mesh_bdata.polygons.foreach_set("loop_start", range(0, num_tris * 3, 3))
-                new_mesh_bdata.polygons.foreach_set("loop_total", (3,) * num_tris)
+                    # Direct write of polygons (each is a triangle)
+                    new_mesh_bdata.polygons.foreach_set("loop_start", range(0, num_tris * 3, 3))
+                    new_mesh_bdata.polygons.foreach_set("loop_total", (3,) * num_tris)
 
-                # Enable smooth shading via array memory copy (replaces slow Python loop)
-                new_mesh_bdata.polygons.foreach_set("use_smooth", (True,) * num_tris)
+                    # Enable smooth shading via array memory copy (replaces slow Python loop)
+                    new_mesh_bdata.polygons.foreach_set("use_smooth", (True,) * num_tris)
 
                 # Map calculated vertex colors directly to Mesh Point Attributes
                 if colors_data and len(colors_data) == num_verts * 4:
@@ -779,8 +824,10 @@ def _apply_mesh_data(bounds_obj, trigger_state: dict, mesh_data, meshing_time: f
                 new_mesh_bdata.from_pydata(mesh_data[0], [], mesh_data[1])
                 for poly in new_mesh_bdata.polygons:
                     poly.use_smooth = True
+                reuse_topology = False
                 mesh_update_successful = True
-        
+
+        # Rebuilt meshes have no edges yet, so update() derives them; reused topology keeps its edges
         new_mesh_bdata.update()
         
         # Apply smooth shading and modifier logic
@@ -857,6 +904,13 @@ def _apply_mesh_data(bounds_obj, trigger_state: dict, mesh_data, meshing_time: f
 @bpy.app.handlers.persistent
 def ff_depsgraph_handler(scene, depsgraph):
     """ Blender dependency graph handler, called after updates. """
+    from .. import drawing
+    drawing.mark_outlines_dirty() # Selection, visibility and transforms all arrive here
+    # Parenting/renames arrive as depsgraph updates, so cached hierarchy lookups are stale now
+    # (cleared before any early return: the draw callback and polls use them even without libfive)
+    utils.clear_parent_bounds_cache()
+    utils.invalidate_sdf_hierarchy_cache()
+
     if not _lf_imported_ok: 
         return
 
@@ -912,7 +966,6 @@ def ff_depsgraph_handler(scene, depsgraph):
 
     if needs_visual_redraw:
         try:
-            from .. import drawing
             drawing.tag_redraw_all_view3d()
         except Exception: 
             pass
@@ -921,33 +974,41 @@ def ff_depsgraph_handler(scene, depsgraph):
 # --- Initial Update Check on Load ---
 
 def initial_update_check_all():
-    """ Schedules an initial state check for all existing Bounds objects. """
+    """ Queues an initial state check for all existing Bounds objects, walked by a single timer. """
     context = bpy.context
     if not context or not context.scene: 
         return None
     if not _lf_imported_ok: 
         return None
 
-    count = 0
-    processed_bounds = set()
-
+    queued = set(_initial_check_queue)
     for bounds_obj in utils.get_all_bounds_objects(context):
-        if bounds_obj.name not in processed_bounds:
-            processed_bounds.add(bounds_obj.name)
-            try:
-                check_and_trigger_update(bounds_obj.name, "initial_check")
-                count += 1
-            except Exception as e:
-                print(f"FieldForge ERROR: Failed initial check for {bounds_obj.name}: {e}")
+        if bounds_obj.name not in queued:
+            queued.add(bounds_obj.name)
+            _initial_check_queue.append(bounds_obj.name)
+
+    if _initial_check_queue and not bpy.app.timers.is_registered(_initial_check_tick):
+        print(f"FieldForge: Queued initial checks for {len(_initial_check_queue)} bounds systems.")
+        bpy.app.timers.register(_initial_check_tick)
 
-    if count > 0:
-        print(f"FieldForge: Triggered initial checks for {count} bounds systems.")
+    return None
+
+def _initial_check_tick():
+    """ Checks one queued Bounds object per tick; redraws and stops once the queue is empty. """
+    if _initial_check_queue:
+        bounds_name = _initial_check_queue.popleft()
         try:
-            from .. import drawing
-            bpy.app.timers.register(drawing.tag_redraw_all_view3d, first_interval=0.2 + count * 0.05)
-        except Exception: 
-            pass
+            check_and_trigger_update(bounds_name, "initial_check")
+        except Exception as e:
+            print(f"FieldForge ERROR: Failed initial check for {bounds_name}: {e}")
+        if _initial_check_queue:
+            return INITIAL_CHECK_INTERVAL
 
+    try:
+        from .. import drawing
+        bpy.app.timers.register(drawing.tag_redraw_all_view3d, first_interval=0.2)
+    except Exception: 
+        pass
     return None
 
 
@@ -955,19 +1016,25 @@ def initial_update_check_all():
 
 def clear_timers_and_state():
     """Cancels all active timers and clears global state dictionaries."""
-    global _updates_pending, _sdf_update_caches, _serialized_tree_caches, _current_divs, _target_divs, _last_update_times, _debounce_timers, _active_meshing_threads, _queued_updates
+    global _bounds_runtime, _current_divs, _target_divs, _active_meshing_threads, _queued_updates
     
     # Cancel all active debounce timers safely
-    for bounds_name in list(_debounce_timers.keys()):
+    for bounds_name in list(_bounds_runtime.keys()):
         _cancel_debounce_timer(bounds_name)
+    _initial_check_queue.clear()
+    try:
+        if bpy.app.timers.is_registered(_initial_check_tick):
+            bpy.app.timers.unregister(_initial_check_tick)
+    except Exception:
+        pass
 
-    _updates_pending.clear()
-    _sdf_update_caches.clear()
+    _bounds_runtime.clear()
     _current_divs.clear()
     _target_divs.clear()
-    _last_update_times.clear()
-    _debounce_timers.clear()
     _active_meshing_threads.clear()
     _queued_updates.clear()
 
-    clear_link_caches()
\ No newline at end of file
+    clear_link_caches()
+    sdf_logic.clear_shape_caches()
+    utils.clear_parent_bounds_cache()
+    utils.invalidate_sdf_hierarchy_cache()
\ No newline at end of file
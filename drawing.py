@@ -17,23 +17,159 @@ and double-buffered line data for picking.
 """
 
 import bpy
-import gpu
-from gpu_extras.batch import batch_for_shader
 import math
-from mathutils import Vector
+from functools import lru_cache
+from mathutils import Vector, Matrix
 
 from . import constants
 from . import utils
 
+# gpu / gpu_extras are imported on first shader use, so enabling the addon and headless
+# (background) sessions never load the GPU module
+gpu = None
+batch_for_shader = None
+
+def _ensure_gpu_modules():
+    global gpu, batch_for_shader
+    if gpu is None:
+        import gpu as gpu_module
+        from gpu_extras.batch import batch_for_shader as batch_fn
+        gpu, batch_for_shader = gpu_module, batch_fn
+
 # --- Module State ---
 
 _draw_handle = None
+_line_shader = None # Builtin POLYLINE_SMOOTH_COLOR shader, fetched once (see get_line_shader)
 # Double Buffering for picking data to avoid race conditions with event handlers
 _draw_line_data_read = {}  # Data for event handlers to read (stable from previous frame)
 _draw_line_data_write = {} # Data for draw callback to write to (current frame)
+# Source name -> [state, picking segments, world verts, LINES index pairs, offset verts or None, build id,
+#                 view key the offset verts were built for]
+_batch_cache = {}
+_batch_build_counter = 0
+# 'OUTLINES' -> ((source name, build id, color) tuple, batch): all selected/active outlines in one LINES batch
+_merged_batches = {}
+# Bumped by depsgraph updates and explicit redraw requests; an unchanged frame key reuses the last frame
+_scene_generation = 0
+_last_frame_key = None
+_last_frame_parts = ([], []) # (selected parts, active parts) drawn by the last full frame
+
+# Custom properties that change a source's outline, per sdf_type (part of the batch cache state)
+_OUTLINE_STATE_PROPS = {
+    "rounded_box": ("sdf_round_radius",),
+    "ring": ("sdf_inner_radius",),
+    "polygon": ("sdf_sides",),
+    "text": ("sdf_text_string",),
+    "torus": ("sdf_torus_major_radius", "sdf_torus_minor_radius"),
+}
+# Types whose world outline (silhouette edges) depends on the view; all others only re-offset on view changes
+_VIEW_DEPENDENT_TYPES = frozenset(("cylinder", "cone"))
+
+# --- Unit Outline Tables ---
+# Local-space outlines that don't depend on object properties are built once at import;
+# property-dependent ones (torus, rounded box) are cached by their float parameters.
+
+def _unit_sphere_loops(segments: int = 24, radius: float = 0.5) -> tuple:
+    angles = [(i / segments) * 2 * math.pi for i in range(segments)]
+    xy = tuple((math.cos(a) * radius, math.sin(a) * radius, 0.0) for a in angles)
+    yz = tuple((0.0, math.cos(a) * radius, math.sin(a) * radius) for a in angles)
+    xz = tuple((math.cos(a) * radius, 0.0, math.sin(a) * radius) for a in angles)
+    return (xy, yz, xz)
+
+# Silhouette fallbacks when the camera location is unknown or straight above the object
+_FALLBACK_VIEW_ORIGIN = Vector((0.0, 0.0, 10.0))
+_FALLBACK_SIDE_DIR = Vector((1.0, 0.0, 0.0))
+# Half space: 2x2 plane corners (0-3), then normal arrow start/end (4, 5) and four head points (6-9)
+def _half_space_local_points(plane_size: float = 2.0, arrow_len: float = 0.5) -> tuple:
+    h = plane_size / 2; head = arrow_len * 0.2; head_z = arrow_len - head * 1.5
+    return ((h, h, 0.0), (-h, h, 0.0), (-h, -h, 0.0), (h, -h, 0.0),
+            (0.0, 0.0, 0.0), (0.0, 0.0, arrow_len),
+            (head, 0.0, head_z), (-head, 0.0, head_z), (0.0, head, head_z), (0.0, -head, head_z))
+
+_HALF_SPACE_LOCAL_POINTS = _half_space_local_points()
+_HALF_SPACE_PLANE_LINES = ((0, 1), (1, 2), (2, 3), (3, 0))
+_HALF_SPACE_ARROW_LINES = ((4, 5), (5, 6), (5, 7), (5, 8), (5, 9))
+_UNIT_CUBE_VERTS = tuple(Vector(v) for v in constants.unit_cube_verts) # Vectors, transformed as-is
+_UNIT_CUBE_INDICES = tuple(constants.unit_cube_indices)
+_UNIT_SPHERE_LOOPS = _unit_sphere_loops()
+_UNIT_PYRAMID_BASE = ((-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (0.5, 0.5, 0.0), (-0.5, 0.5, 0.0))
+_UNIT_PYRAMID_APEX = (0.0, 0.0, 1.0)
+
+@lru_cache(maxsize=32)
+def _torus_loops(r_major: float, r_minor: float, major_segments: int = 24, minor_segments: int = 12) -> tuple:
+    """Returns (main_ring, minor_rings) local vertex tuples for the torus outline."""
+    main_ring = tuple((math.cos(a) * r_major, math.sin(a) * r_major, 0.0)
+                      for a in [(i / major_segments) * 2 * math.pi for i in range(major_segments)])
+    minor_rings = []
+    if r_minor > 1e-5:
+        # One scaled cos/sin table shared by all four cross-sections
+        trig = [(math.cos(a) * r_minor, math.sin(a) * r_minor)
+                for a in [(j / minor_segments) * 2 * math.pi for j in range(minor_segments)]]
+        # Cross-sections at +Y, -Y, +X, -X; each circle spans local Z and the radial direction
+        for cx, cy, rx, ry in ((0.0, r_major, 0.0, -1.0), (0.0, -r_major, 0.0, 1.0), (r_major, 0.0, 1.0, 0.0), (-r_major, 0.0, -1.0, 0.0)):
+            minor_rings.append(tuple((cx + rx * s, cy + ry * s, c) for c, s in trig))
+    return main_ring, tuple(minor_rings)
+
+# (right, up) axes of the XY, XZ and YZ rounded-rectangle loops of the rounded box outline
+_ROUNDED_BOX_PLANES = (((1.0, 0.0, 0.0), (0.0, 1.0, 0.0)), ((1.0, 0.0, 0.0), (0.0, 0.0, 1.0)), ((0.0, 1.0, 0.0), (0.0, 0.0, 1.0)))
 
 # --- Drawing Helpers ---
 
+def _to_world(mat: Matrix, local_verts) -> list[Vector]:
+    """
+    Transforms local points to world space. A 4x4 Matrix @ 3D Vector applies the full
+    affine transform (implicit w=1), so no to_4d()/.xyz/.copy() temporaries are needed.
+    """
+    return [mat @ Vector(v) for v in local_verts]
+
+def _emit_loop(mat: Matrix, local_loop, segments: list, verts: list, indices: list) -> list[Vector]:
+    """
+    Transforms a closed local loop, appends its verts once and its edges as picking segments and
+    LINES index pairs. World verts are fresh and never mutated, so both lists share them uncopied.
+    Returns the world verts.
+    """
+    world = [mat @ Vector(v) for v in local_loop]
+    n = len(world); base = len(verts)
+    verts.extend(world)
+    for i in range(n):
+        j = (i + 1) % n
+        segments.append((world[i], world[j])); indices.append((base + i, base + j))
+    return world
+def _silhouette_side_dir(mat: Matrix, view_origin: Vector) -> Vector:
+    """
+    Direction across the view for picking cylinder/cone silhouette verts: local Z crossed with the
+    horizontal view direction. When those are parallel (axis lying along the view) the cross product
+    vanishes, so the object's local X axis is used instead of a zero vector.
+    """
+    view_d = mat.translation - view_origin
+    view_d.z = 0.0
+    view_dir = view_d.normalized() if view_d.length_squared > 1e-10 else _FALLBACK_SIDE_DIR
+    side = mat.col[2].xyz.normalized().cross(view_dir)
+    if side.length_squared < 1e-10:
+        side = mat.col[0].xyz
+    return side.normalized()
+
+def _frustum_planes(persp: Matrix) -> list:
+    """
+    Returns the six view-frustum planes of a perspective (or ortho) matrix as (normal, distance)
+    pairs with unit normals pointing inwards: a point p is outside a plane when normal.dot(p) + distance < 0.
+    """
+    r0, r1, r2, r3 = (Vector(persp[i]) for i in range(4))
+    planes = []
+    for plane in (r3 + r0, r3 - r0, r3 + r1, r3 - r1, r3 + r2, r3 - r2):
+        normal = plane.xyz; length = normal.length
+        if length > 1e-12:
+            planes.append((normal / length, plane.w / length))
+    return planes
+
+def _outline_local_radius(obj: bpy.types.Object, sdf_type_prop: str) -> float:
+    """ Radius of a local-space sphere around the origin that contains the whole outline. """
+    if sdf_type_prop == "torus":
+        return float(obj.get("sdf_torus_major_radius", 0.35)) + float(obj.get("sdf_torus_minor_radius", 0.15))
+    if sdf_type_prop == "text":
+        return len(obj.get("sdf_text_string", constants.DEFAULT_SOURCE_SETTINGS["sdf_text_string"])) * 0.35 + 0.5
+    return 1.5 # Unit primitives, cone/pyramid apex at z=1 and the 2x2 half-space plane with its arrow
+
 def offset_vertices(vertices, region_data: bpy.types.RegionView3D, camera_loc: Vector, offset_factor: float) -> list:
     """
     Offsets vertices slightly to mitigate depth fighting.
@@ -42,57 +178,84 @@ def offset_vertices(vertices, region_data: bpy.types.RegionView3D, camera_loc: V
     Requires region_data (region_3d) to determine projection type.
     Returns a list of Vectors or original vertices if input is empty/invalid.
     """
-    offset_verts = []
     if not vertices or not region_data:
         return vertices
 
     is_persp = getattr(region_data, 'is_perspective', True)
-    view_direction_ortho = None
     if not is_persp:
         try:
-            view_direction_ortho = -region_data.view_matrix.col[2].xyz.normalized()
+            ortho_offset = -region_data.view_matrix.col[2].xyz.normalized() * offset_factor
         except (AttributeError, TypeError, ValueError, Exception) as e:
-             view_direction_ortho = None
+            ortho_offset = None
+        # One constant offset for every vertex
+        if ortho_offset is not None and ortho_offset.length_squared > 1e-9:
+            return [Vector(v) + ortho_offset for v in vertices]
+        return [Vector(v) for v in vertices]
 
-    for v in vertices:
-        v_vec = Vector(v) if not isinstance(v, Vector) else v.copy()
-        offset_dir = None
-        if is_persp:
-            if camera_loc:
-                view_dir_unnormalized = camera_loc - v_vec
-                if view_dir_unnormalized.length_squared > 1e-9:
-                     offset_dir = view_dir_unnormalized.normalized()
-        elif view_direction_ortho:
-            offset_dir = view_direction_ortho
-
-        if offset_dir and offset_dir.length_squared > 1e-9:
-            offset_v = v_vec + offset_dir * offset_factor
-            offset_verts.append(offset_v)
-        else:
-            offset_verts.append(v_vec)
+    if not camera_loc:
+        return [Vector(v) for v in vertices]
 
+    offset_verts = []
+    append = offset_verts.append
+    for v in vertices:
+        v_vec = Vector(v)
+        to_cam = camera_loc - v_vec
+        len_sq = to_cam.length_squared
+        if len_sq > 1e-9:
+            to_cam *= offset_factor / math.sqrt(len_sq)
+            v_vec += to_cam
+        append(v_vec)
     return offset_verts
 
+def _iter_view3d_areas(window_manager):
+    """ Yields the VIEW_3D areas of all windows, scanned on each call since areas can be split, joined or retyped. """
+    for window in window_manager.windows:
+        screen = getattr(window, 'screen', None)
+        if not screen: continue
+        for area in screen.areas:
+            if area.type == 'VIEW_3D': yield area
+
+def mark_outlines_dirty():
+    """Makes the next draw re-gather outlines instead of reusing the last frame."""
+    global _scene_generation
+    _scene_generation += 1
+
 def tag_redraw_all_view3d():
     """Forces redraw of all 3D views. Safe against context issues."""
+    mark_outlines_dirty()
     context = bpy.context
     if not context or not context.window_manager: return
     try:
-        for window in context.window_manager.windows:
-            screen = getattr(window, 'screen', None)
-            if not screen: continue
-            for area in getattr(screen, 'areas', []):
-                if area.type == 'VIEW_3D':
-                    tag_func = getattr(area, 'tag_redraw', None)
-                    if tag_func:
-                        try: tag_func()
-                        except Exception: pass
+        for area in _iter_view3d_areas(context.window_manager):
+            try: area.tag_redraw()
+            except Exception: pass
     except Exception: pass
 
+def get_line_shader():
+    """Returns the outline shader, fetching it (and the gpu modules) on first use."""
+    global _line_shader
+    if _line_shader is None:
+        _ensure_gpu_modules()
+        _line_shader = gpu.shader.from_builtin('POLYLINE_SMOOTH_COLOR')
+    return _line_shader
+
+def release_line_shader():
+    global _line_shader
+    _line_shader = None
+    _merged_batches.clear() # Batches reference the shader's attribute layout
+
+def clear_batch_cache():
+    """Drops cached outline geometry and GPU batches (e.g. on file load)."""
+    global _last_frame_key
+    _batch_cache.clear()
+    _merged_batches.clear()
+    _last_frame_key = None
+
 def clear_draw_data():
     """Clears the internal write buffer and the shared WM property."""
-    global _draw_line_data_write
+    global _draw_line_data_write, _last_frame_key
     _draw_line_data_write.clear()
+    _last_frame_key = None # The next frame must write the picking data again
 
     wm = getattr(bpy.context, 'window_manager', None)
     if wm and "fieldforge_draw_data" in wm:
@@ -102,11 +265,192 @@ def clear_draw_data():
             pass
 
 
+def _build_outline_geometry(obj: bpy.types.Object, sdf_type_prop: str, mat: Matrix, camera_location: Vector):
+    """
+    Builds world-space outline data for one source. camera_location is the (non-None)
+    point cylinder/cone silhouette edges are computed against.
+    Returns (picking segments, world verts, LINES index pairs into them), or None if nothing should be drawn.
+    """
+    line_segments_for_picking_for_this_obj = []
+    # Every shape is drawn as indexed LINES: unique world verts plus (i, j) index pairs into them
+    world_verts = []
+    indices_for_batch = []
+
+    # Cube
+    if sdf_type_prop == "cube":
+        indices_for_batch.extend(_UNIT_CUBE_INDICES)
+        world_verts.extend(mat @ v for v in _UNIT_CUBE_VERTS)
+        # Indices are static and in range; the world verts are never mutated, so no copies needed
+        line_segments_for_picking_for_this_obj.extend((world_verts[i], world_verts[j]) for i, j in indices_for_batch)
+    # Sphere
+    elif sdf_type_prop == "sphere":
+        for local_v_loop in _UNIT_SPHERE_LOOPS:
+            _emit_loop(mat, local_v_loop, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+    # Cylinder
+    elif sdf_type_prop == "cylinder":
+        seg=16; l_top, l_bot = utils.create_unit_cylinder_cap_vertices(seg)
+        top_base = len(world_verts)
+        w_top_cyl=_emit_loop(mat, l_top, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+        w_bot_cyl=_emit_loop(mat, l_bot, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+        if w_top_cyl and w_bot_cyl: # Both caps non-empty, so max()/min() below always have candidates
+            r_dir = _silhouette_side_dir(mat, camera_location)
+            # Each bottom vert is its top vert minus the local Z column, which is parallel to
+            # the local Z axis and so orthogonal to r_dir: the silhouette index is the same for both caps.
+            dots = [v.dot(r_dir) for v in w_top_cyl]
+            i_max = max(range(len(dots)), key=dots.__getitem__); i_min = min(range(len(dots)), key=dots.__getitem__)
+            t_pr=w_top_cyl[i_max]; b_pr=w_bot_cyl[i_max]; t_pl=w_top_cyl[i_min]; b_pl=w_bot_cyl[i_min]
+            bot_base = top_base + len(w_top_cyl)
+            line_segments_for_picking_for_this_obj.append((t_pr, b_pr))
+            line_segments_for_picking_for_this_obj.append((t_pl, b_pl))
+            indices_for_batch.extend(((top_base + i_max, bot_base + i_max), (top_base + i_min, bot_base + i_min)))
+    # Cone
+    elif sdf_type_prop == "cone":
+        seg=16 # Unit cone: base circle at local z=0 (as generated), apex at z=1
+        cone_base = len(world_verts)
+        w_bot_cone=_emit_loop(mat, utils.create_unit_circle_vertices_xy(seg), line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+        # Affine matrix: the point (0,0,1) lands at translation + local Z column, no 4D product needed
+        w_apex_cone = mat.translation + mat.col[2].xyz
+        if w_bot_cone: # Non-empty base loop, so max()/min() below always have candidates
+            right_dir_cone = _silhouette_side_dir(mat, camera_location)
+            dots = [v.dot(right_dir_cone) for v in w_bot_cone]
+            i_max = max(range(len(dots)), key=dots.__getitem__); i_min = min(range(len(dots)), key=dots.__getitem__)
+            apex_index = len(world_verts); world_verts.append(w_apex_cone)
+            line_segments_for_picking_for_this_obj.append((w_apex_cone, w_bot_cone[i_max]))
+            line_segments_for_picking_for_this_obj.append((w_apex_cone, w_bot_cone[i_min]))
+            indices_for_batch.extend(((apex_index, cone_base + i_max), (apex_index, cone_base + i_min)))
+    # Pyramid
+    elif sdf_type_prop == "pyramid":
+        pyramid_base = len(world_verts)
+        world_base_verts_pyramid = _emit_loop(mat, _UNIT_PYRAMID_BASE, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+        world_apex_pyramid = mat @ Vector(_UNIT_PYRAMID_APEX)
+        apex_index = len(world_verts); world_verts.append(world_apex_pyramid)
+
+        for i, v_base in enumerate(world_base_verts_pyramid):
+            line_segments_for_picking_for_this_obj.append((v_base, world_apex_pyramid))
+            indices_for_batch.append((pyramid_base + i, apex_index))
+    # Rounded box
+    elif sdf_type_prop == "rounded_box":
+        cs = 4
+        roundness_prop = obj.get("sdf_round_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_round_radius"])
+        effective_prop_for_draw = min(max(roundness_prop, 0.0), 0.5)
+        internal_draw_radius = effective_prop_for_draw * (0.25 / 0.5)
+
+        for right, up in _ROUNDED_BOX_PLANES: # Loops come from utils' cached plane generator
+            local_v_loop = utils.create_unit_rounded_rectangle_plane(right, up, internal_draw_radius, cs)
+            _emit_loop(mat, local_v_loop, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+    # Circle
+    elif sdf_type_prop == "circle":
+        seg_circle=24; local_v_circle=utils.create_unit_circle_vertices_xy(seg_circle)
+        _emit_loop(mat, local_v_circle, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+    # Ring
+    elif sdf_type_prop == "ring":
+        seg_ring=24; r_o_ring=0.5; 
+        r_i_prop_ring = obj.get("sdf_inner_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_inner_radius"])
+        r_i_ring = max(0.0, min(float(r_i_prop_ring), r_o_ring - 1e-5))
+        l_outer_local_xy_ring=utils.create_unit_circle_vertices_xy(seg_ring)
+        l_inner_local_xy_ring=[(v[0]*r_i_ring/r_o_ring, v[1]*r_i_ring/r_o_ring, 0.0) for v in l_outer_local_xy_ring] if r_i_ring > 1e-6 else []
+        _emit_loop(mat, l_outer_local_xy_ring, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+        _emit_loop(mat, l_inner_local_xy_ring, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+    # Polygon
+    elif sdf_type_prop == "polygon":
+        sides_poly = max(3, obj.get("sdf_sides", constants.DEFAULT_SOURCE_SETTINGS["sdf_sides"]))
+        local_v_poly=utils.create_unit_polygon_vertices_xy(sides_poly)
+        _emit_loop(mat, local_v_poly, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+    # Text
+    elif sdf_type_prop == "text":
+        text_string = obj.get("sdf_text_string", constants.DEFAULT_SOURCE_SETTINGS["sdf_text_string"])
+        if not text_string.strip(): return None # Don't draw if empty
+
+        # Approximate unit bounds for text (height ~1, width estimated)
+        # This matches the rough centering in reconstruct_shape
+        num_chars = len(text_string)
+        est_unit_width = num_chars * 0.7  # Very rough estimate
+        est_unit_height = 1.0 # Based on libfive's font definition
+
+        half_w = est_unit_width / 2.0
+        half_h = est_unit_height / 2.0
+
+        # Local corners of the bounding box (2D in XY plane, centered around where text starts)
+        # The text in reconstruct_shape starts at (-est_width/2, -0.5)
+        # So the box should be relative to that.
+        # If text starts at (sx, sy) and has width w, height h, then box is
+        # (sx, sy), (sx+w, sy), (sx+w, sy+h), (sx, sy+h)
+        # Our start_pos_x = -half_w, start_pos_y = -0.5 (baseline)
+        # So, local corners are approximately:
+        # (-half_w, -0.5) , (half_w, -0.5), (half_w, 0.5), (-half_w, 0.5)
+        # This centers the box horizontally and makes its vertical center at y=0
+        local_rect_verts = (
+            (-half_w, -half_h, 0.0), ( half_w, -half_h, 0.0),
+            ( half_w,  half_h, 0.0), (-half_w,  half_h, 0.0)
+        )
+        _emit_loop(mat, local_rect_verts, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+    # Half space
+    elif sdf_type_prop == "half_space":
+        # Plane corners and arrow points go through one transform call; both tables are module constants
+        world_verts.extend(_to_world(mat, _HALF_SPACE_LOCAL_POINTS))
+        indices_for_batch.extend(_HALF_SPACE_PLANE_LINES + _HALF_SPACE_ARROW_LINES)
+        line_segments_for_picking_for_this_obj.extend((world_verts[i], world_verts[j]) for i, j in indices_for_batch)
+    # Torus
+    elif sdf_type_prop == "torus":
+        r_maj_torus=max(0.01,float(obj.get("sdf_torus_major_radius",0.35))) # Ensure float conversion
+        r_min_torus=max(0.005,float(obj.get("sdf_torus_minor_radius",0.15))) # Ensure float conversion
+        r_min_torus=min(r_min_torus, r_maj_torus-1e-5)
+
+        l_main_local_torus, l_minor_rings_local_torus = _torus_loops(r_maj_torus, r_min_torus)
+
+        # Main ring, then the four minor cross-section rings
+        for local_v_loop in (l_main_local_torus, *l_minor_rings_local_torus):
+            _emit_loop(mat, local_v_loop, line_segments_for_picking_for_this_obj, world_verts, indices_for_batch)
+
+    return line_segments_for_picking_for_this_obj, world_verts, indices_for_batch
+
+def _draw_merged_outlines(context, area, shader, selected_parts: list, active_parts: list):
+    """
+    Sets up GPU state, draws every selected/active outline as one LINES batch and restores state.
+    The batch is rebuilt only when its members, their colors or a member's geometry build id changed.
+    """
+    # --- Get Theme Colors ---
+    select_color_rgba = (1.0, 0.65, 0.0, 0.9); active_color_rgba = (1.0, 1.0, 1.0, 0.95)
+    try:
+        theme = context.preferences.themes[0]; select_rgb = theme.view_3d.object_selected; active_rgb = theme.view_3d.object_active
+        if select_rgb and len(select_rgb) >= 3: select_color_rgba = (*select_rgb[:3], 0.9)
+        if active_rgb and len(active_rgb) >= 3: active_color_rgba = (*active_rgb[:3], 0.95)
+    except Exception: pass
+
+    # --- Setup Shader & GPU State ---
+    old_blend=gpu.state.blend_get(); old_line_width=gpu.state.line_width_get(); old_depth_test=gpu.state.depth_test_get()
+    gpu.state.blend_set('ALPHA'); gpu.state.depth_test_set('LESS_EQUAL')
+    try:
+        active_region = next((reg for reg in getattr(area, 'regions', []) if reg.type == 'WINDOW'), None)
+        win_size = (active_region.width, active_region.height) if active_region and active_region.width > 0 and active_region.height > 0 else (max(1, context.window.width), max(1, context.window.height))
+        shader.bind(); shader.uniform_float("viewportSize", win_size); shader.uniform_float("lineWidth", 1.0)
+
+        # Selected first, active last so it stays on top; color travels as a per-vertex attribute
+        parts = [(name, entry, select_color_rgba) for name, entry in selected_parts]
+        parts += [(name, entry, active_color_rgba) for name, entry in active_parts]
+        members = tuple((name, entry[5], color) for name, entry, color in parts)
+        merged = _merged_batches.get('OUTLINES')
+        if merged is None or merged[0] != members:
+            merged_pos = []; merged_col = []; merged_idx = []
+            for _, entry, color in parts:
+                base = len(merged_pos)
+                merged_pos.extend(entry[4]); merged_col.extend([color] * len(entry[4]))
+                merged_idx.extend((base + i, base + j) for i, j in entry[3])
+            merged = (members, batch_for_shader(shader, 'LINES', {"pos": merged_pos, "color": merged_col}, indices=merged_idx))
+            _merged_batches['OUTLINES'] = merged
+        merged[1].draw(shader)
+    except Exception as e:
+        print(f"FF Draw ERROR: Outline draw failed: {e}")
+    finally: # Restore state
+        if old_line_width is not None: gpu.state.line_width_set(old_line_width)
+        if old_blend is not None: gpu.state.blend_set(old_blend)
+        if old_depth_test is not None: gpu.state.depth_test_set(old_depth_test)
+
 # --- Main Draw Callback ---
 
 def ff_draw_callback():
     """Draw callback function - Iterates through scene objects using bpy.context"""
-    global _draw_line_data_write # Access write buffer
+    global _draw_line_data_write, _batch_build_counter, _last_frame_key, _last_frame_parts # Access write buffer
     context = bpy.context
     wm = getattr(context, 'window_manager', None) # Get WM early
     scene = getattr(context, 'scene', None)
@@ -124,371 +468,118 @@ def ff_draw_callback():
                          if space_data: area = area_iter; break
     if not space_data: return
     region_3d = getattr(space_data, 'region_3d', None)
-    if not scene or not region_3d: return
+    current_view_layer = getattr(context, 'view_layer', None)
+    if not scene or not region_3d or not current_view_layer: return
+    overlay_source_names = utils.get_overlay_source_names(scene)
+    if not overlay_source_names: # No Bounds shows source visuals; nothing to draw or pick
+        if wm and "fieldforge_draw_data" in wm: clear_draw_data()
+        clear_batch_cache()
+        return
 
     try:
         view_matrix_inv = region_3d.view_matrix.inverted(); camera_location = view_matrix_inv.translation
     except Exception: camera_location = None
 
-    # --- Get Theme Colors ---
-    select_color_rgba = (1.0, 0.65, 0.0, 0.9); active_color_rgba = (1.0, 1.0, 1.0, 0.95)
-    try:
-        theme = context.preferences.themes[0]; select_rgb = theme.view_3d.object_selected; active_rgb = theme.view_3d.object_active
-        if select_rgb and len(select_rgb) >= 3: select_color_rgba = (*select_rgb[:3], 0.9)
-        if active_rgb and len(active_rgb) >= 3: active_color_rgba = (*active_rgb[:3], 0.95)
-    except Exception: pass
-
-    # --- Setup Shader & GPU State ---
-    try: shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+    try: shader = get_line_shader()
     except Exception: print("FF Draw ERROR: Shader not found."); return
-    old_blend=gpu.state.blend_get(); old_line_width=gpu.state.line_width_get(); old_depth_test=gpu.state.depth_test_get()
-    gpu.state.blend_set('ALPHA'); gpu.state.depth_test_set('LESS_EQUAL')
-    try:
-        active_region = next((reg for reg in getattr(area, 'regions', []) if reg.type == 'WINDOW'), None)
-        win_size = (active_region.width, active_region.height) if active_region and active_region.width > 0 and active_region.height > 0 else (max(1, context.window.width), max(1, context.window.height))
-        shader.bind(); shader.uniform_float("viewportSize", win_size); shader.uniform_float("lineWidth", 1.0)
-    except Exception as e:
-        print(f"FF Draw ERROR: Shader setup failed: {e}")
-        if old_line_width is not None: gpu.state.line_width_set(old_line_width);
-        if old_blend is not None: gpu.state.blend_set(old_blend);
-        if old_depth_test is not None: gpu.state.depth_test_set(old_depth_test); return
 
     DEPTH_OFFSET_FACTOR = 0.01
 
+    active_object = getattr(current_view_layer.objects, 'active', None)
+
+    scene_objects = scene.objects
+    # Offsets and cylinder/cone silhouettes depend on the view, so it is part of every cache state
+    try: view_key = (region_3d.is_perspective, tuple(map(tuple, region_3d.view_matrix)))
+    except Exception: view_key = object() # Unknown view: never matches, so nothing is reused
+
+    # Off-screen sources are skipped. Picking data comes from the last drawn view, so this only
+    # applies when a single, non-quad 3D view exists (other views could still need the culled outlines).
+    frustum = None
+    view3d_areas = _iter_view3d_areas(wm) if wm else iter(())
+    single_view = next(view3d_areas, None) is not None and next(view3d_areas, None) is None # Stops at the second view
+    if single_view and not getattr(space_data, 'region_quadviews', None):
+        try: frustum = _frustum_planes(region_3d.perspective_matrix)
+        except Exception: frustum = None
+
+    # Static scene and view: nothing was tagged since the last full frame, so redraw its outlines as-is
+    # (picking data in the WM property is still current). With culling, lens/zoom/clipping and region
+    # size change the frustum without touching view_matrix, so the projection is part of the key too.
+    frame_key = (_scene_generation, view_key, scene.name, current_view_layer.name, scene.frame_current,
+                 active_object.name if active_object else None,
+                 tuple(map(tuple, region_3d.perspective_matrix)) if frustum else None)
+    if frame_key == _last_frame_key:
+        if _last_frame_parts[0] or _last_frame_parts[1]:
+            _draw_merged_outlines(context, area, shader, *_last_frame_parts)
+        return
+
     # --- Prepare Data Storage ---
     _draw_line_data_write.clear() # Clear the WRITE buffer
-    active_object = getattr(context.view_layer.objects, 'active', None)
-
-    # --- Gather data loop ---
-    for obj in scene.objects:
+    seen_names = set()
+    # Resolved once per frame for every cylinder/cone silhouette
+    silhouette_origin = camera_location if camera_location else _FALLBACK_VIEW_ORIGIN
+    selected_parts = []; active_parts = [] # (source name, cache entry) with offset line verts to draw
+
+    # --- Gather data loop (only sources under Bounds that show visuals) ---
+    for obj_name in overlay_source_names:
+        obj = scene_objects.get(obj_name)
         try:
-            current_view_layer = getattr(context, 'view_layer', None)
-            if not obj or not current_view_layer or not obj.visible_get(view_layer=current_view_layer): continue
-            if not utils.is_sdf_source(obj): continue
-            parent_bounds = utils.find_parent_bounds(obj)
-            if not parent_bounds or not utils.get_bounds_setting(parent_bounds, "sdf_show_source_empties"): continue
+            if not obj or not obj.visible_get(view_layer=current_view_layer): continue
             sdf_type_prop = obj.get("sdf_type", "NONE");
             if sdf_type_prop == "NONE": continue
 
             obj_name=obj.name; is_selected=obj.select_get(); is_active=(active_object==obj)
 
-            line_segments_for_picking_for_this_obj = []
-            # This list will store all vertices for drawing this object if it's selected/active
-            # For indexed shapes like cube, this won't be used directly for batch creation.
-            all_world_verts_for_batch_if_selected = [] 
-            
-            # Specific storage for indexed shapes (like cube)
-            indexed_world_verts = None # e.g., list of Vector for cube vertices
-            indices_for_batch = None   # e.g., constants.unit_cube_indices
-
             mat=obj.matrix_world
-            primitive_type='LINES'
-
-            # --- Generate Geometry Data ---
-            # Cube
-            if sdf_type_prop == "cube":
-                indices_for_batch = constants.unit_cube_indices # Store for later
-                local_verts=[Vector(v) for v in constants.unit_cube_verts]
-                indexed_world_verts =[(mat @ v.to_4d()).xyz.copy() for v in local_verts] # Store for later
-                if indexed_world_verts:
-                    for i,j in indices_for_batch:
-                        if i<len(indexed_world_verts) and j<len(indexed_world_verts): 
-                            line_segments_for_picking_for_this_obj.append((indexed_world_verts[i].copy(), indexed_world_verts[j].copy()))
-            # Sphere
-            elif sdf_type_prop == "sphere":
-                seg=24; r=0.5; lx=Vector((1,0,0)); ly=Vector((0,1,0)); lz=Vector((0,0,1))
-                loops=[[(lx*math.cos(a)+ly*math.sin(a))*r for a in [(i/seg)*2*math.pi for i in range(seg)]],
-                       [(ly*math.cos(a)+lz*math.sin(a))*r for a in [(i/seg)*2*math.pi for i in range(seg)]],
-                       [(lx*math.cos(a)+lz*math.sin(a))*r for a in [(i/seg)*2*math.pi for i in range(seg)]]]
-                for local_v_loop in loops:
-                    if not local_v_loop: continue
-                    world_l=[(mat @ Vector(v).to_4d()).xyz.copy() for v in local_v_loop] 
-                    if world_l:
-                        for i in range(len(world_l)): 
-                            v1=world_l[i]; v2=world_l[(i+1)%len(world_l)]
-                            line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                            all_world_verts_for_batch_if_selected.extend([v1,v2])
-            # Cylinder
-            elif sdf_type_prop == "cylinder":
-                seg=16; l_top, l_bot = utils.create_unit_cylinder_cap_vertices(seg)
-                w_top_cyl=[(mat @ Vector(v).to_4d()).xyz.copy() for v in l_top]; 
-                w_bot_cyl=[(mat @ Vector(v).to_4d()).xyz.copy() for v in l_bot]
-                if w_top_cyl:
-                    for i in range(len(w_top_cyl)): 
-                        v1=w_top_cyl[i]; v2=w_top_cyl[(i+1)%len(w_top_cyl)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1,v2])
-                if w_bot_cyl:
-                    for i in range(len(w_bot_cyl)): 
-                        v1=w_bot_cyl[i]; v2=w_bot_cyl[(i+1)%len(w_bot_cyl)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1,v2])
-                if w_top_cyl and w_bot_cyl: 
-                    try:
-                        z_ax=mat.col[2].xyz.normalized()
-                        obj_loc_cyl = mat.translation
-                        view_origin = camera_location if camera_location else Vector((0,0,10)) 
-                        view_d=(obj_loc_cyl - view_origin)
-                        view_d.z=0; 
-                        view_dir_normalized = view_d.normalized() if view_d.length > 1e-5 else Vector((1,0,0))
-                        r_dir=z_ax.cross(view_dir_normalized).normalized()
-                        t_max=-float('inf'); b_max=-float('inf'); t_min=float('inf'); b_min=float('inf')
-                        t_pr=w_top_cyl[0]; t_pl=w_top_cyl[0]; b_pr=w_bot_cyl[0]; b_pl=w_bot_cyl[0]
-                        for i in range(len(w_top_cyl)): 
-                            dt=w_top_cyl[i].dot(r_dir); db=w_bot_cyl[i].dot(r_dir) 
-                            if dt > t_max: t_max = dt; t_pr = w_top_cyl[i]
-                            if dt < t_min: t_min = dt; t_pl = w_top_cyl[i]
-                            if db > b_max: b_max = db; b_pr = w_bot_cyl[i]
-                            if db < b_min: b_min = db; b_pl = w_bot_cyl[i]
-                        sides_d_cyl=[t_pr, b_pr, t_pl, b_pl] # Corrected order for two lines
-                        line_segments_for_picking_for_this_obj.append((t_pr.copy(), b_pr.copy()))
-                        line_segments_for_picking_for_this_obj.append((t_pl.copy(), b_pl.copy()))
-                        all_world_verts_for_batch_if_selected.extend(sides_d_cyl)
-                    except Exception as e_calc: print(f"FF Draw Calc Error (Cyl Sides): {obj_name} - {e_calc}")
-            # Cone
-            elif sdf_type_prop == "cone":
-                seg=16; h_draw_cone=1.0; apex_z_local_cone=h_draw_cone; base_z_local_cone=0.0; 
-                l_bot_raw_cone=utils.create_unit_circle_vertices_xy(seg)
-                l_bot_transformed_z_cone = [(v[0], v[1], base_z_local_cone) for v in l_bot_raw_cone]
-                w_bot_cone=[(mat @ Vector(v).to_4d()).xyz.copy() for v in l_bot_transformed_z_cone]
-                if w_bot_cone:
-                    for i in range(len(w_bot_cone)): 
-                        v1=w_bot_cone[i]; v2=w_bot_cone[(i+1)%len(w_bot_cone)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1,v2])
-                w_apex_cone = (mat @ Vector((0,0,apex_z_local_cone)).to_4d()).xyz.copy()
-                if w_bot_cone: 
-                    try:
-                        obj_loc_cone = mat.translation
-                        center_base_cone=(mat @ Vector((0,0,base_z_local_cone)).to_4d()).xyz
-                        view_origin_cone = camera_location if camera_location else Vector((0,0,10))
-                        view_dir_cone=(obj_loc_cone - view_origin_cone)
-                        view_dir_cone.z=0; 
-                        view_dir_normalized_cone = view_dir_cone.normalized() if view_dir_cone.length > 1e-5 else Vector((1,0,0))
-                        z_axis_cone=mat.col[2].xyz.normalized()
-                        right_dir_cone=z_axis_cone.cross(view_dir_normalized_cone).normalized()
-                        b_max_cone=-float('inf'); b_min_cone=float('inf')
-                        b_pr_cone=w_bot_cone[0]; b_pl_cone=w_bot_cone[0];
-                        for v_base_world_cone in w_bot_cone:
-                            db_cone = v_base_world_cone.dot(right_dir_cone)
-                            if db_cone > b_max_cone: b_max_cone = db_cone; b_pr_cone = v_base_world_cone
-                            if db_cone < b_min_cone: b_min_cone = db_cone; b_pl_cone = v_base_world_cone
-                        sides_d_cone=[w_apex_cone, b_pr_cone, w_apex_cone, b_pl_cone]
-                        line_segments_for_picking_for_this_obj.append((w_apex_cone.copy(), b_pr_cone.copy()))
-                        line_segments_for_picking_for_this_obj.append((w_apex_cone.copy(), b_pl_cone.copy()))
-                        all_world_verts_for_batch_if_selected.extend(sides_d_cone)
-                    except Exception as e_calc: print(f"FF Draw Calc Error (Cone Sides): {obj_name} - {e_calc}")
-            # Pyramid
-            elif sdf_type_prop == "pyramid":
-                local_base_verts_pyramid = [
-                    Vector((-0.5, -0.5, 0.0)), Vector(( 0.5, -0.5, 0.0)),
-                    Vector(( 0.5,  0.5, 0.0)), Vector((-0.5,  0.5, 0.0))
-                ]
-                local_apex_pyramid = Vector((0.0, 0.0, 1.0))
-
-                world_base_verts_pyramid = [(mat @ v.to_4d()).xyz.copy() for v in local_base_verts_pyramid]
-                world_apex_pyramid = (mat @ local_apex_pyramid.to_4d()).xyz.copy()
-
-                for i in range(len(world_base_verts_pyramid)):
-                    v1 = world_base_verts_pyramid[i]
-                    v2 = world_base_verts_pyramid[(i + 1) % len(world_base_verts_pyramid)]
-                    line_segments_for_picking_for_this_obj.append((v1.copy(), v2.copy()))
-                    all_world_verts_for_batch_if_selected.extend([v1, v2])
-                
-                for v_base in world_base_verts_pyramid:
-                    line_segments_for_picking_for_this_obj.append((v_base.copy(), world_apex_pyramid.copy()))
-                    all_world_verts_for_batch_if_selected.extend([v_base, world_apex_pyramid])
-            # Rounded box
-            elif sdf_type_prop == "rounded_box":
-                cs = 4
-                roundness_prop = obj.get("sdf_round_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_round_radius"])
-                effective_prop_for_draw = min(max(roundness_prop, 0.0), 0.5)
-                internal_draw_radius = effective_prop_for_draw * (0.25 / 0.5)
-
-                lx = Vector((1, 0, 0)); ly = Vector((0, 1, 0)); lz = Vector((0, 0, 1))
-                loops = [
-                    utils.create_unit_rounded_rectangle_plane(lx, ly, internal_draw_radius, cs), # XY
-                    utils.create_unit_rounded_rectangle_plane(lx, lz, internal_draw_radius, cs), # XZ
-                    utils.create_unit_rounded_rectangle_plane(ly, lz, internal_draw_radius, cs), # YZ
-                ]
-                for local_v_loop in loops:
-                    if not local_v_loop: continue
-                    world_loop = [(mat @ Vector(v).to_4d()).xyz.copy() for v in local_v_loop]
-                    if world_loop:
-                        for i in range(len(world_loop)):
-                            v1 = world_loop[i]
-                            v2 = world_loop[(i + 1) % len(world_loop)]
-                            line_segments_for_picking_for_this_obj.append((v1.copy(), v2.copy()))
-                            all_world_verts_for_batch_if_selected.extend([v1, v2])
-            # Circle
-            elif sdf_type_prop == "circle":
-                seg_circle=24; local_v_circle=utils.create_unit_circle_vertices_xy(seg_circle)
-                world_o_circle=[(mat @ Vector(v).to_4d()).xyz.copy() for v in local_v_circle]
-                if world_o_circle:
-                    for i in range(len(world_o_circle)): 
-                        v1=world_o_circle[i]; v2=world_o_circle[(i+1)%len(world_o_circle)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1,v2])
-            # Ring
-            elif sdf_type_prop == "ring":
-                seg_ring=24; r_o_ring=0.5; 
-                r_i_prop_ring = obj.get("sdf_inner_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_inner_radius"])
-                r_i_ring = max(0.0, min(float(r_i_prop_ring), r_o_ring - 1e-5))
-                l_outer_local_xy_ring=utils.create_unit_circle_vertices_xy(seg_ring)
-                l_inner_local_xy_ring=[(v[0]*r_i_ring/r_o_ring, v[1]*r_i_ring/r_o_ring, 0.0) for v in l_outer_local_xy_ring] if r_i_ring > 1e-6 else []
-                w_outer_ring=[(mat @ Vector(v).to_4d()).xyz.copy() for v in l_outer_local_xy_ring]; 
-                w_inner_ring=[(mat @ Vector(v).to_4d()).xyz.copy() for v in l_inner_local_xy_ring]
-                if w_outer_ring:
-                    for i in range(len(w_outer_ring)): 
-                        v1=w_outer_ring[i]; v2=w_outer_ring[(i+1)%len(w_outer_ring)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1,v2])
-                if w_inner_ring:
-                    for i in range(len(w_inner_ring)): 
-                        v1=w_inner_ring[i]; v2=w_inner_ring[(i+1)%len(w_inner_ring)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1,v2])
-            # Polygon
-            elif sdf_type_prop == "polygon":
-                sides_poly = max(3, obj.get("sdf_sides", constants.DEFAULT_SOURCE_SETTINGS["sdf_sides"]))
-                local_v_poly=utils.create_unit_polygon_vertices_xy(sides_poly)
-                world_o_poly=[(mat @ Vector(v).to_4d()).xyz.copy() for v in local_v_poly]
-                if world_o_poly:
-                    for i in range(len(world_o_poly)): 
-                        v1=world_o_poly[i]; v2=world_o_poly[(i+1)%len(world_o_poly)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1,v2])
-            # Text
-            elif sdf_type_prop == "text":
-                text_string = obj.get("sdf_text_string", constants.DEFAULT_SOURCE_SETTINGS["sdf_text_string"])
-                if not text_string.strip(): continue # Don't draw if empty
-
-                # Approximate unit bounds for text (height ~1, width estimated)
-                # This matches the rough centering in reconstruct_shape
-                num_chars = len(text_string)
-                est_unit_width = num_chars * 0.7  # Very rough estimate
-                est_unit_height = 1.0 # Based on libfive's font definition
-
-                half_w = est_unit_width / 2.0
-                half_h = est_unit_height / 2.0
-
-                # Local corners of the bounding box (2D in XY plane, centered around where text starts)
-                # The text in reconstruct_shape starts at (-est_width/2, -0.5)
-                # So the box should be relative to that.
-                # If text starts at (sx, sy) and has width w, height h, then box is
-                # (sx, sy), (sx+w, sy), (sx+w, sy+h), (sx, sy+h)
-                # Our start_pos_x = -half_w, start_pos_y = -0.5 (baseline)
-                # So, local corners are approximately:
-                # (-half_w, -0.5) , (half_w, -0.5), (half_w, 0.5), (-half_w, 0.5)
-                # This centers the box horizontally and makes its vertical center at y=0
-                local_rect_verts = [
-                    Vector((-half_w, -half_h, 0.0)), Vector(( half_w, -half_h, 0.0)),
-                    Vector(( half_w,  half_h, 0.0)), Vector((-half_w,  half_h, 0.0))
-                ]
-                
-                world_rect_verts = [(mat @ v.to_4d()).xyz.copy() for v in local_rect_verts]
-
-                if world_rect_verts:
-                    for i in range(len(world_rect_verts)):
-                        v1 = world_rect_verts[i]
-                        v2 = world_rect_verts[(i + 1) % len(world_rect_verts)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(), v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1, v2])
-            # Half space
-            elif sdf_type_prop == "half_space":
-                draw_plane_size_hs=2.0; arrow_len_factor_hs=0.5 
-                plane_verts_local_hs = [
-                    Vector(( draw_plane_size_hs/2,  draw_plane_size_hs/2, 0)), Vector((-draw_plane_size_hs/2,  draw_plane_size_hs/2, 0)),
-                    Vector((-draw_plane_size_hs/2, -draw_plane_size_hs/2, 0)), Vector(( draw_plane_size_hs/2, -draw_plane_size_hs/2, 0)) ]
-                plane_verts_world_hs = [(mat @ v.to_4d()).xyz for v in plane_verts_local_hs]
-                if plane_verts_world_hs:
-                    for i in range(len(plane_verts_world_hs)): 
-                        v1=plane_verts_world_hs[i]; v2=plane_verts_world_hs[(i+1)%len(plane_verts_world_hs)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1,v2])
-                arrow_start_local_hs = Vector((0,0,0)); arrow_end_local_hs = Vector((0,0, arrow_len_factor_hs))
-                arrow_start_world_hs = (mat @ arrow_start_local_hs.to_4d()).xyz; arrow_end_world_hs = (mat @ arrow_end_local_hs.to_4d()).xyz
-                arrow_head_size_hs = arrow_len_factor_hs * 0.2
-                ah1_local_hs = Vector(( arrow_head_size_hs,0,arrow_len_factor_hs-arrow_head_size_hs*1.5)); ah2_local_hs = Vector((-arrow_head_size_hs,0,arrow_len_factor_hs-arrow_head_size_hs*1.5))
-                ah3_local_hs = Vector((0,arrow_head_size_hs,arrow_len_factor_hs-arrow_head_size_hs*1.5)); ah4_local_hs = Vector((0,-arrow_head_size_hs,arrow_len_factor_hs-arrow_head_size_hs*1.5))
-                ah1w = (mat @ ah1_local_hs.to_4d()).xyz; ah2w = (mat @ ah2_local_hs.to_4d()).xyz; ah3w = (mat @ ah3_local_hs.to_4d()).xyz; ah4w = (mat @ ah4_local_hs.to_4d()).xyz
-                hs_arrow_lines = [
-                    (arrow_start_world_hs, arrow_end_world_hs), (arrow_end_world_hs, ah1w),
-                    (arrow_end_world_hs, ah2w), (arrow_end_world_hs, ah3w), (arrow_end_world_hs, ah4w) ]
-                for v_start, v_end in hs_arrow_lines:
-                    line_segments_for_picking_for_this_obj.append((v_start.copy(), v_end.copy()))
-                    all_world_verts_for_batch_if_selected.extend([v_start, v_end])
-            # Torus
-            elif sdf_type_prop == "torus":
-                mseg_torus=24; minor_seg_torus=12
-                r_maj_torus=max(0.01,float(obj.get("sdf_torus_major_radius",0.35))) # Ensure float conversion
-                r_min_torus=max(0.005,float(obj.get("sdf_torus_minor_radius",0.15))) # Ensure float conversion
-                r_min_torus=min(r_min_torus, r_maj_torus-1e-5)
-                
-                # Main ring
-                l_main_local_torus=[(math.cos(a)*r_maj_torus, math.sin(a)*r_maj_torus, 0.0) for a in [(i/mseg_torus)*2*math.pi for i in range(mseg_torus)]]
-                w_main_torus=[(mat @ Vector(v).to_4d()).xyz.copy() for v in l_main_local_torus]
-                if w_main_torus:
-                    for i in range(len(w_main_torus)): 
-                        v1=w_main_torus[i]; v2=w_main_torus[(i+1)%len(w_main_torus)]
-                        line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                        all_world_verts_for_batch_if_selected.extend([v1,v2])
-                
-                # Minor rings
-                if r_min_torus > 1e-5:
-                    # Original logic for l_centers, l_tangents, l_axis1
-                    l_centers_local_torus=[Vector((0,r_maj_torus,0)),Vector((0,-r_maj_torus,0)),Vector((r_maj_torus,0,0)),Vector((-r_maj_torus,0,0))]
-                    l_tangents_local_torus=[Vector((1,0,0)),Vector((-1,0,0)),Vector((0,1,0)),Vector((0,-1,0))]
-                    l_axis1_local_torus=Vector((0,0,1)) # Z-axis for XY plane circles
-
-                    for i, l_center_local in enumerate(l_centers_local_torus):
-                        l_tangent_local=l_tangents_local_torus[i]
-                        l_axis2_local=l_tangent_local.cross(l_axis1_local_torus).normalized() # Plane for minor circle
-
-                        # Generate points for this minor circle
-                        l_minor_local_points = []
-                        for j in range(minor_seg_torus):
-                            angle_minor = (j/minor_seg_torus)*2*math.pi
-                            # Point on the minor circle in its local plane, then add center
-                            point = l_center_local + (l_axis1_local_torus * math.cos(angle_minor) + l_axis2_local * math.sin(angle_minor)) * r_min_torus
-                            l_minor_local_points.append(point)
-
-                        w_minor_torus_points=[(mat @ Vector(v).to_4d()).xyz.copy() for v in l_minor_local_points]
-                        if w_minor_torus_points:
-                            for k in range(len(w_minor_torus_points)): 
-                                v1=w_minor_torus_points[k]; v2=w_minor_torus_points[(k+1)%len(w_minor_torus_points)]
-                                line_segments_for_picking_for_this_obj.append((v1.copy(),v2.copy()))
-                                all_world_verts_for_batch_if_selected.extend([v1,v2])
+
+            if frustum:
+                center = mat.translation
+                radius = _outline_local_radius(obj, sdf_type_prop) * max(mat.col[0].xyz.length, mat.col[1].xyz.length, mat.col[2].xyz.length)
+                if any(normal.dot(center) + distance < -radius for normal, distance in frustum):
+                    if obj_name in _batch_cache: seen_names.add(obj_name) # Keep its geometry for when it comes back
+                    continue
+
+            # Reuse last frame's geometry while transform and shape params (and view, for silhouettes) are unchanged
+            state = (tuple(map(tuple, mat)), sdf_type_prop, tuple(obj.get(k) for k in _OUTLINE_STATE_PROPS.get(sdf_type_prop, ())),
+                     view_key if sdf_type_prop in _VIEW_DEPENDENT_TYPES else None)
+            cached = _batch_cache.get(obj_name)
+            if cached is None or cached[0] != state:
+                outline = _build_outline_geometry(obj, sdf_type_prop, mat, silhouette_origin)
+                if outline is None:
+                    _batch_cache.pop(obj_name, None); continue
+                _batch_build_counter += 1
+                cached = [state, *outline, None, _batch_build_counter, None] # Offset verts are built lazily, only once selected
+                _batch_cache[obj_name] = cached
+            seen_names.add(obj_name)
+            line_segments_for_picking_for_this_obj = cached[1]
+
             if line_segments_for_picking_for_this_obj:
-                _draw_line_data_write[obj.name] = line_segments_for_picking_for_this_obj
+                _draw_line_data_write[obj_name] = line_segments_for_picking_for_this_obj
 
             if is_selected or is_active:
-                current_draw_color = active_color_rgba if is_active else select_color_rgba
-                batches_to_draw_for_this_obj = [] # Re-init for this object's draw pass
-                try:
-                    if sdf_type_prop == "cube" and indexed_world_verts and indices_for_batch:
-                        offset_v = offset_vertices(indexed_world_verts, region_3d, camera_location, DEPTH_OFFSET_FACTOR)
-                        batches_to_draw_for_this_obj.append(batch_for_shader(shader, primitive_type, {"pos": offset_v}, indices=indices_for_batch))
-                    elif all_world_verts_for_batch_if_selected: # For all other non-indexed shapes
-                        offset_v = offset_vertices(all_world_verts_for_batch_if_selected, region_3d, camera_location, DEPTH_OFFSET_FACTOR)
-                        batches_to_draw_for_this_obj.append(batch_for_shader(shader, primitive_type, {"pos": offset_v}))
-                except Exception as e: 
-                    print(f"FF Draw Batch Create Error ({sdf_type_prop}): {obj_name} - {e}")
-
-                if batches_to_draw_for_this_obj:
-                    shader.uniform_float("color", current_draw_color)
-                    for batch in batches_to_draw_for_this_obj:
-                        batch.draw(shader)
+                if cached[4] is None or cached[6] != view_key: # Depth offset follows the view; world verts are reused
+                    if cached[4] is not None:
+                        _batch_build_counter += 1; cached[5] = _batch_build_counter # Merged batch must pick up new offsets
+                    cached[4] = None; cached[6] = view_key
+                    if cached[2] and cached[3]: # Unique verts only; the index pairs are shared as-is
+                        cached[4] = offset_vertices(cached[2], region_3d, camera_location, DEPTH_OFFSET_FACTOR)
+                if cached[4]:
+                    (active_parts if is_active else selected_parts).append((obj_name, cached))
         except ReferenceError: continue
         except Exception as e_outer: print(f"FF Draw Error (Outer Loop): {obj.name if obj else '?'} - {type(e_outer).__name__}: {e_outer}")
 
+    # --- Draw: only touch GPU state when some source is selected/active ---
+    if selected_parts or active_parts:
+        _draw_merged_outlines(context, area, shader, selected_parts, active_parts)
+
+    # Forget sources that are no longer drawn (deleted, hidden, overlay turned off)
+    if len(_batch_cache) > len(seen_names):
+        for stale_name in [name for name in _batch_cache if name not in seen_names]:
+            del _batch_cache[stale_name]
+
     if wm: # Check if window manager is valid
         try:
             # Store a shallow copy for the operator to read
             wm["fieldforge_draw_data"] = _draw_line_data_write.copy()
+            _last_frame_key = frame_key; _last_frame_parts = (selected_parts, active_parts)
         except Exception as e_prop:
-             print(f"FF Draw ERROR: Failed to set WM property: {e_prop}")
-        finally: # Restore state
-            if old_line_width is not None: gpu.state.line_width_set(old_line_width)
-            if old_blend is not None: gpu.state.blend_set(old_blend)
-            if old_depth_test is not None: gpu.state.depth_test_set(old_depth_test)
\ No newline at end of file
+             print(f"FF Draw ERROR: Failed to set WM property: {e_prop}")
\ No newline at end of file
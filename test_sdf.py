@@ -43,7 +43,7 @@ else:
 
 # 2. Add the Sphere SDF Source
 print("--- Creating SDF Sphere Source ---")
-bpy.ops.object.add_sdf_sphere_source()
+bpy.ops.object.add_sdf_source(sdf_type_key="sphere")
 bpy.context.view_layer.update()
 
 # 3. Add the Cube SDF Source with custom position and blend properties
@@ -52,7 +52,7 @@ bpy.ops.object.select_all(action='DESELECT')
 bounds_obj.select_set(True)
 bpy.context.view_layer.objects.active = bounds_obj
 
-bpy.ops.object.add_sdf_cube_source()
+bpy.ops.object.add_sdf_source(sdf_type_key="cube")
 bpy.context.view_layer.update()
 
 # Configure the newly added Cube object properties
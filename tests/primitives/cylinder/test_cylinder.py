@@ -8,8 +8,8 @@ def create_primitive():
     """
     # Use the operator to add an SDF Cylinder source
     # The operator will automatically parent to the active object (bounds_obj)
-    bpy.ops.object.add_sdf_cylinder_source(initial_csg_operation=constants.DEFAULT_SOURCE_SETTINGS["sdf_csg_operation"],
-                                           initial_blend_factor=constants.DEFAULT_SOURCE_SETTINGS["sdf_blend_factor"])
+    bpy.ops.object.add_sdf_source(sdf_type_key="cylinder", initial_csg_operation=constants.DEFAULT_SOURCE_SETTINGS["sdf_csg_operation"],
+                                  initial_blend_factor=constants.DEFAULT_SOURCE_SETTINGS["sdf_blend_factor"])
     cylinder_obj = bpy.context.active_object
 
     # Set empty_display_size for visual representation in Blender GUI
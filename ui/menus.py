@@ -20,24 +20,14 @@ from bpy.types import Menu
 
 # Use relative imports assuming this file is in FieldForge/ui/
 from .. import constants
-from .. import utils # For find_parent_bounds, is_sdf_source
+from .. import utils # For is_in_sdf_hierarchy, is_sdf_source
 # Import operator IDs needed for menu items
 from .operators import (
     OBJECT_OT_add_sdf_bounds,
     OBJECT_OT_add_sdf_group,
     OBJECT_OT_add_sdf_canvas,
-    OBJECT_OT_add_sdf_cube_source,
-    OBJECT_OT_add_sdf_sphere_source,
-    OBJECT_OT_add_sdf_cylinder_source,
-    OBJECT_OT_add_sdf_cone_source,
-    OBJECT_OT_add_sdf_pyramid_source,
-    OBJECT_OT_add_sdf_torus_source,
-    OBJECT_OT_add_sdf_rounded_box_source,
-    OBJECT_OT_add_sdf_circle_source,
-    OBJECT_OT_add_sdf_ring_source,
-    OBJECT_OT_add_sdf_polygon_source,
-    OBJECT_OT_add_sdf_text_source,
-    OBJECT_OT_add_sdf_half_space_source,
+    OBJECT_OT_add_sdf_source,
+    SDF_SOURCE_SPECS,
 )
 
 
@@ -66,11 +56,10 @@ class VIEW3D_MT_add_sdf(Menu):
         # These should only be enabled if the active object can be a parent
         active_obj = context.active_object
         parent_is_valid_for_any_child = active_obj is not None and \
-                         (active_obj.get(constants.SDF_BOUNDS_MARKER, False) or
+                         (utils.is_in_sdf_hierarchy(active_obj) or
                           active_obj.get(constants.SDF_GROUP_MARKER, False) or
                           active_obj.get(constants.SDF_CANVAS_MARKER, False) or
-                          utils.is_sdf_source(active_obj) or
-                          utils.find_parent_bounds(active_obj) is not None)
+                          utils.is_sdf_source(active_obj))
 
         # Use a column layout for the source shapes section
         col = layout.column()
@@ -89,24 +78,15 @@ class VIEW3D_MT_add_sdf(Menu):
         is_canvas_active = active_obj.get(constants.SDF_CANVAS_MARKER, False) if active_obj else False
         col_3d = col.column()
         col_3d.enabled = not is_canvas_active
-        col_3d.operator(OBJECT_OT_add_sdf_cube_source.bl_idname, text="Cube", icon='MESH_CUBE')
-        col_3d.operator(OBJECT_OT_add_sdf_sphere_source.bl_idname, text="Sphere", icon='MESH_UVSPHERE')
-        col_3d.operator(OBJECT_OT_add_sdf_cylinder_source.bl_idname, text="Cylinder", icon='MESH_CYLINDER')
-        col_3d.operator(OBJECT_OT_add_sdf_cone_source.bl_idname, text="Cone", icon='MESH_CONE')
-        col_3d.operator(OBJECT_OT_add_sdf_pyramid_source.bl_idname, text="Pyramid", icon='MESH_CONE')
-        col_3d.operator(OBJECT_OT_add_sdf_torus_source.bl_idname, text="Torus", icon='MESH_TORUS')
-        col_3d.operator(OBJECT_OT_add_sdf_rounded_box_source.bl_idname, text="Rounded Box", icon='MOD_BEVEL')
-        col_3d.operator(OBJECT_OT_add_sdf_circle_source.bl_idname, text="Circle", icon='MESH_CIRCLE')
-        col_3d.operator(OBJECT_OT_add_sdf_ring_source.bl_idname, text="Ring", icon='CURVE_NCIRCLE')
-        col_3d.operator(OBJECT_OT_add_sdf_polygon_source.bl_idname, text="Polygon", icon='MESH_CIRCLE')
-        col_3d.operator(OBJECT_OT_add_sdf_text_source.bl_idname, text="Text", icon='OUTLINER_OB_FONT')
-        col_3d.operator(OBJECT_OT_add_sdf_half_space_source.bl_idname, text="Half Space", icon='MESH_PLANE')
+        for sdf_type, spec in SDF_SOURCE_SPECS.items():
+            op = col_3d.operator(OBJECT_OT_add_sdf_source.bl_idname, text=spec.label, icon=spec.icon)
+            op.sdf_type_key = sdf_type
 
         col_2d = col.column()
-        col_2d.operator(OBJECT_OT_add_sdf_circle_source.bl_idname, text="Circle", icon='MESH_CIRCLE')
-        col_2d.operator(OBJECT_OT_add_sdf_ring_source.bl_idname, text="Ring", icon='CURVE_NCIRCLE')
-        col_2d.operator(OBJECT_OT_add_sdf_polygon_source.bl_idname, text="Polygon", icon='MESH_CIRCLE')
-        col_2d.operator(OBJECT_OT_add_sdf_text_source.bl_idname, text="Text", icon='OUTLINER_OB_FONT')
+        for sdf_type, spec in SDF_SOURCE_SPECS.items():
+            if sdf_type in constants._2D_SHAPE_TYPES:
+                op = col_2d.operator(OBJECT_OT_add_sdf_source.bl_idname, text=spec.label, icon=spec.icon)
+                op.sdf_type_key = sdf_type
 
         # Optional: Add informational text below if adding sources is disabled
         if not parent_is_valid_for_any_child:
@@ -16,6 +16,9 @@ Includes operators for adding bounds/sources, manual updates, UI interactions,
 and the modal selection/grab handler.
 """
 
+from dataclasses import dataclass
+from types import MappingProxyType
+
 import bpy
 from bpy.props import (
     FloatVectorProperty, FloatProperty, IntProperty, PointerProperty,
@@ -41,10 +44,58 @@ except ImportError:
     from core import update_manager as ff_update
     from drawing import tag_redraw_all_view3d, _draw_line_data_read # Might fail if not run as addon
 
+# Default source properties, applied in one bulk update by AddSdfSourceBase.add_sdf_empty
+_DEFAULT_SOURCE_PROPS = tuple(constants.DEFAULT_SOURCE_SETTINGS.items())
+
+# Interaction mode -> (Empty color, report suffix). Morph and Clearance take precedence over the CSG operation.
+_MODE_TABLE = {
+    "MORPH":      ((0.3, 0.5, 1.0, 1.0), " [Morph]"),      # Blueish
+    "CLEARANCE":  ((1.0, 0.6, 0.2, 1.0), " [Clearance]"),  # Orangeish
+    "DIFFERENCE": ((1.0, 0.3, 0.3, 1.0), " [Difference]"), # Reddish
+    "INTERSECT":  ((0.8, 0.2, 0.8, 1.0), " [Intersect]"),  # Purplish
+    "NONE":       ((0.3, 0.3, 0.3, 1.0), " [None]"),       # Dark Grey
+    "UNION":      ((0.5, 0.5, 0.5, 1.0), " [Union]"),      # Neutral grey
+}
+
+def _interaction_mode_key(use_morph: bool, use_clearance: bool, csg_op: str) -> str:
+    if use_morph: return "MORPH"
+    if use_clearance: return "CLEARANCE"
+    return csg_op if csg_op in _MODE_TABLE else "UNION"
+
 # --- Global State (for Modal Operator) ---
 # Flag managed by the modal operator itself and register/unregister
 _selection_handler_running = False
 
+# --- Coalesced Update Scheduling (for Add operators) ---
+# Bounds name -> reason, waiting for an update check; drained by a single timer so a batch of
+# adds or a burst of UI toggles costs one timer callback and one viewport redraw.
+_pending_bounds_updates = {}
+_update_timer_registered = False
+
+def _flush_pending_bounds_updates():
+    global _update_timer_registered
+    _update_timer_registered = False
+    pending = list(_pending_bounds_updates.items())
+    _pending_bounds_updates.clear()
+    for bounds_name, reason in pending:
+        try:
+            ff_update.check_and_trigger_update(bounds_name, reason)
+        except Exception as e:
+            print(f"FieldForge ERROR: Failed to run update check for {bounds_name}: {e}")
+    tag_redraw_all_view3d()
+    return None # Do not repeat
+
+def _queue_bounds_update(bounds_name: str, reason: str = "add_batch"):
+    """ Queues an update check for a bounds and registers the flush timer if none is pending. """
+    global _update_timer_registered
+    _pending_bounds_updates[bounds_name] = reason # Latest reason wins
+    if not _update_timer_registered:
+        try:
+            bpy.app.timers.register(_flush_pending_bounds_updates, first_interval=0.01)
+            _update_timer_registered = True
+        except Exception as e:
+            print(f"FieldForge ERROR: Failed to schedule update check for {bounds_name}: {e}")
+
 
 # --- Add Bounds Operator ---
 
@@ -66,70 +117,50 @@ class OBJECT_OT_add_sdf_bounds(Operator):
         description="Prefix used for naming the Bounds and Result objects"
     )
 
-    def make_unique_name(self, context, base_name):
-        """ Generates a unique object name based on the base name. """
-        if base_name not in context.scene.objects:
-            return base_name
-        i = 1
-        while f"{base_name}.{i:03d}" in context.scene.objects:
-            i += 1
-        return f"{base_name}.{i:03d}"
+    def make_unique_name(self, context, base_name, existing_names=None):
+        """ Generates a unique object name. """
+        return utils.make_unique_object_name(base_name, existing_names)
 
     def execute(self, context):
-        # Create Bounds Empty
-        # Use context override to ensure placement if called from different context
-        with context.temp_override(window=context.window, area=context.area, region=context.region):
-             bpy.ops.object.empty_add(type='CUBE', radius=1.0, location=self.location)
-        bounds_obj = context.active_object
-        if not bounds_obj:
-            self.report({'ERROR'}, "Failed to create Bounds Empty object.")
+        # Build the name set once for both the Bounds and Result names
+        existing_names = frozenset(bpy.data.objects.keys())
+        # Create Bounds Empty directly through the data API (avoids the operator's scene update)
+        unique_bounds_name = self.make_unique_name(context, self.bounds_name_prefix + "_Bounds", existing_names)
+        try:
+            bounds_obj = utils.new_empty_object(context, unique_bounds_name, 'CUBE', location=self.location)
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to create Bounds Empty object: {e}")
             return {'CANCELLED'}
 
-        unique_bounds_name = self.make_unique_name(context, self.bounds_name_prefix + "_Bounds")
-        bounds_obj.name = unique_bounds_name
-
         # Initial setup
         bounds_obj.scale = (2.0, 2.0, 2.0)
-        bounds_obj.empty_display_size = 1.0
+        utils.invalidate_sdf_hierarchy_cache() # New hierarchy root; don't wait for the depsgraph handler
         bounds_obj.color = (0.2, 0.8, 1.0, 1.0)
         bounds_obj.hide_render = True
 
-        # Set markers and properties using constants
-        bounds_obj[constants.SDF_BOUNDS_MARKER] = True
         result_name_base = self.bounds_name_prefix + "_Result"
-        final_result_name = self.make_unique_name(context, result_name_base)
-        bounds_obj[constants.SDF_RESULT_OBJ_NAME_PROP] = final_result_name
+        final_result_name = self.make_unique_name(context, result_name_base, existing_names)
 
-        # Store Default Settings from constants.py
-        for key, value in constants.DEFAULT_SETTINGS.items():
-            try:
-                bounds_obj[key] = value
-            except TypeError as e:
-                print(f"FieldForge WARN: Could not set default property '{key}' on {bounds_obj.name}: {e}. Value: {value}")
+        # Markers, result name and default settings go in as one bulk update
+        bounds_props = {
+            constants.SDF_BOUNDS_MARKER: True,
+            constants.SDF_RESULT_OBJ_NAME_PROP: final_result_name,
+            **constants.DEFAULT_SETTINGS,
+        }
+        bounds_obj.id_properties_ensure().update(bounds_props)
 
         self.report({'INFO'}, f"Added SDF Bounds: {bounds_obj.name}")
 
         # Select only the new Bounds object
-        context.view_layer.objects.active = bounds_obj
-        for obj in context.selected_objects:
-            if obj != bounds_obj: # Avoid deselecting the object itself if it was already selected
-                obj.select_set(False)
-        bounds_obj.select_set(True)
+        utils.select_only(context, bounds_obj)
 
 
-        # Trigger initial update check using function from update_manager
+        # Trigger initial update check (and redraw) from the coalesced timer,
+        # which also ensures the object is fully integrated first
         if utils.lf is not None: # Only schedule if libfive seems available
-            try:
-                # Use timer to ensure object is fully integrated
-                bpy.app.timers.register(
-                    # Use lambda to pass current scene context correctly
-                    lambda scn=context.scene, name=bounds_obj.name: ff_update.check_and_trigger_update(name, "add_bounds"),
-                    first_interval=0.01 # Short delay
-                )
-            except Exception as e:
-                 print(f"FieldForge ERROR: Failed to schedule initial check for {bounds_obj.name}: {e}")
-
-        tag_redraw_all_view3d() # Force redraw
+            _queue_bounds_update(bounds_obj.name)
+        else:
+            tag_redraw_all_view3d() # Force redraw
         return {'FINISHED'}
 
 class OBJECT_OT_add_sdf_group(Operator):
@@ -156,77 +187,53 @@ class OBJECT_OT_add_sdf_group(Operator):
     def poll(cls, context):
         active_obj = context.active_object
         return utils.lf is not None and active_obj is not None and \
-               (active_obj.get(constants.SDF_BOUNDS_MARKER, False) or
+               (utils.is_in_sdf_hierarchy(active_obj) or
                 active_obj.get(constants.SDF_GROUP_MARKER, False) or
-                utils.is_sdf_source(active_obj) or
-                utils.find_parent_bounds(active_obj) is not None)
+                utils.is_sdf_source(active_obj))
 
 
     def make_unique_name(self, context, base_name):
         """ Generates a unique object name. """
-        if base_name not in context.scene.objects: return base_name
-        i = 1; unique_name = f"{base_name}.{i:03d}"
-        while unique_name in context.scene.objects: i += 1; unique_name = f"{base_name}.{i:03d}"
-        return unique_name
+        return utils.make_unique_object_name(base_name)
 
     def execute(self, context):
         target_parent = context.active_object
-        parent_bounds = utils.find_parent_bounds(target_parent)
-
-        parent_bounds = parent_bounds
-        if not parent_bounds:
-            if target_parent.get(constants.SDF_BOUNDS_MARKER, False):
-                parent_bounds = target_parent
-            elif target_parent.get(constants.SDF_GROUP_MARKER, False) or utils.is_sdf_source(target_parent):
-                 parent_bounds = utils.find_parent_bounds(target_parent)
+        if target_parent.get(constants.SDF_BOUNDS_MARKER, False):
+            parent_bounds = target_parent
+        else:
+            parent_bounds = utils.find_parent_bounds(target_parent)
 
         if not parent_bounds:
             self.report({'ERROR'}, "Could not determine root SDF Bounds for hierarchy. Cannot add Group.")
             return {'CANCELLED'}
 
         try:
-            with context.temp_override(window=context.window, area=context.area, region=context.region):
-                bpy.ops.object.empty_add(type='PLAIN_AXES', radius=0, location=context.scene.cursor.location, scale=(1.0, 1.0, 1.0))
-            obj = context.active_object
-            if not obj: raise RuntimeError("Failed to get active object after empty_add for Group.")
+            obj = utils.new_empty_object(context, self.make_unique_name(context, "FF_Group"), 'PLAIN_AXES',
+                                         location=context.scene.cursor.location, display_size=0.0)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to add Group Empty: {e}")
             return {'CANCELLED'}
 
-        obj.name = self.make_unique_name(context, "FF_Group")
         obj.parent = target_parent
-        try:
-            obj.matrix_parent_inverse = target_parent.matrix_world.inverted()
-        except ValueError:
-            obj.matrix_parent_inverse.identity()
-            print(f"FieldForge WARN: Could not invert parent matrix for {target_parent.name} when adding Group.")
-
-        obj[constants.SDF_GROUP_MARKER] = True
-
-        for key, value in constants.DEFAULT_GROUP_SETTINGS.items():
-            try:
-                if key == "sdf_blend_factor":
-                    obj[key] = self.initial_blend_factor
-                elif key == "sdf_csg_operation":
-                    obj[key] = self.initial_csg_operation
-                else:
-                    obj[key] = value
-            except TypeError as e:
-                 print(f"FieldForge WARN: Could not set default group property '{key}' on {obj.name}: {e}. Value: {value}")
+        utils.invalidate_sdf_hierarchy_cache() # New member; don't wait for the depsgraph handler
+        obj.matrix_parent_inverse = utils.get_parent_inverse(target_parent)
+
+        # All custom properties in one bulk update
+        group_props = dict(constants.DEFAULT_GROUP_SETTINGS)
+        group_props["sdf_blend_factor"] = self.initial_blend_factor
+        group_props["sdf_csg_operation"] = self.initial_csg_operation
+        group_props[constants.SDF_GROUP_MARKER] = True
+        group_props["sdf_base_name"] = "Group"
+        group_props["sdf_processing_order"] = 99999
+        utils.initiate_settings(obj, group_props)
 
         obj.color = (0.2, 1.0, 0.2, 0.8)
 
-        obj["sdf_base_name"] = "Group"
-        obj["sdf_processing_order"] = 99999
-
         show_visuals = utils.get_bounds_setting(parent_bounds, "sdf_show_source_empties")
         obj.hide_viewport = not show_visuals
         obj.hide_render = not show_visuals
 
-        context.view_layer.objects.active = obj
-        for sel_obj in context.selected_objects:
-            if sel_obj != obj: sel_obj.select_set(False)
-        obj.select_set(True)
+        utils.select_only(context, obj)
 
         if target_parent:
             utils.normalize_sibling_order_and_names(target_parent)
@@ -235,6 +242,7 @@ class OBJECT_OT_add_sdf_group(Operator):
 
         self.report({'INFO'}, f"Added SDF Group: {obj.name} under {target_parent.name}")
 
+        context.view_layer.update() # One evaluation so the state check sees the parented matrix_world
         ff_update.check_and_trigger_update(parent_bounds.name, f"add_group")
         tag_redraw_all_view3d()
         return {'FINISHED'}
@@ -272,18 +280,15 @@ class OBJECT_OT_add_sdf_canvas(Operator):
     def poll(cls, context):
         active_obj = context.active_object
         return utils.lf is not None and active_obj is not None and \
-               (active_obj.get(constants.SDF_BOUNDS_MARKER, False) or
+               (utils.is_in_sdf_hierarchy(active_obj) or
                 active_obj.get(constants.SDF_GROUP_MARKER, False) or
                 utils.is_sdf_source(active_obj) or
-                active_obj.get(constants.SDF_CANVAS_MARKER, False) or
-                utils.find_parent_bounds(active_obj) is not None)
+                active_obj.get(constants.SDF_CANVAS_MARKER, False))
 
 
     def make_unique_name(self, context, base_name):
-        if base_name not in context.scene.objects: return base_name
-        i = 1; unique_name = f"{base_name}.{i:03d}"
-        while unique_name in context.scene.objects: i += 1; unique_name = f"{base_name}.{i:03d}"
-        return unique_name
+        """ Generates a unique object name. """
+        return utils.make_unique_object_name(base_name)
 
     def execute(self, context):
         target_parent = context.active_object
@@ -291,52 +296,48 @@ class OBJECT_OT_add_sdf_canvas(Operator):
             self.report({'ERROR'}, "Cannot add a Canvas as a direct child of another Canvas.")
             return {'CANCELLED'}
 
-        parent_bounds = utils.find_parent_bounds(target_parent)
-        if not parent_bounds and target_parent.get(constants.SDF_BOUNDS_MARKER, False):
+        if target_parent.get(constants.SDF_BOUNDS_MARKER, False):
             parent_bounds = target_parent
+        else:
+            parent_bounds = utils.find_parent_bounds(target_parent)
         
         if not parent_bounds:
             self.report({'ERROR'}, "Could not determine root SDF Bounds. Select valid parent.")
             return {'CANCELLED'}
 
         try:
-            with context.temp_override(window=context.window, area=context.area, region=context.region):
-                bpy.ops.object.empty_add(type='PLAIN_AXES', radius=0, location=context.scene.cursor.location, scale=(1.0, 1.0, 1.0))
-            obj = context.active_object
-            if not obj: raise RuntimeError("Failed to get active object after empty_add for Canvas.")
+            obj = utils.new_empty_object(context, self.make_unique_name(context, "FF_Canvas"), 'PLAIN_AXES',
+                                         location=context.scene.cursor.location, display_size=0.0)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to add Canvas Empty: {e}")
             return {'CANCELLED'}
 
-        obj.name = self.make_unique_name(context, "FF_Canvas")
         obj.parent = target_parent
-        try: obj.matrix_parent_inverse = target_parent.matrix_world.inverted()
-        except ValueError: obj.matrix_parent_inverse.identity()
-
-        utils.initiate_settings(obj, constants.DEFAULT_CANVAS_SETTINGS)
-        obj["sdf_blend_factor"] = self.initial_blend_factor
-        obj["sdf_csg_operation"] = self.initial_parent_csg_operation
+        utils.invalidate_sdf_hierarchy_cache() # New member; don't wait for the depsgraph handler
+        obj.matrix_parent_inverse = utils.get_parent_inverse(target_parent)
+
+        # All custom properties in one bulk update
+        canvas_props = dict(constants.DEFAULT_CANVAS_SETTINGS)
+        canvas_props["sdf_blend_factor"] = self.initial_blend_factor
+        canvas_props["sdf_csg_operation"] = self.initial_parent_csg_operation
+        canvas_props[constants.SDF_CANVAS_MARKER] = True
+        canvas_props["sdf_base_name"] = "Canvas"
+        canvas_props["sdf_processing_order"] = 99998
+        utils.initiate_settings(obj, canvas_props)
 
-        obj[constants.SDF_CANVAS_MARKER] = True
-        
         obj.color = (0.8, 0.8, 0.2, 0.8)
 
-        obj["sdf_base_name"] = "Canvas"
-        obj["sdf_processing_order"] = 99998
-
         show_visuals = utils.get_bounds_setting(parent_bounds, "sdf_show_source_empties")
         obj.hide_viewport = not show_visuals
         obj.hide_render = not show_visuals
 
-        context.view_layer.objects.active = obj
-        for sel_obj in context.selected_objects:
-            if sel_obj != obj: sel_obj.select_set(False)
-        obj.select_set(True)
+        utils.select_only(context, obj)
 
         if target_parent: utils.normalize_sibling_order_and_names(target_parent)
         else: obj["sdf_processing_order"] = 0
 
         self.report({'INFO'}, f"Added SDF Canvas: {obj.name} under {target_parent.name}")
+        context.view_layer.update() # One evaluation so the state check sees the parented matrix_world
         ff_update.check_and_trigger_update(parent_bounds.name, f"add_canvas")
         tag_redraw_all_view3d()
         return {'FINISHED'}
@@ -376,19 +377,15 @@ class AddSdfSourceBase(Operator): # Keep existing class definition
     def poll(cls, context):
         active_obj = context.active_object
         return utils.lf is not None and active_obj is not None and \
-               (active_obj.get(constants.SDF_BOUNDS_MARKER, False) or
-                active_obj.get(constants.SDF_GROUP_MARKER, False) or 
-                utils.find_parent_bounds(active_obj) is not None)
+               (utils.is_in_sdf_hierarchy(active_obj) or
+                active_obj.get(constants.SDF_GROUP_MARKER, False))
 
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self) # Show options
 
     def make_unique_name(self, context, base_name):
         """ Generates a unique object name. """
-        if base_name not in context.scene.objects: return base_name
-        i = 1; unique_name = f"{base_name}.{i:03d}"
-        while unique_name in context.scene.objects: i += 1; unique_name = f"{base_name}.{i:03d}"
-        return unique_name
+        return utils.make_unique_object_name(base_name)
 
     def add_sdf_empty(self, context, sdf_type, display_type, name_prefix, props_to_set=None):
         """ Helper method to create and configure the SDF source Empty """
@@ -410,208 +407,173 @@ class AddSdfSourceBase(Operator): # Keep existing class definition
 
         if is_parent_canvas and is_2d_shape_being_added:
             initial_location = target_parent.matrix_world.translation
-            initial_rotation = (0,0,0)
+            initial_rotation = target_parent.matrix_world.to_euler()
         try:
-            with context.temp_override(window=context.window, area=context.area, region=context.region):
-                 bpy.ops.object.empty_add(
-                     type=display_type,
-                     radius=0,
-                     location=initial_location,
-                     rotation=target_parent.matrix_world.to_euler() if is_parent_canvas and is_2d_shape_being_added else (0,0,0),
-                     scale=(1.0, 1.0, 1.0)
-                 )
-            obj = context.active_object
-            if not obj: raise RuntimeError("Failed to get active object after empty_add.")
+            obj = utils.new_empty_object(
+                context,
+                self.make_unique_name(context, name_prefix + "_temp"),
+                display_type,
+                location=initial_location,
+                rotation=initial_rotation,
+                display_size=0.0
+            )
         except Exception as e:
             self.report({'ERROR'}, f"Failed to add Empty: {e}")
             return {'CANCELLED'}
 
-        obj.name = self.make_unique_name(context, name_prefix + "_temp") 
         obj.parent = target_parent
-        try: obj.matrix_parent_inverse = target_parent.matrix_world.inverted()
-        except ValueError: obj.matrix_parent_inverse.identity(); print(f"WARN: Could not invert parent matrix for {target_parent.name}.")
-
-        # --- Assign Standard SDF & Interaction Properties ---
-        obj[constants.SDF_PROPERTY_MARKER] = True
-        obj["sdf_type"] = sdf_type
-        defaults = constants.DEFAULT_SOURCE_SETTINGS # Use defaults from constants
-        obj["sdf_blend_factor"] = self.initial_blend_factor # Set from operator prop
+        utils.invalidate_sdf_hierarchy_cache() # New member; don't wait for the depsgraph handler
+        obj.matrix_parent_inverse = utils.get_parent_inverse(target_parent)
+
         # Determine initial interaction mode (Morph/Clearance override CSG op)
         final_use_morph = self.use_morph
         final_use_clearance = self.use_clearance and not final_use_morph
+        # CSG operation only applies when not using morph or clearance (UNION otherwise, as csg_op is overridden)
+        current_csg_op = self.initial_csg_operation if not final_use_morph and not final_use_clearance else "UNION"
 
-        utils.initiate_settings(obj, constants.DEFAULT_SOURCE_SETTINGS)
+        base_name_parts = name_prefix.split("FF_", 1)
+        initial_base_name = base_name_parts[1] if len(base_name_parts) > 1 and base_name_parts[1] else sdf_type.capitalize()
 
-        if hasattr(self, 'initial_blend_factor'):
-            obj["sdf_blend_factor"] = self.initial_blend_factor
-        
-        obj["sdf_use_morph"] = final_use_morph
-        obj["sdf_morph_factor"] = self.initial_morph_factor if final_use_morph else defaults["sdf_morph_factor"]
-        obj["sdf_use_clearance"] = final_use_clearance
-        obj["sdf_clearance_offset"] = self.initial_clearance_offset if final_use_clearance else defaults["sdf_clearance_offset"]
-        obj["sdf_clearance_keep_original"] = defaults["sdf_clearance_keep_original"]
-        # Set CSG operation if not using morph or clearance
-        if not final_use_morph and not final_use_clearance:
-            obj["sdf_csg_operation"] = self.initial_csg_operation
-        else: # Default to UNION if morph/clearance is active, as csg_op is overridden
-            obj["sdf_csg_operation"] = "UNION" 
-        # Set other defaults from constants file
-        obj["sdf_use_loft"] = defaults["sdf_use_loft"]; obj["sdf_use_shell"] = defaults["sdf_use_shell"]
-        obj["sdf_shell_offset"] = defaults["sdf_shell_offset"]
-
-        # --- Assign Type-Specific Properties (Passed via props_to_set) ---
+        # --- Assign Standard SDF & Interaction Properties (single bulk ID-property update) ---
+        new_props = dict(_DEFAULT_SOURCE_PROPS)
+        new_props["sdf_blend_factor"] = self.initial_blend_factor
+        new_props["sdf_use_morph"] = final_use_morph
+        if final_use_morph: new_props["sdf_morph_factor"] = self.initial_morph_factor
+        new_props["sdf_use_clearance"] = final_use_clearance
+        if final_use_clearance: new_props["sdf_clearance_offset"] = self.initial_clearance_offset
+        new_props["sdf_csg_operation"] = current_csg_op
+        # --- Type-Specific Properties (Passed via props_to_set) ---
         if props_to_set:
-            for key, value in props_to_set.items():
-                try: obj[key] = value
-                except TypeError as e: print(f"WARN: Could not set prop '{key}' on {obj.name}: {e}. Value: {value}")
+            new_props.update(props_to_set)
+        new_props[constants.SDF_PROPERTY_MARKER] = True
+        new_props["sdf_type"] = sdf_type
+        new_props["sdf_base_name"] = initial_base_name
+        new_props["sdf_processing_order"] = 99999
+        obj.id_properties_ensure().update(new_props)
 
-        base_name_parts = name_prefix.split("FF_", 1)
-        initial_base_name = base_name_parts[1] if len(base_name_parts) > 1 and base_name_parts[1] else sdf_type.capitalize()
-        obj["sdf_base_name"] = initial_base_name
-        obj["sdf_processing_order"] = 99999
         # Set color based on effective interaction mode
-        current_csg_op = obj["sdf_csg_operation"] # Read back what was set
-        if final_use_morph: 
-            obj.color = (0.3, 0.5, 1.0, 1.0) # Blueish (Morph)
-        elif final_use_clearance:
-            obj.color = (1.0, 0.6, 0.2, 1.0) # Orangeish (Clearance)
-        elif current_csg_op == "DIFFERENCE":
-            obj.color = (1.0, 0.3, 0.3, 1.0) # Reddish (Difference)
-        elif current_csg_op == "INTERSECT":
-            obj.color = (0.8, 0.2, 0.8, 1.0) # Purplish (Intersect)
-        elif current_csg_op == "NONE":
-            obj.color = (0.3, 0.3, 0.3, 1.0) # Dark Grey (None)
-        else: # UNION or other
-            obj.color = (0.5, 0.5, 0.5, 1.0) # Neutral grey (Union)
+        mode_color, mode_str = _MODE_TABLE[_interaction_mode_key(final_use_morph, final_use_clearance, current_csg_op)]
+        obj.color = mode_color
 
         # Set initial STANDARD visibility based on PARENT BOUNDS setting
         show_standard_empty = utils.get_bounds_setting(parent_bounds, "sdf_show_source_empties")
         obj.hide_viewport = not show_standard_empty
         obj.hide_render = not show_standard_empty
 
-        context.view_layer.objects.active = obj
-        for sel_obj in context.selected_objects:
-            if sel_obj != obj: sel_obj.select_set(False)
-        obj.select_set(True)
+        utils.select_only(context, obj)
 
         if target_parent: 
             utils.normalize_sibling_order_and_names(target_parent)
         else: 
             obj["sdf_processing_order"] = 0 
-        mode_str = ""
-        if final_use_morph: mode_str = " [Morph]"
-        elif final_use_clearance: mode_str = " [Clearance]"
-        else: mode_str = f" [{current_csg_op.capitalize()}]"
         self.report({'INFO'}, f"Added SDF Source: {obj.name} ({sdf_type}) under {target_parent.name}{mode_str}")
 
-        ff_update.check_and_trigger_update(parent_bounds.name, f"add_{sdf_type}_source")
-        tag_redraw_all_view3d() # Redraw to show new object/outline
+        _queue_bounds_update(parent_bounds.name) # Update check + redraw to show new object/outline
         return {'FINISHED'}
 
 
-# --- Concrete Add Source Operators ---
-# (These inherit from AddSdfSourceBase and mainly define bl_idname, bl_label,
-#  and potentially specific properties for their invoke dialog)
-
-class OBJECT_OT_add_sdf_cube_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Cube"""
-    bl_idname = "object.add_sdf_cube_source"; bl_label = "SDF Cube Source"
-    def execute(self, context): return self.add_sdf_empty(context, "cube", 'PLAIN_AXES', "FF_Cube")
-
-class OBJECT_OT_add_sdf_sphere_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Sphere"""
-    bl_idname = "object.add_sdf_sphere_source"; bl_label = "SDF Sphere Source"
-    def execute(self, context): return self.add_sdf_empty(context, "sphere", 'PLAIN_AXES', "FF_Sphere")
-
-class OBJECT_OT_add_sdf_cylinder_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Cylinder"""
-    bl_idname = "object.add_sdf_cylinder_source"; bl_label = "SDF Cylinder Source"
-    def execute(self, context): return self.add_sdf_empty(context, "cylinder", 'PLAIN_AXES', "FF_Cylinder")
-
-class OBJECT_OT_add_sdf_cone_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Cone"""
-    bl_idname = "object.add_sdf_cone_source"; bl_label = "SDF Cone Source"
-    def execute(self, context): return self.add_sdf_empty(context, "cone", 'PLAIN_AXES', "FF_Cone")
-
-class OBJECT_OT_add_sdf_pyramid_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Pyramid"""
-    bl_idname = "object.add_sdf_pyramid_source";bl_label = "SDF Pyramid Source"
-    def execute(self, context): return self.add_sdf_empty(context, "pyramid", 'PLAIN_AXES', "FF_Pyramid")
+# --- Add Source Operator ---
+# One table-driven operator replaces the per-type Add operators. Each spec lists the
+# menu label/icon, name prefix, Empty display type, the operator properties shown in the
+# dialog and (operator property, custom property) pairs for the values it writes.
+
+@dataclass(slots=True, frozen=True)
+class SdfSourceSpec:
+    label: str
+    icon: str
+    prefix: str
+    display_type: str = 'PLAIN_AXES'
+    extra_props: tuple = ()
+    prop_map: tuple = ()
+
+SDF_SOURCE_SPECS = MappingProxyType({
+    "cube":        SdfSourceSpec("Cube",        'MESH_CUBE',        "FF_Cube"),
+    "sphere":      SdfSourceSpec("Sphere",      'MESH_UVSPHERE',    "FF_Sphere"),
+    "cylinder":    SdfSourceSpec("Cylinder",    'MESH_CYLINDER',    "FF_Cylinder"),
+    "cone":        SdfSourceSpec("Cone",        'MESH_CONE',        "FF_Cone"),
+    "pyramid":     SdfSourceSpec("Pyramid",     'MESH_CONE',        "FF_Pyramid"),
+    "torus":       SdfSourceSpec("Torus",       'MESH_TORUS',       "FF_Torus",
+                                 extra_props=("initial_major_radius", "initial_minor_radius"),
+                                 prop_map=(("initial_major_radius", "sdf_torus_major_radius"), ("initial_minor_radius", "sdf_torus_minor_radius"))),
+    "rounded_box": SdfSourceSpec("Rounded Box", 'MOD_BEVEL',        "FF_RoundedBox",
+                                 extra_props=("initial_round_radius",),
+                                 prop_map=(("initial_round_radius", "sdf_round_radius"),)),
+    "circle":      SdfSourceSpec("Circle",      'MESH_CIRCLE',      "FF_Circle",
+                                 extra_props=("initial_extrusion_depth",),
+                                 prop_map=(("initial_extrusion_depth", "sdf_extrusion_depth"),)),
+    "ring":        SdfSourceSpec("Ring",        'CURVE_NCIRCLE',    "FF_Ring",
+                                 extra_props=("initial_inner_radius", "initial_extrusion_depth"),
+                                 prop_map=(("initial_inner_radius", "sdf_inner_radius"), ("initial_extrusion_depth", "sdf_extrusion_depth"))),
+    "polygon":     SdfSourceSpec("Polygon",     'MESH_CIRCLE',      "FF_Polygon",
+                                 extra_props=("initial_sides", "initial_extrusion_depth"),
+                                 prop_map=(("initial_sides", "sdf_sides"), ("initial_extrusion_depth", "sdf_extrusion_depth"))),
+    "text":        SdfSourceSpec("Text",        'OUTLINER_OB_FONT', "FF_Text",
+                                 extra_props=("initial_text_string", "initial_text_extrusion_depth"),
+                                 prop_map=(("initial_text_string", "sdf_text_string"), ("initial_text_extrusion_depth", "sdf_extrusion_depth"))),
+    "half_space":  SdfSourceSpec("Half Space",  'MESH_PLANE',       "FF_HalfSpace"),
+})
+
+class OBJECT_OT_add_sdf_source(AddSdfSourceBase):
+    """Adds an Empty controller for an SDF source shape"""
+    bl_idname = "object.add_sdf_source"; bl_label = "Add SDF Source"
+
+    sdf_type_key: EnumProperty(
+        name="Shape",
+        description="Type of SDF source shape to add",
+        items=[(key, spec.label, f"Add an SDF {spec.label} source", spec.icon, i) for i, (key, spec) in enumerate(SDF_SOURCE_SPECS.items())],
+        default="cube"
+    )
 
-class OBJECT_OT_add_sdf_torus_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Torus"""
-    bl_idname = "object.add_sdf_torus_source"; bl_label = "SDF Torus Source"
+    # --- Type-specific properties (only the ones listed in the spec are drawn/used) ---
     initial_major_radius: FloatProperty(name="Major Radius (Unit)", default=constants.DEFAULT_SOURCE_SETTINGS["sdf_torus_major_radius"], min=0.01, description="Radius from center to tube center")
     initial_minor_radius: FloatProperty(name="Minor Radius (Unit)", default=constants.DEFAULT_SOURCE_SETTINGS["sdf_torus_minor_radius"], min=0.005, description="Radius of the tube")
-    def execute(self, context):
-        major_r = self.initial_major_radius; minor_r = min(self.initial_minor_radius, major_r - 0.001)
-        props = {"sdf_torus_major_radius": major_r, "sdf_torus_minor_radius": minor_r}
-        return self.add_sdf_empty(context, "torus", 'PLAIN_AXES', "FF_Torus", props_to_set=props)
-
-class OBJECT_OT_add_sdf_rounded_box_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Rounded Box"""
-    bl_idname = "object.add_sdf_rounded_box_source"; bl_label = "SDF Rounded Box Source"
     initial_round_radius: FloatProperty(name="Rounding Radius (Unit)", default=constants.DEFAULT_SOURCE_SETTINGS["sdf_round_radius"], min=0.0, max=0.5, description="Corner radius relative to unit size")
-    def execute(self, context):
-        props = {"sdf_round_radius": self.initial_round_radius}
-        return self.add_sdf_empty(context, "rounded_box", 'PLAIN_AXES', "FF_RoundedBox", props_to_set=props)
-
-class OBJECT_OT_add_sdf_circle_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Circle (Extruded)"""
-    bl_idname = "object.add_sdf_circle_source"; bl_label = "SDF Circle Source"
-    initial_extrusion_depth: FloatProperty(name="Extrusion Depth", default=constants.DEFAULT_SOURCE_SETTINGS["sdf_extrusion_depth"], min=0.001, subtype='DISTANCE', description="Depth of extrusion along local Z")
-    def execute(self, context):
-        props = {"sdf_extrusion_depth": self.initial_extrusion_depth}
-        return self.add_sdf_empty(context, "circle", 'PLAIN_AXES', "FF_Circle", props_to_set=props)
-
-class OBJECT_OT_add_sdf_ring_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Ring (Extruded)"""
-    bl_idname = "object.add_sdf_ring_source"; bl_label = "SDF Ring Source"
     initial_inner_radius: FloatProperty(name="Inner Radius (Unit)", default=constants.DEFAULT_SOURCE_SETTINGS["sdf_inner_radius"], min=0.0, max=0.499, description="Inner radius relative to unit outer radius (0.5)")
-    initial_extrusion_depth: FloatProperty(name="Extrusion Depth", default=constants.DEFAULT_SOURCE_SETTINGS["sdf_extrusion_depth"], min=0.001, subtype='DISTANCE', description="Depth of extrusion along local Z")
-    def execute(self, context):
-        props = {"sdf_inner_radius": self.initial_inner_radius, "sdf_extrusion_depth": self.initial_extrusion_depth}
-        return self.add_sdf_empty(context, "ring", 'PLAIN_AXES', "FF_Ring", props_to_set=props)
-
-class OBJECT_OT_add_sdf_polygon_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Polygon (Extruded)"""
-    bl_idname = "object.add_sdf_polygon_source"; bl_label = "SDF Polygon Source"
     initial_sides: IntProperty(name="Number of Sides", default=constants.DEFAULT_SOURCE_SETTINGS["sdf_sides"], min=3, max=64, description="Number of polygon sides")
     initial_extrusion_depth: FloatProperty(name="Extrusion Depth", default=constants.DEFAULT_SOURCE_SETTINGS["sdf_extrusion_depth"], min=0.001, subtype='DISTANCE', description="Depth of extrusion along local Z")
+    initial_text_string: StringProperty(name="Text", description="The text string to generate", default=constants.DEFAULT_SOURCE_SETTINGS["sdf_text_string"])
+    # Text is flat by default, the user can set a depth if they want extrusion
+    initial_text_extrusion_depth: FloatProperty(name="Extrusion Depth (Optional)", description="Depth of extrusion along local Z if text is treated as 2D base", default=0.0)
+
+    @classmethod
+    def description(cls, context, properties):
+        spec = SDF_SOURCE_SPECS.get(properties.sdf_type_key)
+        return f"Adds an Empty controller for an SDF {spec.label}" if spec else cls.__doc__
+
+    def draw(self, context):
+        layout = self.layout
+        # Fixed header: interaction-mode props shared by every shape
+        header = layout.column(align=True)
+        header.prop(self, "initial_blend_factor")
+        header.prop(self, "initial_csg_operation")
+        row = header.row(align=True)
+        row.prop(self, "use_clearance")
+        sub = row.row(align=True); sub.active = self.use_clearance
+        sub.prop(self, "initial_clearance_offset", text="Offset")
+        row = header.row(align=True)
+        row.prop(self, "use_morph")
+        sub = row.row(align=True); sub.active = self.use_morph
+        sub.prop(self, "initial_morph_factor", text="Factor")
+
+        # Shape-specific fields, only those this type actually uses
+        extra_props = SDF_SOURCE_SPECS[self.sdf_type_key].extra_props
+        if extra_props:
+            layout.separator()
+            col = layout.column(align=True)
+            for prop_name in extra_props:
+                col.prop(self, prop_name)
+
     def execute(self, context):
-        props = {"sdf_sides": self.initial_sides, "sdf_extrusion_depth": self.initial_extrusion_depth}
-        return self.add_sdf_empty(context, "polygon", 'PLAIN_AXES', "FF_Polygon", props_to_set=props)
-
-class OBJECT_OT_add_sdf_text_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Text object"""
-    bl_idname = "object.add_sdf_text_source"
-    bl_label = "SDF Text Source"
-
-    initial_text_string: StringProperty(
-        name="Text",
-        description="The text string to generate",
-        default=constants.DEFAULT_SOURCE_SETTINGS["sdf_text_string"]
-    )
-    # If you want text to be extrudable by default via the common extrusion property:
-    initial_extrusion_depth: FloatProperty(
-        name="Extrusion Depth (Optional)", 
-        description="Depth of extrusion along local Z if text is treated as 2D base", 
-        default=0.0 # Default to flat, user can set it if they want extrusion
-        # Or use constants.DEFAULT_SOURCE_SETTINGS["sdf_extrusion_depth"] if you want it extruded by default
-    )
-    def execute(self, context):
-        props_to_set = {"sdf_text_string": self.initial_text_string}
-        # Only add extrusion depth if you want it to be part of the Text object's initial setup
-        # And if you've modified sdf_logic.py to make "text" extrudable.
-        if self.initial_extrusion_depth > 1e-5 : # Only set if user provided a value
-             props_to_set["sdf_extrusion_depth"] = self.initial_extrusion_depth
-        
-        return self.add_sdf_empty(context, "text", 'PLAIN_AXES', "FF_Text", props_to_set=props_to_set)
+        sdf_type = self.sdf_type_key
+        spec = SDF_SOURCE_SPECS[sdf_type]
+        props = {custom_key: getattr(self, op_prop) for op_prop, custom_key in spec.prop_map}
+
+        if sdf_type == "torus": # Keep the tube inside the major radius
+            props["sdf_torus_minor_radius"] = min(props["sdf_torus_minor_radius"], props["sdf_torus_major_radius"] - 0.001)
+        elif sdf_type == "text" and props["sdf_extrusion_depth"] <= 1e-5: # Only set if user provided a value
+            del props["sdf_extrusion_depth"]
 
-class OBJECT_OT_add_sdf_half_space_source(AddSdfSourceBase):
-    """Adds an Empty controller for an SDF Half Space"""
-    bl_idname = "object.add_sdf_half_space_source"; bl_label = "SDF Half Space Source"
-    def execute(self, context): return self.add_sdf_empty(context, "half_space", 'PLAIN_AXES', "FF_HalfSpace")
+        return self.add_sdf_empty(context, sdf_type, spec.display_type, spec.prefix, props_to_set=props or None)
 
 
 # --- Manual Update Operator ---
@@ -631,14 +593,14 @@ class OBJECT_OT_sdf_manual_update(Operator):
         print(f"FieldForge: Manual final update triggered for {bounds_name}.")
         
         
-        if ff_update._updates_pending.get(bounds_name, False):
+        if ff_update.is_update_pending(bounds_name):
              self.report({'WARNING'}, f"Update already in progress for {bounds_name}."); return {'CANCELLED'}
         current_state = ff_state.get_current_sdf_state(context, bounds_obj) # Use state module function
         if not current_state: self.report({'ERROR'}, f"Failed get state for {bounds_name}."); return {'CANCELLED'}
-        ff_update._updates_pending[bounds_name] = True
+        ff_update.set_update_pending(bounds_name, True)
         try:
             bpy.app.timers.register(lambda name=bounds_name, state=current_state: ff_update.run_sdf_update(name, state, is_viewport_update=False), first_interval=0.0)
-        except Exception as e: print(f"ERROR: Reg FINAL update timer: {e}"); ff_update._updates_pending[bounds_name] = False; self.report({'ERROR'}, f"Failed schedule update."); return {'CANCELLED'}
+        except Exception as e: print(f"ERROR: Reg FINAL update timer: {e}"); ff_update.set_update_pending(bounds_name, False); self.report({'ERROR'}, f"Failed schedule update."); return {'CANCELLED'}
         self.report({'INFO'}, f"Scheduled final update for {bounds_name}."); return {'FINISHED'}
 
 
@@ -651,8 +613,9 @@ class OBJECT_OT_fieldforge_toggle_array_axis(Operator):
     axis: EnumProperty(items=[('X',"X","X"), ('Y',"Y","Y"), ('Z',"Z","Z")], name="Axis", default='X')
     @classmethod
     def poll(cls, context):
-        obj = context.active_object
-        return obj and (utils.is_sdf_source(obj) or utils.is_sdf_group(obj)) # Poll on selected obj
+        if utils.is_sdf_source_or_group(context.active_object): return True
+        cls.poll_message_set("Active object is not a FieldForge source or group")
+        return False
     
     def execute(self, context):
         selected_obj = context.active_object
@@ -683,9 +646,8 @@ class OBJECT_OT_fieldforge_toggle_array_axis(Operator):
                 b2 = utils.find_parent_bounds(obj_to_modify)
                 if b2: bounds_to_update.add(b2.name)
             
-            for bounds_name in bounds_to_update:
-                ff_update.check_and_trigger_update(bounds_name, f"toggle_array_{selected_obj.name}_{self.axis}")
-            tag_redraw_all_view3d()
+            for bounds_name in bounds_to_update: # Coalesced; flush also redraws
+                _queue_bounds_update(bounds_name, f"toggle_array_{selected_obj.name}_{self.axis}")
         return {'FINISHED'}
 
 class OBJECT_OT_fieldforge_set_main_array_mode(Operator):
@@ -695,8 +657,9 @@ class OBJECT_OT_fieldforge_set_main_array_mode(Operator):
     main_mode: EnumProperty(items=[('NONE',"None","None"), ('LINEAR',"Linear","Linear"), ('RADIAL',"Radial","Radial")], name="Main Array Mode", default='NONE')
     @classmethod
     def poll(cls, context):
-        obj = context.active_object
-        return obj and (utils.is_sdf_source(obj) or utils.is_sdf_group(obj)) # Poll on selected
+        if utils.is_sdf_source_or_group(context.active_object): return True
+        cls.poll_message_set("Active object is not a FieldForge source or group")
+        return False
         
     def execute(self, context):
         selected_obj = context.active_object
@@ -721,9 +684,8 @@ class OBJECT_OT_fieldforge_set_main_array_mode(Operator):
                 b2 = utils.find_parent_bounds(obj_to_modify)
                 if b2: bounds_to_update.add(b2.name)
 
-            for bounds_name in bounds_to_update:
-                ff_update.check_and_trigger_update(bounds_name, f"set_main_array_{selected_obj.name}_{self.main_mode}")
-            tag_redraw_all_view3d()
+            for bounds_name in bounds_to_update: # Coalesced; flush also redraws
+                _queue_bounds_update(bounds_name, f"set_main_array_{selected_obj.name}_{self.main_mode}")
         return {'FINISHED'}
 
 class OBJECT_OT_fieldforge_set_csg_mode(Operator):
@@ -768,10 +730,7 @@ class OBJECT_OT_fieldforge_set_csg_mode(Operator):
             use_clearance_eff = utils.get_sdf_param(obj_to_modify, "sdf_use_clearance", False) and not use_morph_eff
 
             if not use_morph_eff and not use_clearance_eff:
-                if self.csg_mode == "DIFFERENCE": obj_to_modify.color = (1.0, 0.3, 0.3, 1.0)
-                elif self.csg_mode == "INTERSECT": obj_to_modify.color = (0.8, 0.2, 0.8, 1.0)
-                elif self.csg_mode == "NONE": obj_to_modify.color = (0.3, 0.3, 0.3, 1.0)
-                else: obj_to_modify.color = (0.5, 0.5, 0.5, 1.0) # UNION
+                obj_to_modify.color = _MODE_TABLE[_interaction_mode_key(False, False, self.csg_mode)][0]
 
         if changed:
             
@@ -1522,18 +1481,7 @@ classes_to_register = (
     OBJECT_OT_add_sdf_group,
     OBJECT_OT_add_sdf_canvas,
     OBJECT_OT_fieldforge_toggle_canvas_revolve,
-    OBJECT_OT_add_sdf_cube_source,
-    OBJECT_OT_add_sdf_sphere_source,
-    OBJECT_OT_add_sdf_cylinder_source,
-    OBJECT_OT_add_sdf_cone_source,
-    OBJECT_OT_add_sdf_pyramid_source,
-    OBJECT_OT_add_sdf_torus_source,
-    OBJECT_OT_add_sdf_rounded_box_source,
-    OBJECT_OT_add_sdf_circle_source,
-    OBJECT_OT_add_sdf_ring_source,
-    OBJECT_OT_add_sdf_polygon_source,
-    OBJECT_OT_add_sdf_text_source,
-    OBJECT_OT_add_sdf_half_space_source,
+    OBJECT_OT_add_sdf_source,
     OBJECT_OT_fieldforge_toggle_array_axis,
     OBJECT_OT_fieldforge_set_main_array_mode,
     OBJECT_OT_fieldforge_set_csg_mode,
@@ -41,6 +41,8 @@ from .operators import (
 
 # --- UI Drawing Helper Functions ---
 
+_LINK_TARGET_PATH = f'["{constants.SDF_LINK_TARGET_NAME_PROP}"]' # Built once, not per draw
+
 def _draw_link_controls(layout: bpy.types.UILayout, context: bpy.types.Context, obj: bpy.types.Object, linkable_type_check_func):
     """
     Helper to draw link controls.
@@ -50,7 +52,7 @@ def _draw_link_controls(layout: bpy.types.UILayout, context: bpy.types.Context,
     is_obj_actually_linked_to_valid_target = utils.is_sdf_linked(obj)
 
     row_link_target = layout.row(align=True)
-    row_link_target.prop_search(obj, f'["{constants.SDF_LINK_TARGET_NAME_PROP}"]', 
+    row_link_target.prop_search(obj, _LINK_TARGET_PATH, 
                                 context.scene, "objects", text="")
     effective_obj_for_ui = utils.get_effective_sdf_object(obj)
     toggle_op = row_link_target.operator(
@@ -362,41 +364,40 @@ def draw_sdf_group_settings(layout: bpy.types.UILayout, context: bpy.types.Conte
     op_array_radial = array_mode_buttons_row.operator(OBJECT_OT_fieldforge_set_main_array_mode.bl_idname, text="Radial", depress=(current_main_array_mode == 'RADIAL'))
     op_array_radial.main_mode = 'RADIAL'
     
-    layout.separator()
-
-    if current_main_array_mode == 'LINEAR':
-        ax_prop = "sdf_array_active_x"; cx_prop = "sdf_array_count_x"
-        is_ax_active = obj_for_props.get(ax_prop, False)
-        linear_x_row = layout.row(align=True)
-        op_toggle_x = linear_x_row.operator(OBJECT_OT_fieldforge_toggle_array_axis.bl_idname, text="X", depress=is_ax_active)
-        op_toggle_x.axis = 'X'
-        linear_x_params_sub_row = linear_x_row.row(align=True)
-        linear_x_params_sub_row.active = is_ax_active
-        linear_x_params_sub_row.prop(obj_for_props, f'["{cx_prop}"]', text="Count")
-
-        ay_prop = "sdf_array_active_y"; cy_prop = "sdf_array_count_y"
-        is_ay_active = obj_for_props.get(ay_prop, False)
-        linear_y_row = layout.row(align=True)
-        linear_y_row.active = is_ax_active
-        op_toggle_y = linear_y_row.operator(OBJECT_OT_fieldforge_toggle_array_axis.bl_idname, text="Y", depress=is_ay_active)
-        op_toggle_y.axis = 'Y'
-        linear_y_params_sub_row = linear_y_row.row(align=True)
-        linear_y_params_sub_row.active = is_ay_active
-        linear_y_params_sub_row.prop(obj_for_props, f'["{cy_prop}"]', text="Count")
-
-        az_prop = "sdf_array_active_z"; cz_prop = "sdf_array_count_z"
-        is_az_active = obj_for_props.get(az_prop, False)
-        linear_z_row = layout.row(align=True)
-        linear_z_row.active = is_ay_active
-        op_toggle_z = linear_z_row.operator(OBJECT_OT_fieldforge_toggle_array_axis.bl_idname, text="Z", depress=is_az_active)
-        op_toggle_z.axis = 'Z'
-        linear_z_params_sub_row = linear_z_row.row(align=True)
-        linear_z_params_sub_row.active = is_az_active
-        linear_z_params_sub_row.prop(obj_for_props, f'["{cz_prop}"]', text="Count")
-
-    elif current_main_array_mode == 'RADIAL':
-        radial_count_row = layout.row(align=True)
-        radial_count_row.prop(obj_for_props, '["sdf_radial_count"]', text="Count")
+    # Linear/Radial parameters live in sub-panels that only draw when expanded
+
+def draw_sdf_group_linear_array(layout: bpy.types.UILayout, obj_for_props: bpy.types.Object):
+    """ Draws the per-axis Linear array controls for a Group. """
+    is_ax_active = obj_for_props.get("sdf_array_active_x", False)
+    linear_x_row = layout.row(align=True)
+    op_toggle_x = linear_x_row.operator(OBJECT_OT_fieldforge_toggle_array_axis.bl_idname, text="X", depress=is_ax_active)
+    op_toggle_x.axis = 'X'
+    linear_x_params_sub_row = linear_x_row.row(align=True)
+    linear_x_params_sub_row.active = is_ax_active
+    linear_x_params_sub_row.prop(obj_for_props, '["sdf_array_count_x"]', text="Count")
+
+    is_ay_active = obj_for_props.get("sdf_array_active_y", False)
+    linear_y_row = layout.row(align=True)
+    linear_y_row.active = is_ax_active
+    op_toggle_y = linear_y_row.operator(OBJECT_OT_fieldforge_toggle_array_axis.bl_idname, text="Y", depress=is_ay_active)
+    op_toggle_y.axis = 'Y'
+    linear_y_params_sub_row = linear_y_row.row(align=True)
+    linear_y_params_sub_row.active = is_ay_active
+    linear_y_params_sub_row.prop(obj_for_props, '["sdf_array_count_y"]', text="Count")
+
+    is_az_active = obj_for_props.get("sdf_array_active_z", False)
+    linear_z_row = layout.row(align=True)
+    linear_z_row.active = is_ay_active
+    op_toggle_z = linear_z_row.operator(OBJECT_OT_fieldforge_toggle_array_axis.bl_idname, text="Z", depress=is_az_active)
+    op_toggle_z.axis = 'Z'
+    linear_z_params_sub_row = linear_z_row.row(align=True)
+    linear_z_params_sub_row.active = is_az_active
+    linear_z_params_sub_row.prop(obj_for_props, '["sdf_array_count_z"]', text="Count")
+
+def draw_sdf_group_radial_array(layout: bpy.types.UILayout, obj_for_props: bpy.types.Object):
+    """ Draws the Radial array controls for a Group. """
+    radial_count_row = layout.row(align=True)
+    radial_count_row.prop(obj_for_props, '["sdf_radial_count"]', text="Count")
 
 def draw_sdf_source_info(layout: bpy.types.UILayout, context: bpy.types.Context):
     """ Draws the UI elements for the SDF Source object properties. """
@@ -405,6 +406,12 @@ def draw_sdf_source_info(layout: bpy.types.UILayout, context: bpy.types.Context)
 
     is_obj_itself_linked, obj_for_props = _draw_link_controls(layout, context, obj, utils.is_sdf_source)
 
+    # Read the (effective) custom properties once per redraw
+    src_defaults = constants.DEFAULT_SOURCE_SETTINGS
+    raw_use_loft = obj_for_props.get("sdf_use_loft", False)
+    raw_use_morph = obj_for_props.get("sdf_use_morph", False)
+    raw_use_clearance = obj_for_props.get("sdf_use_clearance", False)
+
     parent_obj = obj_for_props.parent
     parent_is_canvas = False
     if parent_obj and parent_obj.get(constants.SDF_CANVAS_MARKER, False) and sdf_type in constants._2D_SHAPE_TYPES:
@@ -479,7 +486,7 @@ def draw_sdf_source_info(layout: bpy.types.UILayout, context: bpy.types.Context)
 
     ## --- Interaction Mode (CSG with parent/canvas) ---
     row_csg_buttons = layout.row(align=True)
-    current_csg_op = obj_for_props.get("sdf_csg_operation", constants.DEFAULT_SOURCE_SETTINGS["sdf_csg_operation"])
+    current_csg_op = obj_for_props.get("sdf_csg_operation", src_defaults["sdf_csg_operation"])
 
     op_none = row_csg_buttons.operator(OBJECT_OT_fieldforge_set_csg_mode.bl_idname, text="    ", icon='RADIOBUT_OFF', depress=(current_csg_op == 'NONE'))
     op_none.csg_mode = 'NONE'
@@ -494,9 +501,9 @@ def draw_sdf_source_info(layout: bpy.types.UILayout, context: bpy.types.Context)
     blend_row = layout.row(align=True)
     blend_row.prop(obj_for_props, '["sdf_blend_factor"]', text="Blend Factor")
 
-    use_loft = obj_for_props.get("sdf_use_loft", False)
-    use_morph = obj_for_props.get("sdf_use_morph", False) and not use_loft
-    use_clearance = obj_for_props.get("sdf_use_clearance", False) and not use_loft and not use_morph
+    use_loft = raw_use_loft
+    use_morph = raw_use_morph and not use_loft
+    use_clearance = raw_use_clearance and not use_loft and not use_morph
     csg_active = not use_loft and not use_morph and not use_clearance
 
     col_3d_mods = layout.column()
@@ -510,17 +517,17 @@ def draw_sdf_source_info(layout: bpy.types.UILayout, context: bpy.types.Context)
     row_morph_controls.active = not use_loft
     row_morph_controls.prop(obj_for_props, '["sdf_use_morph"]', text="Morph", toggle=True, icon='MOD_SIMPLEDEFORM')
     morph_factor_sub_row = row_morph_controls.row(align=True)
-    morph_factor_sub_row.active = obj_for_props.get("sdf_use_morph", False) and not use_loft # Active if morph is on and loft off
+    morph_factor_sub_row.active = use_morph # Active if morph is on and loft off
     morph_factor_sub_row.prop(obj_for_props, '["sdf_morph_factor"]', text="Factor")
     
     row_clearance_controls = layout.row(align=True)
     row_clearance_controls.active = not use_loft and not use_morph
     row_clearance_controls.prop(obj_for_props, '["sdf_use_clearance"]', text="Clearance", toggle=True, icon='MOD_OFFSET')
     clearance_offset_sub_row = row_clearance_controls.row(align=True)
-    clearance_offset_sub_row.active = obj_for_props.get("sdf_use_clearance", False) and not use_loft and not use_morph
+    clearance_offset_sub_row.active = use_clearance
     clearance_offset_sub_row.prop(obj_for_props, '["sdf_clearance_offset"]', text="Offset")
 
-    if obj_for_props.get("sdf_use_clearance", False) and not obj_for_props.get("sdf_use_loft", False) and not obj_for_props.get("sdf_use_morph", False):
+    if raw_use_clearance and not raw_use_loft and not raw_use_morph:
         row_clearance_keep_orig = col_3d_mods.row(align=True) # Still under col_3d_mods
         row_clearance_keep_orig.prop(obj_for_props, '["sdf_clearance_keep_original"]', text="Keep Original Shape")
 
@@ -553,8 +560,8 @@ def draw_sdf_source_info(layout: bpy.types.UILayout, context: bpy.types.Context)
         torus_minor_row = layout.row(align=True)
         torus_minor_row.prop(obj_for_props, '["sdf_torus_minor_radius"]', text="Minor Radius")
         
-        maj_r = obj_for_props.get("sdf_torus_major_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_torus_major_radius"])
-        min_r = obj_for_props.get("sdf_torus_minor_radius", constants.DEFAULT_SOURCE_SETTINGS["sdf_torus_minor_radius"])
+        maj_r = obj_for_props.get("sdf_torus_major_radius", src_defaults["sdf_torus_major_radius"])
+        min_r = obj_for_props.get("sdf_torus_minor_radius", src_defaults["sdf_torus_minor_radius"])
         if min_r >= maj_r:
             error_row = layout.row(align=True)
             error_row.label(text="Minor radius should be < Major", icon='ERROR')
@@ -747,7 +754,56 @@ class VIEW3D_PT_fieldforge_main(Panel):
             layout.label(text="Not a FieldForge object.", icon='QUESTION')
 
 
+# --- Group Array Sub-Panels ---
+
+def _group_props_for_array_mode(context: bpy.types.Context, mode: str) -> bpy.types.Object | None:
+    """ Returns the object holding the active Group's array props if its array mode is mode. """
+    obj = context.object
+    if utils.lf is None or not utils.is_sdf_group(obj): return None
+    obj_for_props = utils.get_effective_sdf_object(obj)
+    if not obj_for_props or obj_for_props.get("sdf_main_array_mode", 'NONE') != mode: return None
+    return obj_for_props
+
+class VIEW3D_PT_fieldforge_linear_array(Panel):
+    """Linear array parameters of the active Group"""
+    bl_label = "Linear Array"
+    bl_idname = "VIEW3D_PT_fieldforge_linear_array"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "FieldForge"
+    bl_parent_id = "VIEW3D_PT_fieldforge_main"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return _group_props_for_array_mode(context, 'LINEAR') is not None
+
+    def draw(self, context):
+        obj_for_props = _group_props_for_array_mode(context, 'LINEAR')
+        if obj_for_props: draw_sdf_group_linear_array(self.layout, obj_for_props)
+
+class VIEW3D_PT_fieldforge_radial_array(Panel):
+    """Radial array parameters of the active Group"""
+    bl_label = "Radial Array"
+    bl_idname = "VIEW3D_PT_fieldforge_radial_array"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "FieldForge"
+    bl_parent_id = "VIEW3D_PT_fieldforge_main"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return _group_props_for_array_mode(context, 'RADIAL') is not None
+
+    def draw(self, context):
+        obj_for_props = _group_props_for_array_mode(context, 'RADIAL')
+        if obj_for_props: draw_sdf_group_radial_array(self.layout, obj_for_props)
+
+
 # --- List of Panel Classes to Register ---
 classes_to_register = (
     VIEW3D_PT_fieldforge_main,
+    VIEW3D_PT_fieldforge_linear_array, # Sub-panels register after their parent
+    VIEW3D_PT_fieldforge_radial_array,
 )
\ No newline at end of file
@@ -16,6 +16,8 @@ General utility and helper functions for the FieldForge addon.
 
 import bpy
 import math
+import operator
+from functools import lru_cache
 from mathutils import Vector, Matrix
 
 from . import constants
@@ -34,23 +36,167 @@ def find_result_object(context: bpy.types.Context, result_name: str) -> bpy.type
         return None
     return context.scene.objects.get(result_name)
 
+def make_unique_object_name(base_name: str, existing_names=None) -> str:
+    """
+    Generates an object name that is unique in bpy.data.objects (Blender names are global).
+    Pass a prebuilt set of names when generating several names in a row.
+    """
+    names = existing_names if existing_names is not None else frozenset(bpy.data.objects.keys())
+    if base_name not in names:
+        return base_name
+    i = 1
+    while f"{base_name}.{i:03d}" in names:
+        i += 1
+    return f"{base_name}.{i:03d}"
+
+def new_empty_object(context: bpy.types.Context, name: str, display_type: str, location=(0.0, 0.0, 0.0), rotation=(0.0, 0.0, 0.0), display_size: float = 1.0) -> bpy.types.Object:
+    """
+    Creates an Empty through the data API and links it to the active collection.
+    Much cheaper than bpy.ops.object.empty_add, which updates the whole scene per call.
+    """
+    obj = bpy.data.objects.new(name, None)
+    obj.empty_display_type = display_type
+    obj.empty_display_size = display_size
+    obj.location = location
+    obj.rotation_euler = rotation
+    collection = getattr(context, 'collection', None) or context.scene.collection
+    collection.objects.link(obj)
+    return obj
+
+# Object name -> root Bounds name ("" when not in a hierarchy). Cleared by the depsgraph handler.
+_parent_bounds_cache: dict[str, str] = {}
+
+def clear_parent_bounds_cache():
+    _parent_bounds_cache.clear()
+
 def find_parent_bounds(start_obj: bpy.types.Object) -> bpy.types.Object | None:
     """
     Traverses up the hierarchy from start_obj to find the root SDF Bounds object.
     Returns the Bounds object or None if not part of an SDF hierarchy.
+    Results are cached per object name until the next depsgraph update.
     """
-    obj = start_obj
+    if not start_obj:
+        return None
+    if start_obj.get(constants.SDF_BOUNDS_MARKER, False):
+        return start_obj
+
+    try:
+        start_name = start_obj.name
+    except ReferenceError:
+        return None
+    cached_name = _parent_bounds_cache.get(start_name)
+    if cached_name is not None:
+        if not cached_name:
+            return None
+        cached_bounds = bpy.data.objects.get(cached_name)
+        if cached_bounds and cached_bounds.get(constants.SDF_BOUNDS_MARKER, False):
+            return cached_bounds
+
+    obj = start_obj.parent
     # Limit search depth to prevent infinite loops in case of weird parenting cycles
     max_depth = 100
-    count = 0
+    count = 1
     while obj and count < max_depth:
         if obj.get(constants.SDF_BOUNDS_MARKER, False):
+            _parent_bounds_cache[start_name] = obj.name
             return obj
         obj = obj.parent
         count += 1
+    _parent_bounds_cache[start_name] = ""
     return None # Not part of a known bounds hierarchy
 
 
+# (parent name, parent matrix_world, inverse) of the last parent inverted, for scripted batches
+# that add many children under one parent.
+_last_parent_inverse = None
+
+def get_parent_inverse(parent_obj: bpy.types.Object) -> Matrix:
+    """
+    Returns the inverse of parent_obj.matrix_world for use as a child's matrix_parent_inverse.
+    Rotation + uniform scale + translation parents (e.g. Bounds, most Empties) are inverted
+    via the scaled transpose; anything with non-uniform scale or shear uses
+    Matrix.inverted_safe(), so singular (e.g. zero-scale) parents never raise.
+    """
+    global _last_parent_inverse
+    mw = parent_obj.matrix_world
+    if _last_parent_inverse and _last_parent_inverse[0] == parent_obj.name and _last_parent_inverse[1] == mw:
+        return _last_parent_inverse[2].copy()
+
+    rot_scale = mw.to_3x3()
+    c0, c1, c2 = rot_scale.col
+    scale_sq = c0.length_squared
+    tol = constants.CACHE_PRECISION * max(scale_sq, 1.0)
+    if scale_sq > tol and abs(c1.length_squared - scale_sq) < tol and abs(c2.length_squared - scale_sq) < tol and \
+       abs(c0.dot(c1)) < tol and abs(c0.dot(c2)) < tol and abs(c1.dot(c2)) < tol:
+        inv_rot_scale = rot_scale.transposed() * (1.0 / scale_sq)
+        inv = inv_rot_scale.to_4x4()
+        inv.translation = -(inv_rot_scale @ mw.translation)
+    else:
+        inv = mw.inverted_safe()
+
+    _last_parent_inverse = (parent_obj.name, mw.copy(), inv)
+    return inv.copy()
+
+# Names of all Bounds objects and their descendants, rebuilt lazily after depsgraph updates.
+_sdf_hierarchy_cache: set[str] | None = None
+
+# (scene name, names of sources whose Bounds has sdf_show_source_empties on) for the draw callback.
+# Shares invalidation with _sdf_hierarchy_cache, so toggling the setting or reparenting rebuilds it.
+_overlay_sources_cache: tuple[str, tuple[str, ...]] | None = None
+
+# (object pointer, result) of the last is_sdf_source_or_group() call, hit repeatedly by operator
+# polls while the same object stays active
+_source_or_group_poll_cache = (0, False)
+
+def invalidate_sdf_hierarchy_cache():
+    global _sdf_hierarchy_cache, _overlay_sources_cache, _source_or_group_poll_cache
+    _sdf_hierarchy_cache = None
+    _overlay_sources_cache = None
+    _source_or_group_poll_cache = (0, False)
+
+def is_sdf_source_or_group(obj: bpy.types.Object) -> bool:
+    """ Cached is_sdf_source(obj) or is_sdf_group(obj) for poll() methods. """
+    global _source_or_group_poll_cache
+    if not obj: return False
+    pointer = obj.as_pointer()
+    if _source_or_group_poll_cache[0] != pointer:
+        _source_or_group_poll_cache = (pointer, bool(is_sdf_source(obj) or is_sdf_group(obj)))
+    return _source_or_group_poll_cache[1]
+
+def get_overlay_source_names(scene: bpy.types.Scene) -> tuple[str, ...]:
+    """
+    Returns names of SDF sources in scene whose root Bounds shows source visuals.
+    Empty when no Bounds has the overlay enabled, letting the draw callback skip the scene scan.
+    """
+    global _overlay_sources_cache
+    if _overlay_sources_cache is None or _overlay_sources_cache[0] != scene.name:
+        names = []
+        for bounds_obj in scene.objects:
+            if not bounds_obj.get(constants.SDF_BOUNDS_MARKER, False): continue
+            if not get_bounds_setting(bounds_obj, "sdf_show_source_empties"): continue
+            for child in bounds_obj.children_recursive:
+                if is_sdf_source(child) and find_parent_bounds(child) == bounds_obj:
+                    names.append(child.name)
+        _overlay_sources_cache = (scene.name, tuple(names))
+    return _overlay_sources_cache[1]
+
+def is_in_sdf_hierarchy(obj: bpy.types.Object) -> bool:
+    """
+    Set-membership equivalent of find_parent_bounds(obj) is not None, meant for poll()
+    and menu draw code that runs on every UI redraw.
+    """
+    global _sdf_hierarchy_cache
+    if not obj:
+        return False
+    if _sdf_hierarchy_cache is None:
+        names = set()
+        for bounds_obj in bpy.data.objects:
+            if bounds_obj.get(constants.SDF_BOUNDS_MARKER, False) and bounds_obj.name not in names:
+                names.add(bounds_obj.name)
+                names.update(child.name for child in bounds_obj.children_recursive)
+        _sdf_hierarchy_cache = names
+    return obj.name in _sdf_hierarchy_cache
+
 def is_sdf_bounds(obj: bpy.types.Object) -> bool:
     """ Checks if an object is configured as an SDF Bounds Empty """
     return obj and obj.type == 'EMPTY' and obj.get(constants.SDF_BOUNDS_MARKER, False)
@@ -126,6 +272,16 @@ def get_sdf_param(obj: bpy.types.Object, param_key: str, default_value):
         return default_value
     return effective_obj.get(param_key, default_value)
 
+def get_sdf_params(obj: bpy.types.Object) -> dict:
+    """
+    Snapshot of all custom properties of obj's effective (link-resolved) object.
+    Read with .get(key, default) like get_sdf_param, without resolving the link per key.
+    """
+    effective_obj = get_effective_sdf_object(obj)
+    if not effective_obj:
+        return {}
+    return dict(effective_obj.items())
+
 def is_sdf_linked(obj: bpy.types.Object) -> bool:
     if not obj: return False
     link_target_name = obj.get(constants.SDF_LINK_TARGET_NAME_PROP, "")
@@ -146,11 +302,8 @@ def get_bounds_setting(bounds_obj: bpy.types.Object, setting_key: str):
     return get_sdf_param(bounds_obj, setting_key, constants.DEFAULT_SETTINGS.get(setting_key))
 
 def initiate_settings(obj, defaults):
-    for key, default_value in defaults.items():
-        try:
-            obj[key] = default_value
-        except TypeError as e:
-            print(f"FieldForge WARN: Could not set default property '{key}' on {obj.name}: {e}. Value: {default_value}")
+    """ Applies a (validated, see constants) defaults dict as custom properties in one bulk update. """
+    obj.id_properties_ensure().update(defaults)
 
 def compare_matrices(mat1: Matrix | None, mat2: Matrix | None, tolerance=constants.CACHE_PRECISION) -> bool:
     """ Compare two 4x4 matrices element-wise with a tolerance for floats. """
@@ -159,10 +312,15 @@ def compare_matrices(mat1: Matrix | None, mat2: Matrix | None, tolerance=constan
     # Ensure they are Matrix objects (basic type check)
     if not isinstance(mat1, Matrix) or not isinstance(mat2, Matrix):
         return False
-    # Compare elements
-    for i in range(4):
-        for j in range(4):
-            if abs(mat1[i][j] - mat2[i][j]) > tolerance:
+    # Unchanged matrices compare equal exactly; mathutils does that in C without per-element lookups
+    if mat1 == mat2:
+        return True
+    # One C-level subtraction, then an early-exit scan of the differences
+    try: diff = mat1 - mat2
+    except ValueError: return False # Mismatched dimensions
+    for row in diff:
+        for d in row:
+            if abs(d) > tolerance:
                 return False
     return True
 
@@ -174,8 +332,10 @@ def compare_vectors(vec1: Vector | None, vec2: Vector | None, tolerance=constant
         return False
     if len(vec1) != len(vec2):
         return False
-    for i in range(len(vec1)):
-        if abs(vec1[i] - vec2[i]) > tolerance:
+    if vec1 == vec2:
+        return True
+    for a, b in zip(vec1, vec2):
+        if abs(a - b) > tolerance:
             return False
     return True
 
@@ -184,12 +344,17 @@ def compare_dicts(dict1: dict | None, dict2: dict | None, tolerance=constants.CA
     Compare dictionaries (shallow), checking floats, vectors, matrices
     with tolerance. Handles basic types (int, str, bool) directly.
     """
+    if dict1 is dict2:
+        return True
     if dict1 is None or dict2 is None:
-        return dict1 is dict2
+        return False
     if not isinstance(dict1, dict) or not isinstance(dict2, dict):
         return False # Ensure both are dicts
-    if set(dict1.keys()) != set(dict2.keys()):
+    if len(dict1) != len(dict2) or dict1.keys() != dict2.keys():
         return False # Different keys
+    # Exactly equal values (the usual case between updates) need no per-key tolerance dispatch
+    if dict1 == dict2:
+        return True
 
     for key, val1 in dict1.items():
         val2 = dict2.get(key)
@@ -210,71 +375,88 @@ def compare_dicts(dict1: dict | None, dict2: dict | None, tolerance=constants.CA
 
 # --- Drawing Helpers ---
 
+@lru_cache(maxsize=32)
+def _circle_trig_table(segments: int) -> tuple[tuple[float, float], ...]:
+    """ (cos, sin) of each of `segments` evenly spaced angles, starting at 0. """
+    return tuple((math.cos(a), math.sin(a)) for a in [(i / segments) * 2 * math.pi for i in range(segments)])
+
 def create_circle_vertices(center: Vector, right: Vector, up: Vector, radius: float, segments: int) -> list[Vector]:
     """ Generates world-space vertices for a circle defined by center, orthogonal axes, radius, and segments. """
     if segments < 3: return []
-    vertices = []
     if radius <= 1e-6: return [center.copy() for _ in range(segments)] if segments > 0 else []
     try:
-        for i in range(segments):
-            angle = (i / segments) * 2 * math.pi
-            offset = (right * math.cos(angle) + up * math.sin(angle)) * radius
-            vertices.append(center + offset)
+        # Scale the axes once; each vertex is then two scalar multiplies from the cached table
+        right_r = right * radius; up_r = up * radius
+        return [center + right_r * c + up_r * s for c, s in _circle_trig_table(segments)]
     except Exception: return []
-    return vertices
 
 def create_rectangle_vertices(center: Vector, right: Vector, up: Vector, width: float, height: float) -> list[Vector]:
     half_w = max(0.0, width / 2.0); half_h = max(0.0, height / 2.0)
     tr_offset = (right * half_w) + (up * half_h); tl_offset = (-right * half_w) + (up * half_h)
     return [center + tr_offset, center + tl_offset, center - tr_offset, center - tl_offset]
 
-def create_unit_circle_vertices_xy(segments: int) -> list[tuple[float, float, float]]:
-    if segments < 3: return []
-    vertices = []; radius = 0.5
-    for i in range(segments):
-        angle = (i / segments) * 2 * math.pi
-        vertices.append( (math.cos(angle) * radius, math.sin(angle) * radius, 0.0) )
-    return vertices
+# Unit primitive outlines are pure functions of their (hashable) arguments, so the draw callback
+# gets shared, immutable tuples from these caches instead of regenerating them every redraw.
 
-def create_unit_polygon_vertices_xy(segments: int) -> list[tuple[float, float, float]]:
-    if segments < 3: return []
+@lru_cache(maxsize=32)
+def create_unit_circle_vertices_xy(segments: int) -> tuple[tuple[float, float, float], ...]:
+    if segments < 3: return ()
+    radius = 0.5
+    return tuple((c * radius, s * radius, 0.0) for c, s in _circle_trig_table(segments))
+
+@lru_cache(maxsize=32)
+def create_unit_polygon_vertices_xy(segments: int) -> tuple[tuple[float, float, float], ...]:
+    if segments < 3: return ()
     vertices = []; radius = 0.5; angle_offset = -math.pi / 2.0 
     if segments % 2 == 0: angle_offset += (math.pi / segments) 
     for i in range(segments):
         angle = angle_offset + (i / segments) * 2 * math.pi
         vertices.append( (math.cos(angle) * radius, math.sin(angle) * radius, 0.0) )
-    return vertices
+    return tuple(vertices)
 
-def create_unit_cylinder_cap_vertices(segments: int) -> tuple[list, list]:
+@lru_cache(maxsize=32)
+def create_unit_cylinder_cap_vertices(segments: int) -> tuple[tuple, tuple]:
     top_verts = []; bot_verts = []; radius = 0.5; half_height = 0.5
     if segments >= 3:
         for i in range(segments):
             angle = (i / segments) * 2 * math.pi
             x = math.cos(angle) * radius; y = math.sin(angle) * radius
             top_verts.append( (x, y, half_height) ); bot_verts.append( (x, y, -half_height) )
-    return top_verts, bot_verts
+    return tuple(top_verts), tuple(bot_verts)
 
-def create_unit_rounded_rectangle_plane(local_right: Vector, local_up: Vector, draw_radius: float, segments_per_corner: int) -> list[Vector]:
+def create_unit_rounded_rectangle_plane(local_right: Vector, local_up: Vector, draw_radius: float, segments_per_corner: int) -> tuple[tuple[float, float, float], ...]:
     """
-    Generates local vertices (Vectors) for a unit rounded rectangle (-0.5 to 0.5)
+    Generates local vertices for a unit rounded rectangle (-0.5 to 0.5)
     centered at origin, in the plane defined by local_right/up.
     draw_radius is the calculated internal radius for drawing (expected 0.0 to 0.5).
+    Returns cached tuples; wrap in Vector() where vector math is needed.
     """
+    return _unit_rounded_rectangle_plane(tuple(local_right), tuple(local_up), float(draw_radius), int(segments_per_corner))
+
+@lru_cache(maxsize=32)
+def _unit_rounded_rectangle_plane(right: tuple, up: tuple, draw_radius: float, segments_per_corner: int) -> tuple:
+    local_right = Vector(right); local_up = Vector(up)
     half_w, half_h = 0.5, 0.5; center = Vector((0.0, 0.0, 0.0))
     effective_corner_radius = min(max(0.0, draw_radius), min(half_w, half_h) - 1e-4)
     if effective_corner_radius <= 1e-5:
         tr = center+(local_right*half_w)+(local_up*half_h); tl=center+(-local_right*half_w)+(local_up*half_h)
-        return [tr,tl,center-tr,center-tl] # TR,TL,BL,BR (BL = -tr, BR = -tl)
+        return tuple(tuple(v) for v in (tr,tl,center-tr,center-tl)) # TR,TL,BL,BR (BL = -tr, BR = -tl)
     if segments_per_corner < 1: segments_per_corner = 1
     inner_w=half_w-effective_corner_radius; inner_h=half_h-effective_corner_radius
     c_tr=center+(local_right*inner_w)+(local_up*inner_h); c_tl=center+(-local_right*inner_w)+(local_up*inner_h)
     c_bl=center+(-local_right*inner_w)-(local_up*inner_h); c_br=center+(local_right*inner_w)-(local_up*inner_h)
-    vertices = []; delta_angle = (math.pi/2.0)/segments_per_corner
-    for i in range(segments_per_corner+1): angle=i*delta_angle; off=(local_right*math.cos(angle)+local_up*math.sin(angle))*effective_corner_radius; vertices.append(c_tr+off)
-    for i in range(1,segments_per_corner+1): angle=(math.pi/2.0)+(i*delta_angle); off=(local_right*math.cos(angle)+local_up*math.sin(angle))*effective_corner_radius; vertices.append(c_tl+off)
-    for i in range(1,segments_per_corner+1): angle=math.pi+(i*delta_angle); off=(local_right*math.cos(angle)+local_up*math.sin(angle))*effective_corner_radius; vertices.append(c_bl+off)
-    for i in range(1,segments_per_corner+1): angle=(3*math.pi/2.0)+(i*delta_angle); off=(local_right*math.cos(angle)+local_up*math.sin(angle))*effective_corner_radius; vertices.append(c_br+off)
-    return vertices
+    # One quarter-circle cos/sin table; the other corners are its 90/180/270 degree rotations
+    delta_angle = (math.pi/2.0)/segments_per_corner
+    quarter = [(math.cos(i*delta_angle)*effective_corner_radius, math.sin(i*delta_angle)*effective_corner_radius) for i in range(segments_per_corner+1)]
+    right_x, right_y, right_z = local_right; up_x, up_y, up_z = local_up
+    vertices = []
+    for corner, rot, start in ((c_tr, lambda c, s: (c, s), 0), (c_tl, lambda c, s: (-s, c), 1),
+                               (c_bl, lambda c, s: (-c, -s), 1), (c_br, lambda c, s: (s, -c), 1)):
+        cx, cy, cz = corner
+        for c, s in quarter[start:]:
+            a, b = rot(c, s)
+            vertices.append((cx + right_x*a + up_x*b, cy + right_y*a + up_y*b, cz + right_z*a + up_z*b))
+    return tuple(vertices)
 
 # --- Selection Helpers ---
 
@@ -289,6 +471,10 @@ def dist_point_to_segment_2d(p: tuple[float, float], a: tuple[float, float], b:
     else: closest = a_v + t * line_vec
     return (p_v - closest).length
 
+# Flags that turn a view3d.select click into something other than a plain select
+_SELECT_FLAG_NAMES = ('extend', 'deselect_all', 'toggle', 'center', 'enumerate')
+_get_select_flags = operator.attrgetter(*_SELECT_FLAG_NAMES)
+
 def get_blender_select_mouse() -> str:
     """
     Checks the user's keymap for the primary 3D View object selection button (simple click).
@@ -302,24 +488,31 @@ def get_blender_select_mouse() -> str:
         if not kc: return default_button
         km = kc.keymaps.get('3D View')
         if not km: return default_button
+        # One pass: stop at the first strict match, remembering the first modifier-free one as fallback
+        relaxed_button = None
         for kmi in km.keymap_items:
-            if kmi.idname=='view3d.select' and kmi.value=='PRESS' and kmi.type in {'LEFTMOUSE','RIGHTMOUSE'}:
-                props=kmi.properties
-                is_strict=(not getattr(props,'extend',False) and not getattr(props,'deselect_all',False) and \
-                           not getattr(props,'toggle',False) and not getattr(props,'center',False) and \
-                           not getattr(props,'enumerate',False) and \
-                           not kmi.shift and not kmi.ctrl and not kmi.alt and not kmi.oskey)
-                if is_strict: found_button=kmi.type; break
-        if not found_button:
-             for kmi in km.keymap_items:
-                 if kmi.idname=='view3d.select' and kmi.value=='PRESS' and \
-                    kmi.type in {'LEFTMOUSE','RIGHTMOUSE'} and \
-                    not kmi.shift and not kmi.ctrl and not kmi.alt and not kmi.oskey:
-                     found_button=kmi.type; break
+            if kmi.idname!='view3d.select' or kmi.value!='PRESS': continue
+            kmi_type = kmi.type
+            if kmi_type not in {'LEFTMOUSE','RIGHTMOUSE'} or kmi.shift or kmi.ctrl or kmi.alt or kmi.oskey: continue
+            props=kmi.properties
+            try: select_flags = _get_select_flags(props)
+            except AttributeError: select_flags = tuple(getattr(props, name, False) for name in _SELECT_FLAG_NAMES)
+            if not any(select_flags):
+                found_button=kmi_type; break
+            if relaxed_button is None: relaxed_button = kmi_type
+        if not found_button: found_button = relaxed_button
         if found_button: return found_button
     except Exception: pass 
     return default_button 
 
+def select_only(context: bpy.types.Context, obj: bpy.types.Object):
+    """ Makes obj the only selected object and the active one, touching only objects that are actually selected. """
+    view_layer = context.view_layer
+    for sel_obj in tuple(view_layer.objects.selected):
+        if sel_obj != obj: sel_obj.select_set(False)
+    obj.select_set(True)
+    view_layer.objects.active = obj
+
 def find_and_set_new_active(context: bpy.types.Context, just_deselected_obj: bpy.types.Object):
     if not hasattr(context, 'view_layer') or context.view_layer.objects.active != just_deselected_obj: return
     selected_objects = context.selected_objects 
@@ -442,9 +635,10 @@ def normalize_sibling_order_and_names(parent_obj: bpy.types.Object):
         for old_name_log, actual_new_name_log in renamed_info:
             update_linkers_globally(context, old_name_log, actual_new_name_log)
 
-    if hasattr(context, 'screen') and context.screen:
-        for area in context.screen.areas:
-            if area.type == 'OUTLINER': area.tag_redraw(); break
+        # Only renames change what the Outliner shows
+        if hasattr(context, 'screen') and context.screen:
+            for area in context.screen.areas:
+                if area.type == 'OUTLINER': area.tag_redraw(); break
 
 # --- Node Helpers ---
 def get_sock(node, identifier, is_input=True):